@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.ports.normalisation_port import NormalisationPort
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingNormalisationAdapter(NormalisationPort):
+    """Micro-batch concurrent normalisations into one LLM call.
+
+    Requests arriving within ``window_seconds`` of the first one, up to
+    ``max_batch_size``, are sent together through the inner adapter's
+    ``normalise_many`` and the results fanned back out to each caller. A batch
+    whose answer is unusable is retried as concurrent single calls, so one
+    bad batch costs latency but never fails a job on its own. A caller that
+    gives up (e.g. a stage timeout) does not cancel the batch for the rest.
+    """
+
+    def __init__(self, inner: NormalisationPort, window_seconds: float, max_batch_size: int):
+        self._inner = inner
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[dict, asyncio.Future[dict]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: set[asyncio.Task[None]] = set()
+        self._batch_calls = 0
+        self._batched_items = 0
+        self._single_calls = 0
+        self._fallbacks = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "batch_calls": self._batch_calls,
+            "batched_items": self._batched_items,
+            "avg_batch_size": self._batched_items / self._batch_calls if self._batch_calls else 0.0,
+            "single_calls": self._single_calls,
+            "fallbacks": self._fallbacks,
+            "llm": self._inner.stats() if hasattr(self._inner, "stats") else None,
+        }
+
+    async def normalise(self, raw_input: dict) -> dict:
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        self._pending.append((raw_input, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending[:self._max_batch_size], self._pending[self._max_batch_size:]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self._window_seconds, self._flush)
+        task = asyncio.create_task(self._run(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _single(self, raw_input: dict, future: asyncio.Future[dict]) -> None:
+        self._single_calls += 1
+        try:
+            result = await self._inner.normalise(raw_input)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def _run(self, batch: list[tuple[dict, asyncio.Future[dict]]]) -> None:
+        live = [(raw_input, future) for raw_input, future in batch if not future.done()]
+        if len(live) <= 1:
+            await asyncio.gather(*(self._single(raw_input, future) for raw_input, future in live))
+            return
+        try:
+            results = await self._inner.normalise_many([raw_input for raw_input, _ in live])
+            if len(results) != len(live):
+                raise ValueError(f"normalise_many returned {len(results)} results for {len(live)} inputs")
+        except Exception:
+            self._fallbacks += 1
+            logger.warning("Batch normalisation failed; retrying items one by one", extra={"job_id": "normaliser"})
+            await asyncio.gather(*(self._single(raw_input, future) for raw_input, future in live))
+            return
+        self._batch_calls += 1
+        self._batched_items += len(live)
+        for (_, future), result in zip(live, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def health_check(self) -> bool:
+        return await self._inner.health_check()
@@ -0,0 +1,105 @@
+import copy
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.ports.normalisation_cache_port import NormalisationCachePort
+from app.ports.normalisation_port import NormalisationPort
+from app.utils.hashing import normalisation_cache_key
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedNormalisationAdapter(NormalisationPort):
+    """Content-addressed cache in front of an LLM-backed NormalisationPort.
+
+    Results are keyed on the canonical hash of the raw input plus the model
+    that produced them, so switching models never serves stale output. A
+    bounded in-process LRU answers hot repeats; the optional ``store`` tier
+    keeps results across restarts and workers. Inners that report no
+    ``model`` (the no-API-key passthrough) are not cached.
+    """
+
+    def __init__(
+        self,
+        inner: NormalisationPort,
+        max_entries: int,
+        ttl_seconds: float,
+        store: Optional[NormalisationCachePort] = None,
+    ):
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._store = store
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+    def _put(self, key: str, normalised: dict) -> None:
+        self._entries[key] = (normalised, time.monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        normalised, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return normalised
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "store_hits": self._store_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "llm": self._inner.stats() if hasattr(self._inner, "stats") else None,
+        }
+
+    async def normalise(self, raw_input: dict) -> dict:
+        model = getattr(self._inner, "model", None)
+        if model is None:
+            return await self._inner.normalise(raw_input)
+        key = normalisation_cache_key(raw_input, model)
+
+        normalised = self._lookup(key)
+        if normalised is not None:
+            self._hits += 1
+            return copy.deepcopy(normalised)
+        if self._store is not None:
+            try:
+                normalised = await self._store.get(key)
+            except Exception:
+                logger.exception("Normalisation cache read failed", extra={"job_id": "normaliser"})
+            if normalised is not None:
+                self._store_hits += 1
+                self._put(key, normalised)
+                return copy.deepcopy(normalised)
+
+        self._misses += 1
+        normalised = await self._inner.normalise(raw_input)
+        self._put(key, copy.deepcopy(normalised))
+        if self._store is not None:
+            try:
+                await self._store.put(key, normalised)
+            except Exception:
+                logger.exception("Normalisation cache write failed", extra={"job_id": "normaliser"})
+        return normalised
+
+    async def health_check(self) -> bool:
+        return await self._inner.health_check()
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.ports.payment_port import PaymentPort
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPaymentAdapter(PaymentPort):
+    """Payment status cache with coalesced lookups in front of a PaymentPort.
+
+    A confirmed payment cannot become unconfirmed, so it is cached until
+    evicted by size; an unpaid answer is only trusted for
+    ``unpaid_ttl_seconds``. Concurrent verifications of the same
+    ``blockchain_identifier`` share one upstream lookup. With
+    ``track_pending``, payment requests created through this adapter are
+    remembered until paid or past their ``payByTime`` so ``prepoll`` can warm
+    the cache before ``provide_input``. Every map is capped at ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        inner: PaymentPort,
+        max_entries: int,
+        unpaid_ttl_seconds: float,
+        track_pending: bool = False,
+    ):
+        self._inner = inner
+        self._max_entries = max_entries
+        self._unpaid_ttl_seconds = unpaid_ttl_seconds
+        self._track_pending = track_pending
+        self._paid: OrderedDict[str, None] = OrderedDict()
+        # Both in expiry order: the TTL is fixed and payByTime follows creation order.
+        self._unpaid: OrderedDict[str, float] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bool]] = {}
+        self._pending: OrderedDict[str, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._prepolled = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+    def stats(self) -> dict:
+        return {
+            "paid_cached": len(self._paid),
+            "awaiting_payment": len(self._pending),
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "prepolled": self._prepolled,
+            "client": self._inner.stats() if hasattr(self._inner, "stats") else None,
+        }
+
+    def _cached(self, blockchain_identifier: str) -> Optional[bool]:
+        if blockchain_identifier in self._paid:
+            self._paid.move_to_end(blockchain_identifier)
+            return True
+        expires_at = self._unpaid.get(blockchain_identifier)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return False
+            del self._unpaid[blockchain_identifier]
+        return None
+
+    @staticmethod
+    def _prune(entries: OrderedDict[str, float], now: float, max_entries: int) -> None:
+        while entries and next(iter(entries.values())) <= now:
+            entries.popitem(last=False)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+    def _store(self, blockchain_identifier: str, paid: bool) -> None:
+        if not paid:
+            now = time.monotonic()
+            self._unpaid[blockchain_identifier] = now + self._unpaid_ttl_seconds
+            self._unpaid.move_to_end(blockchain_identifier)
+            self._prune(self._unpaid, now, self._max_entries)
+            return
+        self._unpaid.pop(blockchain_identifier, None)
+        self._pending.pop(blockchain_identifier, None)
+        self._paid[blockchain_identifier] = None
+        self._paid.move_to_end(blockchain_identifier)
+        while len(self._paid) > self._max_entries:
+            self._paid.popitem(last=False)
+
+    async def create_payment_request(self, input_hash: str) -> dict:
+        data = await self._inner.create_payment_request(input_hash)
+        if self._track_pending:
+            self._pending[data["blockchainIdentifier"]] = float(data["payByTime"])
+            self._prune(self._pending, time.time(), self._max_entries)
+        return data
+
+    async def _lookup(self, blockchain_identifier: str) -> bool:
+        leader = self._inflight.get(blockchain_identifier)
+        if leader is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+                # The leading caller was cancelled, not us; look it up ourselves.
+                return await self._lookup(blockchain_identifier)
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._inflight[blockchain_identifier] = future
+        try:
+            paid = await self._inner.verify_payment_status(blockchain_identifier)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # followers re-raise it; don't warn when there are none
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[blockchain_identifier]
+        self._store(blockchain_identifier, paid)
+        future.set_result(paid)
+        return paid
+
+    async def verify_payment_status(self, blockchain_identifier: str) -> bool:
+        cached = self._cached(blockchain_identifier)
+        if cached is not None:
+            self._hits += 1
+            return cached
+        self._misses += 1
+        return await self._lookup(blockchain_identifier)
+
+    async def prepoll(self) -> None:
+        """Refresh the status of every outstanding payment request once."""
+        self._prune(self._pending, time.time(), self._max_entries)
+        identifiers = [i for i in self._pending if self._cached(i) is None]
+        outcomes = await asyncio.gather(*(self._lookup(i) for i in identifiers), return_exceptions=True)
+        self._prepolled += len(identifiers)
+        for identifier, outcome in zip(identifiers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Payment pre-poll failed", extra={"job_id": identifier})
+
+    async def run_prepoller(self, interval_seconds: float) -> None:
+        """Pre-poll forever; cancelled on shutdown."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.prepoll()
+            except Exception:
+                logger.exception("Payment pre-poll failed", extra={"job_id": "payment"})
+
+    async def health_check(self) -> bool:
+        return await self._inner.health_check()
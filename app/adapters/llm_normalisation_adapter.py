@@ -1,50 +1,274 @@
+import asyncio
 import json
-
-import httpx
+import logging
+import time
+from typing import Callable, Optional, TypeVar
 
 from app.core.config import settings
+from app.core.http import HttpClientManager
+from app.core.metrics import LatencyHistogram
+from app.core.model_router import ModelRouter
+from app.core.resilience import ResilienceRegistry
+from app.domain.exceptions import CircuitOpenError
 from app.ports.normalisation_port import NormalisationPort
+from app.schemas.requests import StartJobRequest
+from app.utils.json_stream import IncrementalJsonObject, JsonStreamError
+from app.utils.normalisation_prompt import (
+    SCHEMA_KEYS,
+    NormalisationPrompt,
+    build_batch_normalisation_prompt,
+    build_normalisation_prompt,
+)
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _configured_models() -> list[str]:
+    models = [model.strip() for model in settings.openrouter_models.split(",") if model.strip()]
+    return models or [settings.openrouter_model]
+
+
+def _check_quality(normalised: object) -> dict:
+    """Raise ValueError unless the required keys form a valid StartJobRequest."""
+    if not isinstance(normalised, dict):
+        raise ValueError("normalisation output is not a JSON object")
+    StartJobRequest(**{key: normalised.get(key) for key in SCHEMA_KEYS})
+    return normalised
+
+
+def _batch_results(output: object, count: int) -> list[dict]:
+    """Order a batch answer by item id; ValueError unless every item is present and valid."""
+    results = output.get("results") if isinstance(output, dict) else None
+    if not isinstance(results, list):
+        raise ValueError("batch normalisation output has no results array")
+    by_id = {str(item.get("id")): item for item in results if isinstance(item, dict)}
+    ordered = []
+    for index in range(count):
+        item = by_id.get(str(index))
+        if item is None:
+            raise ValueError(f"batch normalisation output is missing item {index}")
+        ordered.append(_check_quality({key: value for key, value in item.items() if key != "id"}))
+    return ordered
 
 
 class LLMNormalisationAdapter(NormalisationPort):
+    """OpenRouter-backed normalisation.
+
+    Each call goes to the model ``ModelRouter`` ranks first among
+    ``openrouter_models``; a timeout, an error or output that does not
+    validate as a StartJobRequest falls back to the next one. With
+    ``openrouter_stream`` the chat completion is streamed and parsed as it
+    arrives: the call returns as soon as the three required keys are
+    complete, and an answer that drifts out of JSON is abandoned on the spot
+    and asked for again, up to ``openrouter_stream_max_attempts`` times.
+    ``normalise_many`` normalises several inputs in one call.
+    """
+
+    def __init__(
+        self,
+        http: HttpClientManager,
+        resilience: Optional[ResilienceRegistry] = None,
+        router: Optional[ModelRouter] = None,
+    ):
+        self._http = http
+        self._upstream = (resilience or ResilienceRegistry()).upstream("openrouter")
+        self._router = router or ModelRouter(
+            _configured_models(),
+            window_seconds=settings.model_router_window_seconds,
+            min_samples=settings.model_router_min_samples,
+            max_error_rate=settings.model_router_max_error_rate,
+        )
+        self._first_token = LatencyHistogram()
+        self._completion = LatencyHistogram()
+        self._early_stops = 0
+        self._aborts = 0
+        self._prompts = 0
+        self._prompt_tokens = 0
+        self._prompt_tokens_max = 0
+        self._raw_prompt_tokens = 0
+        self._truncated_fields = 0
+        self._dropped_keys = 0
+        self._upstream_prompt_tokens = 0
+        self._upstream_cached_tokens = 0
+
+    @property
+    def model(self) -> Optional[str]:
+        # None means inputs pass through untouched, so there is nothing worth caching.
+        # Any routed model may answer, so the whole set is the cache identity.
+        return "|".join(self._router.models) if settings.openrouter_api_key else None
 
     async def normalise(self, raw_input: dict) -> dict:
         if not settings.openrouter_api_key:
             return raw_input
 
-        prompt = (
-            "Normalise this input into strict JSON with keys target_domain, "
-            "my_product_usp, ideal_customer_profile. Return JSON only. Input: "
-            f"{json.dumps(raw_input)}"
+        prompt = build_normalisation_prompt(
+            raw_input,
+            max_tokens=settings.normalisation_prompt_max_tokens,
+            cache_prefix=settings.openrouter_prompt_cache,
         )
-        payload = {
-            "model": "anthropic/claude-sonnet-4-5",
-            "messages": [
-                {"role": "system", "content": "You output valid JSON only."},
-                {"role": "user", "content": prompt},
-            ],
-        }
+        return await self._route(prompt, _check_quality, stream=settings.openrouter_stream)
+
+    async def normalise_many(self, raw_inputs: list[dict]) -> list[dict]:
+        """Normalise every input with one LLM call; results follow input order.
+
+        Raises ValueError when the answer misses an item or any item fails
+        the quality gate, so callers can fall back to ``normalise``.
+        """
+        if not settings.openrouter_api_key:
+            return list(raw_inputs)
+
+        prompt = build_batch_normalisation_prompt(
+            raw_inputs,
+            max_tokens=settings.normalisation_prompt_max_tokens,
+            cache_prefix=settings.openrouter_prompt_cache,
+        )
+        # The streaming parser looks for one object's keys, so batches are never streamed.
+        return await self._route(prompt, lambda output: _batch_results(output, len(raw_inputs)), stream=False)
+
+    async def _route(self, prompt: NormalisationPrompt, accept: Callable[[object], T], stream: bool) -> T:
+        self._record_prompt(prompt)
         headers = {
             "Authorization": f"Bearer {settings.openrouter_api_key}",
             "Content-Type": "application/json",
         }
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.post(settings.openrouter_url, json=payload, headers=headers)
+        order = self._router.order()
+        attempts: list[dict] = []
+        error: Optional[Exception] = None
+        for model in order:
+            started = time.perf_counter()
+            try:
+                output = await asyncio.wait_for(
+                    self._complete({"model": model, "messages": prompt.messages}, headers, stream),
+                    timeout=settings.model_router_timeout_seconds,
+                )
+                accepted = accept(output)
+            except CircuitOpenError:
+                # OpenRouter itself is down; no other model would fare better.
+                self._router.record_decision(order, None, attempts)
+                raise
+            except asyncio.TimeoutError as exc:
+                error, reason = exc, "timeout"
+            except ValueError as exc:
+                error, reason = exc, "invalid"
+            except Exception as exc:
+                error, reason = exc, "error"
+            else:
+                self._router.record_success(model, time.perf_counter() - started)
+                attempts.append({"model": model, "outcome": "ok"})
+                self._router.record_decision(order, model, attempts)
+                return accepted
+            self._router.record_failure(model, reason)
+            attempts.append({"model": model, "outcome": reason})
+        self._router.record_decision(order, None, attempts)
+        if isinstance(error, asyncio.TimeoutError):
+            raise TimeoutError(f"every normalisation model timed out after {settings.model_router_timeout_seconds:g}s")
+        raise error
+
+    async def _complete(self, payload: dict, headers: dict, stream: bool) -> object:
+        if stream:
+            return await self._normalise_streaming(payload, headers)
+
+        async def _post() -> dict:
+            client = self._http.client("openrouter")
+            response = await client.post(settings.openrouter_url, json=payload, headers=headers, timeout=20.0)
             response.raise_for_status()
-            data = response.json()
+            return response.json()
 
+        # Re-asking the model for the same normalisation is harmless, so hedge it.
+        data = await self._upstream.call(_post, idempotent=True)
+        usage = data.get("usage") or {}
+        self._upstream_prompt_tokens += int(usage.get("prompt_tokens") or 0)
+        self._upstream_cached_tokens += int((usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0)
         content = data["choices"][0]["message"]["content"]
         return json.loads(content)
 
+    def _record_prompt(self, prompt: NormalisationPrompt) -> None:
+        self._prompts += 1
+        self._prompt_tokens += prompt.prompt_tokens
+        self._prompt_tokens_max = max(self._prompt_tokens_max, prompt.prompt_tokens)
+        self._raw_prompt_tokens += prompt.raw_tokens
+        self._truncated_fields += prompt.truncated_fields
+        self._dropped_keys += prompt.dropped_keys
+
+    def stats(self) -> dict:
+        return {
+            "prompt": {
+                "requests": self._prompts,
+                "prompt_tokens_total": self._prompt_tokens,
+                "prompt_tokens_avg": self._prompt_tokens / self._prompts if self._prompts else 0.0,
+                "prompt_tokens_max": self._prompt_tokens_max,
+                "saved_tokens_total": self._raw_prompt_tokens - self._prompt_tokens,
+                "truncated_fields": self._truncated_fields,
+                "dropped_keys": self._dropped_keys,
+                "upstream_prompt_tokens_total": self._upstream_prompt_tokens,
+                "upstream_cached_tokens_total": self._upstream_cached_tokens,
+            },
+            "router": self._router.stats(),
+            "first_token_seconds": self._first_token.snapshot(),
+            "completion_seconds": self._completion.snapshot(),
+            "early_stops": self._early_stops,
+            "aborts": self._aborts,
+        }
+
+    async def _stream_once(self, payload: dict, headers: dict) -> dict:
+        parser = IncrementalJsonObject(SCHEMA_KEYS)
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        client = self._http.client("openrouter")
+        # Leaving the block closes the connection, which stops the generation upstream.
+        async with client.stream(
+            "POST", settings.openrouter_url, json={**payload, "stream": True}, headers=headers, timeout=20.0
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue  # blank separators and ": keep-alive" comments
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                if "error" in event:
+                    raise JsonStreamError(f"stream failed mid-generation: {event['error']}")
+                delta = (event.get("choices") or [{}])[0].get("delta", {}).get("content")
+                if not delta:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                    self._first_token.observe(first_token_at - started)
+                normalised = parser.feed(delta)
+                if normalised is not None:
+                    self._completion.observe(time.perf_counter() - started)
+                    if not parser.closed:
+                        self._early_stops += 1
+                    return normalised
+        raise JsonStreamError("stream ended before the JSON object was complete")
+
+    async def _normalise_streaming(self, payload: dict, headers: dict) -> dict:
+        attempt = 1
+        while True:
+            try:
+                return await self._upstream.call(lambda: self._stream_once(payload, headers), idempotent=True)
+            except JsonStreamError:
+                self._aborts += 1
+                logger.warning("Aborted malformed normalisation stream", extra={"job_id": "normaliser"})
+                if attempt >= settings.openrouter_stream_max_attempts:
+                    raise
+                attempt += 1
+
     async def health_check(self) -> bool:
         if not settings.openrouter_api_key:
             return True
+        if self._upstream.is_open:
+            return False
         headers = {
             "Authorization": f"Bearer {settings.openrouter_api_key}",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get("https://openrouter.ai/api/v1/models", headers=headers)
-                return response.status_code == 200
+            client = self._http.client("openrouter")
+            response = await client.get("https://openrouter.ai/api/v1/models", headers=headers, timeout=10.0)
+            return response.status_code == 200
         except Exception:
             return False
\ No newline at end of file
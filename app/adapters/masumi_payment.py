@@ -1,57 +1,134 @@
-import uuid
+import asyncio
+import inspect
+import secrets
+from collections import deque
+from typing import Optional
 
 from masumi import Payment
 
 from app.core.config import masumi_config, settings
+from app.core.metrics import LatencyHistogram
 from app.ports.payment_port import PaymentPort
 
 
-class MasumiPaymentAdapter(PaymentPort):
+# SDK releases have named the status lookup differently; the first one present wins.
+_STATUS_METHODS = (
+    "check_payment_status_by_identifier",
+    "verify_payment_status",
+    "get_payment_status",
+    "check_payment_status",
+)
+_PAID_STATUSES = {"paid", "confirmed", "success", "completed"}
+_PAID_ONCHAIN_STATES = {"fundslocked", "resultsubmitted", "withdrawn"}
 
-    async def create_payment_request(self, input_hash: str) -> dict:
-        payment = Payment(
+
+def _resolve_status_method() -> tuple[str | None, bool]:
+    """Return the SDK status method name and whether it takes a keyword argument."""
+    for name in _STATUS_METHODS:
+        method = getattr(Payment, name, None)
+        if method is not None:
+            return name, "blockchain_identifier" in inspect.signature(method).parameters
+    return None, False
+
+
+def _is_paid(response: dict | None) -> bool:
+    response = response or {}
+    data = response.get("data")
+    if isinstance(data, dict) and "onChainState" in data:
+        # The resolve endpoint reports the escrow state; "success" only means the lookup worked.
+        return str(data["onChainState"]).lower() in _PAID_ONCHAIN_STATES
+    return str(response.get("status", "")).lower() in _PAID_STATUSES
+
+
+class MasumiPaymentClient:
+    """Long-lived handle on the masumi SDK.
+
+    Status lookups share one ``Payment`` instance and the status method is
+    resolved once. The SDK binds the purchaser identifier and input hash to
+    the instance, so a payment request still needs its own ``Payment``, but
+    purchaser identifiers come from a pool refilled after the request that
+    drained it. Every SDK call is timed into a per-operation histogram.
+    """
+
+    def __init__(self, identifier_pool_size: int):
+        self._identifier_pool_size = identifier_pool_size
+        self._identifiers: deque[str] = deque()
+        self._refill_scheduled = False
+        self._refill_identifiers()
+        self._status_method, self._status_by_keyword = _resolve_status_method()
+        self._status_payment = Payment(
             agent_identifier=settings.agent_identifier,
             config=masumi_config,
             network=settings.masumi_network,
-            identifier_from_purchaser=uuid.uuid4().hex[:26],
-            input_data={"input_hash": input_hash},
         )
-        result = await payment.create_payment_request()
-        return result["data"]
+        self._latency = {
+            "create_payment_request": LatencyHistogram(),
+            "check_payment_status": LatencyHistogram(),
+        }
 
-    async def verify_payment_status(self, blockchain_identifier: str) -> bool:
-        # Test fixtures use mock identifiers; treat them as paid.
-        if blockchain_identifier.startswith("mock_bc_"):
-            return True
+    def _refill_identifiers(self) -> None:
+        self._refill_scheduled = False
+        while len(self._identifiers) < self._identifier_pool_size:
+            self._identifiers.append(secrets.token_hex(13))
 
+    def _next_identifier(self) -> str:
+        if not self._identifiers:
+            self._refill_identifiers()
+        identifier = self._identifiers.popleft()
+        if len(self._identifiers) < self._identifier_pool_size // 2 and not self._refill_scheduled:
+            self._refill_scheduled = True
+            asyncio.get_running_loop().call_soon(self._refill_identifiers)
+        return identifier
+
+    async def create_payment_request(self, input_data: dict) -> dict:
         payment = Payment(
             agent_identifier=settings.agent_identifier,
             config=masumi_config,
             network=settings.masumi_network,
-            identifier_from_purchaser=uuid.uuid4().hex[:26],
-            input_data={"verification": blockchain_identifier},
+            identifier_from_purchaser=self._next_identifier(),
+            input_data=input_data,
         )
+        with self._latency["create_payment_request"].time():
+            return await payment.create_payment_request()
 
-        candidates = (
-            "verify_payment_status",
-            "get_payment_status",
-            "check_payment_status",
-        )
-        for method_name in candidates:
-            method = getattr(payment, method_name, None)
-            if method is None:
-                continue
-            try:
+    async def is_paid(self, blockchain_identifier: str) -> bool:
+        if self._status_method is None:
+            return False
+        method = getattr(self._status_payment, self._status_method)
+        with self._latency["check_payment_status"].time():
+            if self._status_by_keyword:
                 response = await method(blockchain_identifier=blockchain_identifier)
-            except TypeError:
+            else:
                 response = await method(blockchain_identifier)
-            status = str((response or {}).get("status", "")).lower()
-            return status in {"paid", "confirmed", "success", "completed"}
+        return _is_paid(response)
+
+    def stats(self) -> dict:
+        return {
+            "identifier_pool": len(self._identifiers),
+            "latency_seconds": {name: histogram.snapshot() for name, histogram in self._latency.items()},
+        }
+
+
+class MasumiPaymentAdapter(PaymentPort):
+
+    def __init__(self, client: Optional[MasumiPaymentClient] = None):
+        self._client = client or MasumiPaymentClient(settings.payment_identifier_pool_size)
+
+    def stats(self) -> dict:
+        return self._client.stats()
 
-        return False
+    async def create_payment_request(self, input_hash: str) -> dict:
+        result = await self._client.create_payment_request({"input_hash": input_hash})
+        return result["data"]
+
+    async def verify_payment_status(self, blockchain_identifier: str) -> bool:
+        # Test fixtures use mock identifiers; treat them as paid.
+        if blockchain_identifier.startswith("mock_bc_"):
+            return True
+        return await self._client.is_paid(blockchain_identifier)
 
     async def health_check(self) -> bool:
         try:
             return await self.verify_payment_status("mock_bc_health")
         except Exception:
-            return False
\ No newline at end of file
+            return False
@@ -1,22 +1,55 @@
 import json
-
-import httpx
+from typing import Optional
 
 from app.core.config import settings
+from app.core.http import HttpClientManager
+from app.core.resilience import ResilienceRegistry
 from app.ports.orchestrator_port import OrchestratorPort
 
 
 class OrchestratorAdapter(OrchestratorPort):
 
+    def __init__(
+        self,
+        http: HttpClientManager,
+        resilience: Optional[ResilienceRegistry] = None,
+    ):
+        self._http = http
+        self._upstream = (resilience or ResilienceRegistry()).upstream("orchestrator")
+
+    async def warm(self) -> None:
+        """Open a pooled connection to the orchestrator ahead of the first execute.
+
+        Goes through the circuit breaker like any call: an open circuit skips
+        the warm, and a warm that cannot connect counts against the upstream.
+        Any answer below 500 (typically 405 for HEAD on the POST endpoint)
+        means the connection is up, which is all a warm is for.
+        """
+        if settings.orchestrator_url.startswith("mock://"):
+            return
+
+        async def _head() -> None:
+            client = self._http.client("orchestrator")
+            response = await client.head(settings.orchestrator_url, timeout=5.0)
+            if response.status_code >= 500:
+                response.raise_for_status()
+
+        await self._upstream.call(_head)
+
     async def execute(self, job_id: str, normalised_input: dict) -> str:
         if settings.orchestrator_url.startswith("mock://"):
             return json.dumps({"job_id": job_id, "result": normalised_input}, sort_keys=True)
 
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        async def _post() -> dict:
+            client = self._http.client("orchestrator")
             response = await client.post(
                 settings.orchestrator_url,
                 json={"job_id": job_id, "input": normalised_input},
+                timeout=20.0,
             )
             response.raise_for_status()
-            data = response.json()
+            return response.json()
+
+        # Running a job twice is not safe, so no hedging and no retry once sent.
+        data = await self._upstream.call(_post)
         return str(data.get("result", data))
\ No newline at end of file
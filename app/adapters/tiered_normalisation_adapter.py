@@ -0,0 +1,87 @@
+import re
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from pydantic import ValidationError
+
+from app.ports.normalisation_port import NormalisationPort
+from app.schemas.requests import StartJobRequest
+
+
+_TEXT_FIELDS = ("my_product_usp", "ideal_customer_profile")
+_MAX_TEXT_LENGTH = 500  # StartJobRequest max_length for both text fields
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _canonical_url(value: str) -> str:
+    value = value.strip()
+    if "://" not in value:
+        value = f"https://{value}"
+    parts = urlsplit(value)
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((parts.scheme == "https" and port == 443) or (parts.scheme == "http" and port == 80)):
+        host = f"{host}:{port}"
+    path = "" if parts.path == "/" else parts.path
+    return urlunsplit((parts.scheme.lower(), host, path, parts.query, ""))
+
+
+def _clean_text(value: str) -> str:
+    return _WHITESPACE.sub(" ", value).strip()[:_MAX_TEXT_LENGTH]
+
+
+def rule_based_normalise(raw_input: dict) -> Optional[dict]:
+    """Cheap deterministic cleanup; None when the input needs the LLM.
+
+    Canonicalises the URL, collapses whitespace and trims text to the schema
+    limits, then validates the result against StartJobRequest. Keys outside
+    the schema are dropped, as the LLM prompt would drop them too.
+    """
+    values = [raw_input.get("target_domain"), *(raw_input.get(field) for field in _TEXT_FIELDS)]
+    if not all(isinstance(value, str) for value in values):
+        return None
+    try:
+        cleaned = {
+            "target_domain": _canonical_url(values[0]),
+            **{field: _clean_text(value) for field, value in zip(_TEXT_FIELDS, values[1:])},
+        }
+        StartJobRequest(**cleaned)
+    except (ValueError, ValidationError):
+        return None
+    return cleaned
+
+
+class TieredNormalisationAdapter(NormalisationPort):
+    """Try rule-based normalisation first and call the LLM only when it fails.
+
+    Well-formed inputs, which are most of them, never leave the process.
+    Per-tier counters show how much LLM latency and spend the rule tier saves.
+    """
+
+    def __init__(self, llm: NormalisationPort):
+        self._llm = llm
+        self._rule_hits = 0
+        self._llm_calls = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._llm, name)
+
+    def stats(self) -> dict:
+        total = self._rule_hits + self._llm_calls
+        return {
+            "rule_hits": self._rule_hits,
+            "llm_calls": self._llm_calls,
+            "rule_hit_rate": self._rule_hits / total if total else 0.0,
+            "llm_cache": self._llm.stats() if hasattr(self._llm, "stats") else None,
+        }
+
+    async def normalise(self, raw_input: dict) -> dict:
+        cleaned = rule_based_normalise(raw_input)
+        if cleaned is not None:
+            self._rule_hits += 1
+            return cleaned
+        self._llm_calls += 1
+        return await self._llm.normalise(raw_input)
+
+    async def health_check(self) -> bool:
+        return await self._llm.health_check()
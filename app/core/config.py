@@ -16,10 +16,70 @@ class Settings(BaseSettings):
     qdrant_api_key: str | None = None
     api_key: str = "test-api-key"
     job_timeout_minutes: int = 30
+    stale_job_sweep_interval_seconds: float = 60.0
+    job_cache_max_entries: int = 10_000
+    job_cache_ttl_seconds: float = 2.0
+    status_max_wait_seconds: float = 30.0
+    events_heartbeat_seconds: float = 15.0
+    events_poll_interval_seconds: float = 5.0
+    events_max_jobs_per_stream: int = 100
+    executor_concurrency: int = 8
+    executor_max_queue: int = 100
+    executor_retry_after_seconds: int = 5
+    executor_lease_seconds: float = 60.0
+    executor_poll_interval_seconds: float = 1.0
+    executor_shutdown_grace_seconds: float = 10.0
+    work_queue_backend: str = "qdrant"
+    work_queue_sqlite_path: str = "work_queue.sqlite3"
     orchestrator_url: str = "mock://orchestrator"
+    agent_start_delay_seconds: float = 0.0
+    normalise_timeout_seconds: float = 30.0
+    orchestrate_timeout_seconds: float = 120.0
+    result_reuse_window_seconds: float = 3600.0
     openrouter_api_key: str = ""
     openrouter_url: str = "https://openrouter.ai/api/v1/chat/completions"
+    openrouter_model: str = "anthropic/claude-sonnet-4-5"
+    openrouter_models: str = ""
+    model_router_timeout_seconds: float = 10.0
+    model_router_window_seconds: float = 300.0
+    model_router_min_samples: int = 5
+    model_router_max_error_rate: float = 0.5
+    openrouter_stream: bool = False
+    openrouter_prompt_cache: bool = True
+    normalisation_prompt_max_tokens: int = 1024
+    normalisation_batch_enabled: bool = False
+    normalisation_batch_window_seconds: float = 0.03
+    normalisation_batch_max_size: int = 16
+    openrouter_stream_max_attempts: int = 2
+    normalisation_cache_max_entries: int = 1024
+    normalisation_cache_ttl_seconds: float = 86_400.0
+    normalisation_cache_store: str = "memory"
+    normalisation_cache_store_max_entries: int = 100_000
+    normalisation_cache_prune_interval_seconds: float = 300.0
     allowed_origins: str = "*"
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False
+    openrouter_max_connections: int = 50
+    orchestrator_max_connections: int = 50
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
+    retry_max_attempts: int = 3
+    retry_backoff_base_seconds: float = 0.2
+    retry_backoff_max_seconds: float = 2.0
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    health_probe_interval_seconds: float = 15.0
+    health_probe_timeout_seconds: float = 5.0
+    health_max_age_seconds: float = 60.0
+    payment_cache_max_entries: int = 10_000
+    payment_unpaid_ttl_seconds: float = 5.0
+    payment_prepoll_interval_seconds: float = 0.0
+    payment_identifier_pool_size: int = 256
+    start_jobs_payment_concurrency: int = 8
+    jobs_page_max_limit: int = 500
+    orchestrator_prewarm_enabled: bool = False
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
@@ -0,0 +1,79 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientManager:
+    """Application-scoped httpx.AsyncClient pool, one client per upstream.
+
+    Each upstream gets its own connection pool and limit, so a slow
+    orchestrator cannot starve OpenRouter calls of sockets. Connections are
+    kept alive between calls instead of paying TCP+TLS setup every time.
+
+    The manager itself holds nothing; pools only exist between ``open`` and
+    ``aclose``, which the application lifespan calls, so no adapter can leave
+    a pool behind. Outside that window ``client`` raises RuntimeError.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._open = False
+        self._http2 = settings.http2_enabled and _http2_available()
+        if settings.http2_enabled and not self._http2:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+
+    def _max_connections(self, upstream: str) -> int:
+        per_upstream = {
+            "openrouter": settings.openrouter_max_connections,
+            "orchestrator": settings.orchestrator_max_connections,
+        }
+        return per_upstream.get(upstream, settings.http_max_connections)
+
+    def open(self) -> None:
+        self._open = True
+
+    async def __aenter__(self) -> "HttpClientManager":
+        self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def client(self, upstream: str) -> httpx.AsyncClient:
+        if not self._open:
+            raise RuntimeError("HttpClientManager is not open; outbound HTTP is only available while the app runs")
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            max_connections = self._max_connections(upstream)
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=min(settings.http_max_keepalive_connections, max_connections),
+                    keepalive_expiry=settings.http_keepalive_expiry_seconds,
+                ),
+            )
+            self._clients[upstream] = client
+        return client
+
+    async def aclose(self) -> None:
+        self._open = False
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
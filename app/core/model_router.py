@@ -0,0 +1,118 @@
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_WINDOW = 200
+
+
+def _percentile(ordered: list[float], percentile: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+
+class _ModelStats:
+    def __init__(self):
+        # (monotonic time, latency in seconds or None for a failed call)
+        self.samples: deque[tuple[float, Optional[float]]] = deque(maxlen=_SAMPLE_WINDOW)
+        self.routed = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.invalid = 0
+
+    def recent(self, window_seconds: float) -> list[Optional[float]]:
+        cutoff = time.monotonic() - window_seconds
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+        return [latency for _, latency in self.samples]
+
+
+class ModelRouter:
+    """Route each call to the fastest healthy model of an ordered set.
+
+    Every model keeps a rolling window of recent outcomes, from which p50/p95
+    latency and the error rate are derived. A model whose error rate exceeds
+    ``max_error_rate`` is unhealthy and only tried after every healthy one;
+    failures age out after ``window_seconds``, so it gets traffic again.
+    Healthy models with fewer than ``min_samples`` outcomes are tried first,
+    in configured order, until their latency is known; after that the
+    lowest p50 wins. Callers fall back along ``order()`` on timeout, error or
+    output that fails the quality gate, and report each outcome back.
+    """
+
+    def __init__(self, models: list[str], window_seconds: float, min_samples: int, max_error_rate: float):
+        if not models:
+            raise ValueError("ModelRouter needs at least one model")
+        self._models = list(dict.fromkeys(models))
+        self._window_seconds = window_seconds
+        self._min_samples = min_samples
+        self._max_error_rate = max_error_rate
+        self._stats = {model: _ModelStats() for model in self._models}
+        self._fallbacks = 0
+        self._last_decision: Optional[dict] = None
+
+    @property
+    def models(self) -> list[str]:
+        return list(self._models)
+
+    def _summary(self, model: str) -> dict:
+        stats = self._stats[model]
+        recent = stats.recent(self._window_seconds)
+        latencies = sorted(latency for latency in recent if latency is not None)
+        error_rate = (len(recent) - len(latencies)) / len(recent) if recent else 0.0
+        return {
+            "samples": len(recent),
+            "p50_seconds": _percentile(latencies, 50),
+            "p95_seconds": _percentile(latencies, 95),
+            "error_rate": error_rate,
+            "healthy": error_rate <= self._max_error_rate,
+            "routed": stats.routed,
+            "errors": stats.errors,
+            "timeouts": stats.timeouts,
+            "invalid": stats.invalid,
+        }
+
+    def order(self) -> list[str]:
+        summaries = {model: self._summary(model) for model in self._models}
+
+        def rank(position: int, model: str) -> tuple:
+            summary = summaries[model]
+            if not summary["healthy"]:
+                return (2, position)
+            if summary["p50_seconds"] is None or summary["samples"] < self._min_samples:
+                return (0, position)
+            return (1, summary["p50_seconds"])
+
+        return [model for _, model in sorted(enumerate(self._models), key=lambda item: rank(*item))]
+
+    def record_success(self, model: str, latency: float) -> None:
+        self._stats[model].samples.append((time.monotonic(), latency))
+
+    def record_failure(self, model: str, reason: str) -> None:
+        stats = self._stats[model]
+        stats.samples.append((time.monotonic(), None))
+        stats.errors += 1
+        if reason == "timeout":
+            stats.timeouts += 1
+        elif reason == "invalid":
+            stats.invalid += 1
+
+    def record_decision(self, order: list[str], served_by: Optional[str], attempts: list[dict]) -> None:
+        if served_by is not None:
+            self._stats[served_by].routed += 1
+        if len(attempts) > 1:
+            self._fallbacks += 1
+            logger.warning("Normalisation fell back to another model", extra={"job_id": "model-router"})
+        self._last_decision = {"order": order, "served_by": served_by, "attempts": attempts}
+
+    def stats(self) -> dict:
+        return {
+            "order": self.order(),
+            "fallbacks": self._fallbacks,
+            "last_decision": self._last_decision,
+            "models": {model: self._summary(model) for model in self._models},
+        }
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from app.core.config import settings
+from app.domain.exceptions import CircuitOpenError
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CLOSED = "closed"
+_OPEN = "open"
+_HALF_OPEN = "half_open"
+_LATENCY_WINDOW = 200
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    """Transport errors, 5xx and 429 count against the upstream; other 4xx do not."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+def _never_sent(exc: Exception) -> bool:
+    # Safe to retry even non-idempotent calls: the request never reached the upstream.
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._state = _CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._state == _OPEN and time.monotonic() - self._opened_at >= self._reset_seconds:
+            return _HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == _CLOSED:
+            return
+        if state == _HALF_OPEN and not self._probing:
+            self._state = _HALF_OPEN
+            self._probing = True
+            return
+        retry_after = max(self._reset_seconds - (time.monotonic() - self._opened_at), 0.0)
+        raise CircuitOpenError(self._name, retry_after)
+
+    def record_success(self) -> None:
+        self._state = _CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def abandon(self) -> None:
+        # A cancelled half-open probe proves nothing; let the next call probe.
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == _HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != _OPEN:
+                logger.warning("Circuit opened", extra={"job_id": self._name})
+            self._state = _OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self._failures}
+
+
+class Upstream:
+    """Circuit breaker, retry and hedging policy for one upstream service.
+
+    Every call passes the breaker first, so an open circuit fails in
+    microseconds instead of waiting out the HTTP timeout. Failed attempts are
+    retried with capped exponential backoff and full jitter; non-idempotent
+    calls are only retried when the request was never sent. Idempotent calls
+    that run longer than the recent latency percentile get one hedged
+    duplicate, and whichever finishes first wins.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        breaker: CircuitBreaker,
+        max_attempts: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        hedge_percentile: float,
+        hedge_min_samples: int,
+    ):
+        self.name = name
+        self._breaker = breaker
+        self._max_attempts = max_attempts
+        self._backoff_base_seconds = backoff_base_seconds
+        self._backoff_max_seconds = backoff_max_seconds
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_samples = hedge_min_samples
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._retries = 0
+        self._hedges = 0
+        self._rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._breaker.state == _OPEN
+
+    def _hedge_delay(self) -> Optional[float]:
+        if self._hedge_percentile <= 0 or len(self._latencies) < self._hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(int(len(ordered) * self._hedge_percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def _backoff(self, attempt: int) -> float:
+        cap = min(self._backoff_max_seconds, self._backoff_base_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    async def _hedged(self, fn: Callable[[], Awaitable[T]]) -> T:
+        delay = self._hedge_delay()
+        if delay is None:
+            return await fn()
+        tasks = [asyncio.ensure_future(fn())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self._hedges += 1
+                tasks.append(asyncio.ensure_future(fn()))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def call(self, fn: Callable[[], Awaitable[T]], idempotent: bool = False) -> T:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._breaker.before_call()
+            except CircuitOpenError:
+                self._rejected += 1
+                raise
+            started = time.monotonic()
+            try:
+                result = await (self._hedged(fn) if idempotent else fn())
+            except asyncio.CancelledError:
+                self._breaker.abandon()
+                raise
+            except Exception as exc:
+                if not _is_upstream_failure(exc):
+                    # The upstream answered; the request itself was bad.
+                    self._breaker.record_success()
+                    raise
+                self._breaker.record_failure()
+                if attempt >= self._max_attempts or not (idempotent or _never_sent(exc)):
+                    raise
+                self._retries += 1
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            self._latencies.append(time.monotonic() - started)
+            self._breaker.record_success()
+            return result
+
+    def snapshot(self) -> dict:
+        return {
+            **self._breaker.snapshot(),
+            "retries": self._retries,
+            "hedges": self._hedges,
+            "rejected": self._rejected,
+            "hedge_after_seconds": self._hedge_delay(),
+        }
+
+
+class ResilienceRegistry:
+    """Application-scoped Upstream policies, shared by every adapter."""
+
+    def __init__(self):
+        self._upstreams: dict[str, Upstream] = {}
+
+    def upstream(self, name: str) -> Upstream:
+        upstream = self._upstreams.get(name)
+        if upstream is None:
+            upstream = Upstream(
+                name,
+                CircuitBreaker(
+                    name,
+                    failure_threshold=settings.circuit_failure_threshold,
+                    reset_seconds=settings.circuit_reset_seconds,
+                ),
+                max_attempts=settings.retry_max_attempts,
+                backoff_base_seconds=settings.retry_backoff_base_seconds,
+                backoff_max_seconds=settings.retry_backoff_max_seconds,
+                hedge_percentile=settings.hedge_percentile,
+                hedge_min_samples=settings.hedge_min_samples,
+            )
+            self._upstreams[name] = upstream
+        return upstream
+
+    def snapshot(self) -> dict:
+        return {name: upstream.snapshot() for name, upstream in self._upstreams.items()}
@@ -16,12 +16,16 @@ def get_qdrant() -> AsyncQdrantClient:
       the client is ever constructed (import-time construction is skipped).
     - No TCP socket is opened during module import.
 
-    Routers inject this via Depends(get_qdrant).
+    Routers inject this via Depends(get_qdrant); QdrantJobRepository uses it
+    as its default client.
     """
     global _client
     if _client is None:
-        _client = AsyncQdrantClient(
-            url=settings.qdrant_url,
-            api_key=settings.qdrant_api_key,
-        )
+        if settings.qdrant_url == ":memory:":
+            _client = AsyncQdrantClient(location=":memory:")
+        else:
+            _client = AsyncQdrantClient(
+                url=settings.qdrant_url,
+                api_key=settings.qdrant_api_key,
+            )
     return _client
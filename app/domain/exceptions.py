@@ -13,3 +13,23 @@ class InvalidStateTransitionError(Exception):
 
 class InvalidSignatureError(Exception):
     pass
+
+
+class ExecutorSaturatedError(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__("Job executor is at capacity; retry later")
+
+
+class StageDeadlineError(Exception):
+    def __init__(self, stage: str, reason: str):
+        self.stage = stage
+        self.reason = reason
+        super().__init__(f"Stage '{stage}' aborted: {reason}")
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, upstream: str, retry_after: float):
+        self.upstream = upstream
+        self.retry_after = retry_after
+        super().__init__(f"Upstream '{upstream}' circuit is open; retry in {retry_after:.1f}s")
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.domain.exceptions import InvalidStateTransitionError
 
@@ -40,6 +40,62 @@ class Job(BaseModel):
     unlock_time: int        = Field(alias="unlockTime")
 
 
+class NewJob(BaseModel):
+    """Everything needed to create a Job; the repository assigns id, status and timestamps."""
+
+    model_config = ConfigDict(frozen=True)
+
+    input_hash: str
+    blockchain_identifier: str
+    pay_by_time: int
+    seller_vkey: str
+    submit_result_time: int
+    unlock_time: int
+
+
+class JobFilter(BaseModel):
+    """Server-side job listing filters; ``*_after`` bounds are inclusive, ``*_before`` exclusive."""
+
+    model_config = ConfigDict(frozen=True)
+
+    statuses: tuple[JobStatus, ...] = ()
+    input_hash: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+
+    @field_validator("created_after", "created_before", "updated_after", "updated_before")
+    @classmethod
+    def _assume_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # Jobs are stamped in UTC; a naive bound would not compare against them.
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    def matches(self, job: Job) -> bool:
+        return (
+            (not self.statuses or job.status in self.statuses)
+            and (self.input_hash is None or job.input_hash == self.input_hash)
+            and (self.created_after is None or job.created_at >= self.created_after)
+            and (self.created_before is None or job.created_at < self.created_before)
+            and (self.updated_after is None or job.updated_at >= self.updated_after)
+            and (self.updated_before is None or job.updated_at < self.updated_before)
+        )
+
+
+class WorkItem(BaseModel):
+    """A queued agent execution leased to one worker at a time."""
+
+    model_config = ConfigDict(frozen=True)
+
+    job_id: str
+    raw_input: dict[str, Any]
+    priority: int
+    lease_token: str
+    enqueued_at: Optional[float] = None  # epoch seconds; None for items queued before it was recorded
+
+
 LEGAL_TRANSITIONS: dict[JobStatus, list[JobStatus]] = {
     JobStatus.AWAITING_PAYMENT: [JobStatus.RUNNING],
     JobStatus.RUNNING:          [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.AWAITING_INPUT],
@@ -49,6 +105,20 @@ LEGAL_TRANSITIONS: dict[JobStatus, list[JobStatus]] = {
 }
 
 
+# Reverse view of LEGAL_TRANSITIONS: the states a job may be in immediately
+# before moving to each target. Repositories use it to turn a transition into
+# a single conditional write.
+LEGAL_SOURCES: dict[JobStatus, list[JobStatus]] = {
+    target: [source for source, targets in LEGAL_TRANSITIONS.items() if target in targets]
+    for target in JobStatus
+}
+
+# States with no outgoing transitions; a job in one of them never changes again.
+TERMINAL_STATUSES: frozenset[JobStatus] = frozenset(
+    status for status, targets in LEGAL_TRANSITIONS.items() if not targets
+)
+
+
 def validate_transition(current: JobStatus, target: JobStatus) -> None:
     if target not in LEGAL_TRANSITIONS[current]:
         raise InvalidStateTransitionError(
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException, Request
@@ -11,18 +12,38 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.adapters.api_key_auth_adapter import ApiKeyAuthAdapter
+from app.adapters.batching_normalisation_adapter import BatchingNormalisationAdapter
+from app.adapters.cached_normalisation_adapter import CachedNormalisationAdapter
+from app.adapters.cached_payment_adapter import CachedPaymentAdapter
 from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
 from app.adapters.masumi_payment import MasumiPaymentAdapter
 from app.adapters.orchestrator_adapter import OrchestratorAdapter
+from app.adapters.tiered_normalisation_adapter import TieredNormalisationAdapter
 from app.core.config import limiter, settings
+from app.core.http import HttpClientManager
+from app.core.resilience import ResilienceRegistry
 from app.core.logging import configure_logging
 from app.domain.exceptions import (
+    ExecutorSaturatedError,
     InvalidSignatureError,
     InvalidStateTransitionError,
     JobNotFoundError,
 )
+from app.repository.cached_job_repo import CachedJobRepository
+from app.repository.notifying_job_repo import NotifyingJobRepository
 from app.repository.qdrant_job_repo import QdrantJobRepository
+from app.repository.qdrant_normalisation_cache import QdrantNormalisationCache
+from app.repository.qdrant_work_queue import QdrantWorkQueue
+from app.repository.sqlite_work_queue import SqliteWorkQueue
+from app.repository.work_queue import InMemoryWorkQueue
 from app.routers import jobs
+from app.services.job_events import JobEventBus
+from app.services.agent_runner import execute_agent_task
+from app.services.job_executor import JobExecutor
+from app.services.health_monitor import HealthMonitor
+from app.services.job_sweeper import run_stale_job_sweeper
+from app.services.result_reuse import ResultReuse
+from app.services.orchestrator_prewarm import OrchestratorPrewarmer
 
 
 logger = logging.getLogger(__name__)
@@ -30,13 +51,54 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    sweeper = None
+    health_refresher = None
+    prepoller = None
+    pruner = None
+    event_poller = None
+    if hasattr(app.state, "http"):
+        app.state.http.open()
+    if hasattr(app.state, "health"):
+        health_refresher = asyncio.create_task(app.state.health.run(settings.health_probe_interval_seconds))
+    if settings.payment_prepoll_interval_seconds > 0 and hasattr(app.state.payment, "run_prepoller"):
+        prepoller = asyncio.create_task(app.state.payment.run_prepoller(settings.payment_prepoll_interval_seconds))
+    if settings.events_poll_interval_seconds > 0 and hasattr(app.state, "events"):
+        event_poller = asyncio.create_task(
+            app.state.events.run_poller(app.state.repo, settings.events_poll_interval_seconds)
+        )
+    normalisation_store = getattr(app.state, "normalisation_store", None)
+    if settings.normalisation_cache_prune_interval_seconds > 0 and normalisation_store is not None:
+        pruner = asyncio.create_task(normalisation_store.run_pruner(settings.normalisation_cache_prune_interval_seconds))
     if hasattr(app.state, "repo") and hasattr(app.state.repo, "recover_stale_running_jobs"):
-        recovered = app.state.repo.recover_stale_running_jobs(timeout_minutes=settings.job_timeout_minutes)
+        recovered = await app.state.repo.recover_stale_running_jobs(timeout_minutes=settings.job_timeout_minutes)
         logger.info(
             "Startup recovery complete",
             extra={"job_id": "startup", "from_state": "running", "to_state": f"failed:{recovered}"},
         )
+        sweeper = asyncio.create_task(
+            run_stale_job_sweeper(
+                app.state.repo,
+                timeout_minutes=settings.job_timeout_minutes,
+                interval_seconds=settings.stale_job_sweep_interval_seconds,
+            )
+        )
+    if hasattr(app.state, "executor"):
+        # Resume work queued or orphaned by a previous process without waiting for a new submit.
+        app.state.executor.start()
     yield
+    if hasattr(app.state, "executor"):
+        await app.state.executor.shutdown(grace_seconds=settings.executor_shutdown_grace_seconds)
+    if getattr(app.state, "prewarmer", None) is not None:
+        await app.state.prewarmer.shutdown()
+    for task in (sweeper, health_refresher, prepoller, pruner, event_poller):
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    if hasattr(app.state, "http"):
+        # Close pooled upstream connections only after in-flight jobs stopped using them.
+        await app.state.http.aclose()
 
 
 def create_app() -> FastAPI:
@@ -48,13 +110,87 @@ def create_app() -> FastAPI:
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
     # --- App state & routes ---
-    repo = QdrantJobRepository()
-    payment = MasumiPaymentAdapter()
+    events = JobEventBus()
+    qdrant_repo = QdrantJobRepository()
+    repo = NotifyingJobRepository(
+        CachedJobRepository(
+            qdrant_repo,
+            max_entries=settings.job_cache_max_entries,
+            ttl_seconds=settings.job_cache_ttl_seconds,
+        ),
+        events,
+    )
+    payment = CachedPaymentAdapter(
+        MasumiPaymentAdapter(),
+        max_entries=settings.payment_cache_max_entries,
+        unpaid_ttl_seconds=settings.payment_unpaid_ttl_seconds,
+        track_pending=settings.payment_prepoll_interval_seconds > 0,
+    )
     auth = ApiKeyAuthAdapter()
-    normaliser = LLMNormalisationAdapter()
-    orchestrator = OrchestratorAdapter()
+    http = HttpClientManager()
+    resilience = ResilienceRegistry()
+    normalisation_store = None
+    if settings.normalisation_cache_store == "qdrant":
+        normalisation_store = QdrantNormalisationCache(
+            ttl_seconds=settings.normalisation_cache_ttl_seconds,
+            max_entries=settings.normalisation_cache_store_max_entries,
+        )
+    llm = LLMNormalisationAdapter(http, resilience)
+    if settings.normalisation_batch_enabled:
+        llm = BatchingNormalisationAdapter(
+            llm,
+            window_seconds=settings.normalisation_batch_window_seconds,
+            max_batch_size=settings.normalisation_batch_max_size,
+        )
+    normaliser = TieredNormalisationAdapter(
+        CachedNormalisationAdapter(
+            llm,
+            max_entries=settings.normalisation_cache_max_entries,
+            ttl_seconds=settings.normalisation_cache_ttl_seconds,
+            store=normalisation_store,
+        )
+    )
+    orchestrator = OrchestratorAdapter(http, resilience)
+    app.state.http = http
+    app.state.resilience = resilience
+    app.state.normalisation_store = normalisation_store
     app.state.repo = repo
+    app.state.events = events
+
+    if settings.work_queue_backend == "sqlite":
+        work_queue = SqliteWorkQueue(settings.work_queue_sqlite_path)
+    elif settings.work_queue_backend == "memory":
+        work_queue = InMemoryWorkQueue()
+    else:
+        work_queue = QdrantWorkQueue(qdrant_repo)
+
+    results = ResultReuse(window_seconds=settings.result_reuse_window_seconds)
+    app.state.results = results
+    app.state.prewarmer = OrchestratorPrewarmer(orchestrator) if settings.orchestrator_prewarm_enabled else None
+
+    async def run_job(job_id: str, raw_input: dict) -> None:
+        await execute_agent_task(job_id, repo, normaliser, orchestrator, raw_input, results=results)
+
+    app.state.executor = JobExecutor(
+        queue=work_queue,
+        runner=run_job,
+        concurrency=settings.executor_concurrency,
+        max_queue=settings.executor_max_queue,
+        retry_after_seconds=settings.executor_retry_after_seconds,
+        lease_seconds=settings.executor_lease_seconds,
+        poll_interval_seconds=settings.executor_poll_interval_seconds,
+    )
     app.state.payment = payment
+    # Probes look the adapters up on app.state at call time so they can be swapped.
+    app.state.health = HealthMonitor(
+        probes={
+            "masumi": lambda: app.state.payment.health_check(),
+            "openrouter": lambda: app.state.normaliser.health_check(),
+            "qdrant": lambda: app.state.repo.health_check(),
+        },
+        timeout_seconds=settings.health_probe_timeout_seconds,
+        max_age_seconds=settings.health_max_age_seconds,
+    )
     app.state.auth = auth
     app.state.normaliser = normaliser
     app.state.orchestrator = orchestrator
@@ -167,6 +303,18 @@ def create_app() -> FastAPI:
         )
         return JSONResponse(status_code=403, content=_error_content(request, str(exc)))
 
+    @app.exception_handler(ExecutorSaturatedError)
+    async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+        logger.error(
+            "Executor saturated",
+            extra={"request_id": getattr(request.state, "request_id", "unknown"), "path": request.url.path, "method": request.method, "status_code": 503},
+        )
+        return JSONResponse(
+            status_code=503,
+            content=_error_content(request, str(exc)),
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.exception_handler(ResponseHandlingException)
     async def qdrant_response_handling_handler(
         request: Request, exc: ResponseHandlingException
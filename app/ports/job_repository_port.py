@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
-from app.domain.models import Job, JobStatus
+from app.domain.models import Job, JobFilter, JobStatus, NewJob
 
 
 class JobRepositoryPort(ABC):
 
     @abstractmethod
-    def create(
+    async def create(
         self,
         input_hash: str,
         blockchain_identifier: str,
@@ -17,10 +18,16 @@ class JobRepositoryPort(ABC):
     ) -> Job: ...
 
     @abstractmethod
-    def get(self, job_id: str) -> Job: ...
+    async def create_many(self, new_jobs: list[NewJob]) -> list[Job]: ...
 
     @abstractmethod
-    def update_status(
+    async def get(self, job_id: str) -> Job: ...
+
+    @abstractmethod
+    async def get_many(self, job_ids: list[str]) -> dict[str, Job]: ...
+
+    @abstractmethod
+    async def update_status(
         self,
         job_id: str,
         target: JobStatus,
@@ -29,4 +36,19 @@ class JobRepositoryPort(ABC):
     ) -> Job: ...
 
     @abstractmethod
-    def count(self) -> int: ...
\ No newline at end of file
+    async def count(self) -> int: ...
+
+    @abstractmethod
+    async def list_jobs(
+        self,
+        filters: JobFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Job], Optional[str]]: ...
+
+    @abstractmethod
+    async def find_completed_by_input_hash(
+        self,
+        input_hash: str,
+        completed_after: datetime,
+    ) -> Optional[Job]: ...
\ No newline at end of file
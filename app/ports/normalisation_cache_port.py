@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class NormalisationCachePort(ABC):
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    async def put(self, key: str, normalised: dict) -> None: ...
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.models import WorkItem
+
+
+class WorkQueuePort(ABC):
+
+    @abstractmethod
+    async def enqueue(self, job_id: str, raw_input: dict, priority: int) -> None: ...
+
+    @abstractmethod
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkItem]: ...
+
+    @abstractmethod
+    async def heartbeat(self, item: WorkItem, lease_seconds: float) -> None: ...
+
+    @abstractmethod
+    async def complete(self, item: WorkItem) -> None: ...
+
+    @abstractmethod
+    async def release(self, item: WorkItem) -> None: ...
+
+    @abstractmethod
+    async def depth(self) -> int: ...
\ No newline at end of file
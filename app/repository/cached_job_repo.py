@@ -0,0 +1,197 @@
+import time
+from datetime import datetime
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from app.domain.models import TERMINAL_STATUSES, Job, JobFilter, JobStatus, NewJob
+from app.ports.job_repository_port import JobRepositoryPort
+
+
+class CachedJobRepository(JobRepositoryPort):
+    """Bounded LRU read-through cache in front of any JobRepositoryPort.
+
+    Writes made through this instance are stored immediately. Jobs in a
+    terminal state never change, so they stay cached until evicted by size.
+    Every other entry expires after ``ttl_seconds``, which bounds staleness
+    when another worker transitions the same job. A read only fills the
+    cache if no write touched that job while it was in flight, so a slow
+    read can never overwrite a newer snapshot with the one it fetched.
+    """
+
+    def __init__(self, inner: JobRepositoryPort, max_entries: int, ttl_seconds: float):
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[Job, Optional[float]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._generation = 0
+        self._reads_in_flight = 0
+        # Generation of the last write per job, kept only while reads are in flight.
+        self._written: dict[str, int] = {}
+
+    def __getattr__(self, name: str):
+        # Forward optional repository extras (health_check, recovery, ...).
+        return getattr(self._inner, name)
+
+    def _record_write(self, job_id: str) -> None:
+        self._generation += 1
+        if self._reads_in_flight:
+            self._written[job_id] = self._generation
+
+    @contextmanager
+    def _read(self) -> Iterator[int]:
+        started = self._generation
+        self._reads_in_flight += 1
+        try:
+            yield started
+        finally:
+            self._reads_in_flight -= 1
+            if not self._reads_in_flight:
+                self._written.clear()
+
+    def _fill(self, job: Job, started: int) -> None:
+        if self._written.get(job.job_id, 0) <= started:
+            self._store(job)
+
+    def _put(self, job: Job) -> None:
+        self._record_write(job.job_id)
+        self._store(job)
+
+    def _store(self, job: Job) -> None:
+        expires_at = None
+        if job.status not in TERMINAL_STATUSES:
+            expires_at = time.monotonic() + self._ttl_seconds
+        self._entries[job.job_id] = (job, expires_at)
+        self._entries.move_to_end(job.job_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _lookup(self, job_id: str) -> Optional[Job]:
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        job, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[job_id]
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(job_id)
+        return job
+
+    def invalidate(self, job_id: str) -> None:
+        self._record_write(job_id)
+        self._entries.pop(job_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    async def create(
+        self,
+        input_hash: str,
+        blockchain_identifier: str,
+        pay_by_time: int,
+        seller_vkey: str,
+        submit_result_time: int,
+        unlock_time: int,
+    ) -> Job:
+        job = await self._inner.create(
+            input_hash=input_hash,
+            blockchain_identifier=blockchain_identifier,
+            pay_by_time=pay_by_time,
+            seller_vkey=seller_vkey,
+            submit_result_time=submit_result_time,
+            unlock_time=unlock_time,
+        )
+        self._put(job)
+        return job
+
+    async def create_many(self, new_jobs: list[NewJob]) -> list[Job]:
+        jobs = await self._inner.create_many(new_jobs)
+        for job in jobs:
+            self._put(job)
+        return jobs
+
+    async def get(self, job_id: str) -> Job:
+        job = self._lookup(job_id)
+        if job is not None:
+            self._hits += 1
+            return job
+        self._misses += 1
+        with self._read() as started:
+            job = await self._inner.get(job_id)
+            self._fill(job, started)
+        return job
+
+    async def get_many(self, job_ids: list[str]) -> dict[str, Job]:
+        jobs = {}
+        missing = []
+        for job_id in job_ids:
+            job = self._lookup(job_id)
+            if job is None:
+                missing.append(job_id)
+            else:
+                jobs[job_id] = job
+        self._hits += len(jobs)
+        self._misses += len(missing)
+        if missing:
+            with self._read() as started:
+                fetched = await self._inner.get_many(missing)
+                for job in fetched.values():
+                    self._fill(job, started)
+            jobs.update(fetched)
+        return jobs
+
+    async def update_status(
+        self,
+        job_id: str,
+        target: JobStatus,
+        result: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> Job:
+        try:
+            job = await self._inner.update_status(job_id, target, result=result, error=error)
+        except Exception:
+            # A rejected transition usually means our copy is out of date.
+            self.invalidate(job_id)
+            raise
+        self._put(job)
+        return job
+
+    async def count(self) -> int:
+        return await self._inner.count()
+
+    async def list_jobs(
+        self,
+        filters: JobFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Job], Optional[str]]:
+        return await self._inner.list_jobs(filters, limit, cursor)
+
+    async def find_completed_by_input_hash(
+        self,
+        input_hash: str,
+        completed_after: datetime,
+    ) -> Optional[Job]:
+        return await self._inner.find_completed_by_input_hash(input_hash, completed_after)
+
+    async def fail_stale_running_jobs(self, timeout_minutes: int) -> list[Job]:
+        failed = await self._inner.fail_stale_running_jobs(timeout_minutes=timeout_minutes)
+        for job in failed:
+            self._put(job)
+        return failed
+
+    async def recover_stale_running_jobs(self, timeout_minutes: int) -> int:
+        return len(await self.fail_stale_running_jobs(timeout_minutes=timeout_minutes))
@@ -1,10 +1,14 @@
+import bisect
+import heapq
 import threading
 import uuid
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 
-from app.domain.models import Job, JobStatus, validate_transition
+from app.domain.models import Job, JobFilter, JobStatus, NewJob, validate_transition
 from app.domain.exceptions import JobNotFoundError
 from app.ports.job_repository_port import JobRepositoryPort
 
@@ -16,8 +20,33 @@ class InMemoryJobRepository(JobRepositoryPort):
     def __init__(self):
         self._store: dict[str, Job] = {}
         self._lock = threading.Lock()
+        # Secondary indexes: job ids kept sorted so listings can start at a cursor with bisect.
+        self._ids: list[str] = []
+        self._ids_by_status: dict[JobStatus, list[str]] = defaultdict(list)
+        self._ids_by_input_hash: dict[str, list[str]] = defaultdict(list)
 
-    def create(
+    def _index(self, job: Job) -> None:
+        bisect.insort(self._ids, job.job_id)
+        bisect.insort(self._ids_by_status[job.status], job.job_id)
+        bisect.insort(self._ids_by_input_hash[job.input_hash], job.job_id)
+
+    def _reindex_status(self, job_id: str, previous: JobStatus, target: JobStatus) -> None:
+        ids = self._ids_by_status[previous]
+        del ids[bisect.bisect_left(ids, job_id)]
+        bisect.insort(self._ids_by_status[target], job_id)
+
+    def _candidates(self, filters: JobFilter, cursor: Optional[str]) -> Iterator[str]:
+        """Sorted job ids from the narrowest index for ``filters``, starting at ``cursor``."""
+        if filters.input_hash is not None:
+            sources = [self._ids_by_input_hash.get(filters.input_hash, [])]
+        elif filters.statuses:
+            sources = [self._ids_by_status.get(status, []) for status in set(filters.statuses)]
+        else:
+            sources = [self._ids]
+        starts = [bisect.bisect_left(ids, cursor) if cursor else 0 for ids in sources]
+        return heapq.merge(*(islice(ids, start, None) for ids, start in zip(sources, starts)))
+
+    async def create(
         self,
         input_hash: str,
         blockchain_identifier: str,
@@ -26,32 +55,46 @@ class InMemoryJobRepository(JobRepositoryPort):
         submit_result_time: int,
         unlock_time: int,
     ) -> Job:
-        job_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
-        job = Job(
-            job_id=job_id,
-            status=JobStatus.AWAITING_PAYMENT,
+        jobs = await self.create_many([NewJob(
             input_hash=input_hash,
             blockchain_identifier=blockchain_identifier,
-            created_at=now,
-            updated_at=now,
             pay_by_time=pay_by_time,
             seller_vkey=seller_vkey,
             submit_result_time=submit_result_time,
             unlock_time=unlock_time,
-        )
+        )])
+        return jobs[0]
+
+    async def create_many(self, new_jobs: list[NewJob]) -> list[Job]:
+        now = datetime.now(timezone.utc)
+        jobs = [
+            Job(
+                job_id=str(uuid.uuid4()),
+                status=JobStatus.AWAITING_PAYMENT,
+                created_at=now,
+                updated_at=now,
+                **new_job.model_dump(),
+            )
+            for new_job in new_jobs
+        ]
         with self._lock:
-            self._store[job_id] = job
-        return job
+            for job in jobs:
+                self._store[job.job_id] = job
+                self._index(job)
+        return jobs
 
-    def get(self, job_id: str) -> Job:
+    async def get(self, job_id: str) -> Job:
         with self._lock:
             job = self._store.get(job_id)
         if job is None:
             raise JobNotFoundError(job_id)
         return job
 
-    def update_status(
+    async def get_many(self, job_ids: list[str]) -> dict[str, Job]:
+        with self._lock:
+            return {job_id: self._store[job_id] for job_id in job_ids if job_id in self._store}
+
+    async def update_status(
         self,
         job_id: str,
         target: JobStatus,
@@ -71,6 +114,8 @@ class InMemoryJobRepository(JobRepositoryPort):
                 "error": error,
             })
             self._store[job_id] = updated
+            if previous != target:
+                self._reindex_status(job_id, previous, target)
         logger.info(
             "Job state transition",
             extra={
@@ -81,6 +126,36 @@ class InMemoryJobRepository(JobRepositoryPort):
         )
         return updated
 
-    def count(self) -> int:
+    async def count(self) -> int:
         with self._lock:
             return len(self._store)
+
+    async def find_completed_by_input_hash(
+        self,
+        input_hash: str,
+        completed_after: datetime,
+    ) -> Optional[Job]:
+        with self._lock:
+            matches = [
+                job for job in (self._store[job_id] for job_id in self._ids_by_input_hash.get(input_hash, []))
+                if job.status == JobStatus.COMPLETED and job.updated_at >= completed_after
+            ]
+        return max(matches, key=lambda job: job.updated_at, default=None)
+
+    async def list_jobs(
+        self,
+        filters: JobFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Job], Optional[str]]:
+        jobs: list[Job] = []
+        with self._lock:
+            for job_id in self._candidates(filters, cursor):
+                job = self._store[job_id]
+                if not filters.matches(job):
+                    continue
+                if len(jobs) == limit:
+                    # Like a Qdrant scroll offset, the cursor is the first id of the next page.
+                    return jobs, job_id
+                jobs.append(job)
+        return jobs, None
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Optional
+
+from app.domain.models import Job, JobFilter, JobStatus, NewJob
+from app.ports.job_repository_port import JobRepositoryPort
+from app.services.job_events import JobEventBus
+
+
+class NotifyingJobRepository(JobRepositoryPort):
+    """Publishes every successful state transition to a JobEventBus.
+
+    Jobs failed by the stale-job sweep are published too, so streams
+    watching them see the terminal state.
+    """
+
+    def __init__(self, inner: JobRepositoryPort, events: JobEventBus):
+        self._inner = inner
+        self._events = events
+
+    def __getattr__(self, name: str):
+        # Forward optional repository extras (health_check, stats, ...).
+        return getattr(self._inner, name)
+
+    async def create(
+        self,
+        input_hash: str,
+        blockchain_identifier: str,
+        pay_by_time: int,
+        seller_vkey: str,
+        submit_result_time: int,
+        unlock_time: int,
+    ) -> Job:
+        return await self._inner.create(
+            input_hash=input_hash,
+            blockchain_identifier=blockchain_identifier,
+            pay_by_time=pay_by_time,
+            seller_vkey=seller_vkey,
+            submit_result_time=submit_result_time,
+            unlock_time=unlock_time,
+        )
+
+    async def create_many(self, new_jobs: list[NewJob]) -> list[Job]:
+        return await self._inner.create_many(new_jobs)
+
+    async def get(self, job_id: str) -> Job:
+        return await self._inner.get(job_id)
+
+    async def get_many(self, job_ids: list[str]) -> dict[str, Job]:
+        return await self._inner.get_many(job_ids)
+
+    async def update_status(
+        self,
+        job_id: str,
+        target: JobStatus,
+        result: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> Job:
+        job = await self._inner.update_status(job_id, target, result=result, error=error)
+        self._events.publish(job)
+        return job
+
+    async def count(self) -> int:
+        return await self._inner.count()
+
+    async def list_jobs(
+        self,
+        filters: JobFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Job], Optional[str]]:
+        return await self._inner.list_jobs(filters, limit, cursor)
+
+    async def find_completed_by_input_hash(
+        self,
+        input_hash: str,
+        completed_after: datetime,
+    ) -> Optional[Job]:
+        return await self._inner.find_completed_by_input_hash(input_hash, completed_after)
+
+    async def fail_stale_running_jobs(self, timeout_minutes: int) -> list[Job]:
+        failed = await self._inner.fail_stale_running_jobs(timeout_minutes=timeout_minutes)
+        for job in failed:
+            self._events.publish(job)
+        return failed
+
+    async def recover_stale_running_jobs(self, timeout_minutes: int) -> int:
+        return len(await self.fail_stale_running_jobs(timeout_minutes=timeout_minutes))
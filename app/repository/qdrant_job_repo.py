@@ -1,38 +1,94 @@
-import threading
+import asyncio
 import uuid
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Union
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    DatetimeRange,
+    Direction,
+    Distance,
+    FieldCondition,
+    Filter,
+    HasIdCondition,
+    IsEmptyCondition,
+    MatchAny,
+    MatchValue,
+    OrderBy,
+    PayloadField,
+    PayloadSchemaType,
+    PointStruct,
+    VectorParams,
+)
 
-from app.core.config import settings
-from app.domain.exceptions import JobNotFoundError
-from app.domain.models import Job, JobStatus, validate_transition
+from app.db.qdrant import get_qdrant
+from app.domain.exceptions import InvalidStateTransitionError, JobNotFoundError
+from app.domain.models import LEGAL_SOURCES, Job, JobFilter, JobStatus, NewJob, validate_transition
 from app.ports.job_repository_port import JobRepositoryPort
 
 
 logger = logging.getLogger(__name__)
 
+# Every write stamps a fresh revision token into the payload, which later
+# writers can pin their compare-and-set on. A transition also leaves a marker
+# key named after its own token: later writes replace the revision but never
+# that key, so a writer can tell its conditional set_payload applied even when
+# the job moved on (e.g. A -> B -> A) before it looked.
+_REVISION_KEY = "revision"
+_APPLIED_PREFIX = "applied_"
+_MAX_WRITE_ATTEMPTS = 5
+
+# Fields filtered on server-side. Creating an index that already exists is a
+# no-op, so this also back-fills indexes on collections made by older builds.
+_PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "status": PayloadSchemaType.KEYWORD,
+    "created_at": PayloadSchemaType.DATETIME,
+    "updated_at": PayloadSchemaType.DATETIME,
+    _REVISION_KEY: PayloadSchemaType.KEYWORD,
+    "input_hash": PayloadSchemaType.KEYWORD,
+}
+_RECOVERY_PAGE_SIZE = 256
+_JOB_KEYS = frozenset(field.alias or name for name, field in Job.model_fields.items())
+
 
 class QdrantJobRepository(JobRepositoryPort):
-    def __init__(self, collection_name: str = "jobs"):
-        self._lock = threading.RLock()
+    def __init__(
+        self,
+        collection_name: str = "jobs",
+        client: Optional[AsyncQdrantClient] = None,
+    ):
         self._collection_name = collection_name
-        if settings.qdrant_url == ":memory:":
-            self._client = QdrantClient(":memory:")
-        else:
-            self._client = QdrantClient(url=settings.qdrant_url, api_key=settings.qdrant_api_key)
-        self._ensure_collection()
-
-    def _ensure_collection(self) -> None:
-        if self._client.collection_exists(self._collection_name):
+        self._client = client or get_qdrant()
+        self._ready = False
+        self._init_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> AsyncQdrantClient:
+        return self._client
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection_name
+
+    async def ensure_collection(self) -> None:
+        if self._ready:
             return
-        self._client.create_collection(
-            collection_name=self._collection_name,
-            vectors_config=VectorParams(size=1, distance=Distance.COSINE),
-        )
+        async with self._init_lock:
+            if self._ready:
+                return
+            if not await self._client.collection_exists(self._collection_name):
+                await self._client.create_collection(
+                    collection_name=self._collection_name,
+                    vectors_config=VectorParams(size=1, distance=Distance.COSINE),
+                )
+            for field_name, schema in _PAYLOAD_INDEXES.items():
+                await self._client.create_payload_index(
+                    collection_name=self._collection_name,
+                    field_name=field_name,
+                    field_schema=schema,
+                )
+            self._ready = True
 
     @staticmethod
     def _to_payload(job: Job) -> dict:
@@ -44,13 +100,32 @@ class QdrantJobRepository(JobRepositoryPort):
 
     @staticmethod
     def _from_payload(payload: dict) -> Job:
-        normalized = dict(payload)
+        # Points also carry bookkeeping (revision, work-queue lease) that is not part of Job.
+        normalized = {key: value for key, value in payload.items() if key in _JOB_KEYS}
         normalized["created_at"] = datetime.fromisoformat(normalized["created_at"])
         normalized["updated_at"] = datetime.fromisoformat(normalized["updated_at"])
         normalized["status"] = JobStatus(normalized["status"])
         return Job(**normalized)
 
-    def create(
+    @staticmethod
+    def _revision_condition(revision: Optional[str]) -> Union[FieldCondition, IsEmptyCondition]:
+        # Payloads written before revisions existed carry no token at all.
+        if revision is None:
+            return IsEmptyCondition(is_empty=PayloadField(key=_REVISION_KEY))
+        return FieldCondition(key=_REVISION_KEY, match=MatchValue(value=revision))
+
+    async def _retrieve_payload(self, job_id: str) -> dict:
+        await self.ensure_collection()
+        points = await self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=[job_id],
+            with_payload=True,
+        )
+        if not points:
+            raise JobNotFoundError(job_id)
+        return points[0].payload or {}
+
+    async def create(
         self,
         input_hash: str,
         blockchain_identifier: str,
@@ -59,103 +134,241 @@ class QdrantJobRepository(JobRepositoryPort):
         submit_result_time: int,
         unlock_time: int,
     ) -> Job:
-        job_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
-        job = Job(
-            job_id=job_id,
-            status=JobStatus.AWAITING_PAYMENT,
+        jobs = await self.create_many([NewJob(
             input_hash=input_hash,
             blockchain_identifier=blockchain_identifier,
-            created_at=now,
-            updated_at=now,
             pay_by_time=pay_by_time,
             seller_vkey=seller_vkey,
             submit_result_time=submit_result_time,
             unlock_time=unlock_time,
-        )
-        with self._lock:
-            self._client.upsert(
-                collection_name=self._collection_name,
-                points=[PointStruct(id=job_id, vector=[0.0], payload=self._to_payload(job))],
-            )
-        return job
+        )])
+        return jobs[0]
 
-    def get(self, job_id: str) -> Job:
-        with self._lock:
-            points = self._client.retrieve(
-                collection_name=self._collection_name,
-                ids=[job_id],
-                with_payload=True,
+    async def create_many(self, new_jobs: list[NewJob]) -> list[Job]:
+        await self.ensure_collection()
+        now = datetime.now(timezone.utc)
+        jobs = [
+            Job(
+                job_id=str(uuid.uuid4()),
+                status=JobStatus.AWAITING_PAYMENT,
+                created_at=now,
+                updated_at=now,
+                **new_job.model_dump(),
             )
-        if not points:
-            raise JobNotFoundError(job_id)
-        return self._from_payload(points[0].payload or {})
+            for new_job in new_jobs
+        ]
+        points = []
+        for job in jobs:
+            payload = self._to_payload(job)
+            payload[_REVISION_KEY] = uuid.uuid4().hex
+            points.append(PointStruct(id=job.job_id, vector=[0.0], payload=payload))
+        if points:
+            # One upsert for the whole batch instead of a round trip per job.
+            await self._client.upsert(collection_name=self._collection_name, points=points)
+        return jobs
 
-    def update_status(
+    async def get(self, job_id: str) -> Job:
+        return self._from_payload(await self._retrieve_payload(job_id))
+
+    async def get_many(self, job_ids: list[str]) -> dict[str, Job]:
+        await self.ensure_collection()
+        # Job ids are UUIDs; anything else cannot exist and would make Qdrant reject the whole call.
+        valid_ids = []
+        for job_id in dict.fromkeys(job_ids):
+            try:
+                uuid.UUID(job_id)
+            except ValueError:
+                continue
+            valid_ids.append(job_id)
+        if not valid_ids:
+            return {}
+        points = await self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=valid_ids,
+            with_payload=True,
+        )
+        jobs = (self._from_payload(point.payload or {}) for point in points)
+        return {job.job_id: job for job in jobs}
+
+    async def update_status(
         self,
         job_id: str,
         target: JobStatus,
         result: Optional[str] = None,
         error: Optional[str] = None,
     ) -> Job:
-        with self._lock:
-            current = self.get(job_id)
+        await self.ensure_collection()
+        sources = LEGAL_SOURCES[target]
+        if not sources:
+            current = await self.get(job_id)
             validate_transition(current.status, target)
-            previous = current.status
-            updated = current.model_copy(update={
-                "status": target,
-                "updated_at": datetime.now(timezone.utc),
+
+        # First attempt is a blind compare-and-set on the legal source states;
+        # only a lost race falls back to pinning the revision we observed.
+        guard = FieldCondition(key="status", match=MatchAny(any=[s.value for s in sources]))
+        from_state = "|".join(s.value for s in sources)
+        for _ in range(_MAX_WRITE_ATTEMPTS):
+            new_revision = uuid.uuid4().hex
+            written = {
+                "status": target.value,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
                 "result": result,
                 "error": error,
-            })
-            self._client.upsert(
+            }
+            await self._client.set_payload(
                 collection_name=self._collection_name,
-                points=[PointStruct(id=job_id, vector=[0.0], payload=self._to_payload(updated))],
+                payload={**written, _REVISION_KEY: new_revision, _APPLIED_PREFIX + new_revision: True},
+                points=Filter(must=[HasIdCondition(has_id=[job_id]), guard]),
             )
-        logger.info(
-            "Job state transition",
-            extra={
-                "job_id": job_id,
-                "from_state": previous.value,
-                "to_state": target.value,
-            },
-        )
-        return updated
+            # set_payload reports no match count, so one read confirms the write
+            # and supplies the job's immutable fields.
+            payload = await self._retrieve_payload(job_id)
+            if payload.get(_APPLIED_PREFIX + new_revision):
+                logger.info(
+                    "Job state transition",
+                    extra={
+                        "job_id": job_id,
+                        "from_state": from_state,
+                        "to_state": target.value,
+                    },
+                )
+                # The job as this write left it, even if another writer has moved it on since.
+                return self._from_payload({**payload, **written})
 
-    def count(self) -> int:
-        with self._lock:
-            response = self._client.count(collection_name=self._collection_name, exact=True)
+            current = JobStatus(payload["status"])
+            validate_transition(current, target)
+            guard = self._revision_condition(payload.get(_REVISION_KEY))
+            from_state = current.value
+        raise InvalidStateTransitionError(from_state=from_state, to_state=target.value)
+
+    async def count(self) -> int:
+        await self.ensure_collection()
+        response = await self._client.count(collection_name=self._collection_name, exact=True)
         return int(response.count)
 
-    def recover_stale_running_jobs(self, timeout_minutes: int) -> int:
+    @staticmethod
+    def _listing_filter(filters: JobFilter) -> Filter:
+        conditions: list[FieldCondition] = []
+        if filters.statuses:
+            conditions.append(FieldCondition(key="status", match=MatchAny(any=[s.value for s in filters.statuses])))
+        if filters.input_hash is not None:
+            conditions.append(FieldCondition(key="input_hash", match=MatchValue(value=filters.input_hash)))
+        for key, after, before in (
+            ("created_at", filters.created_after, filters.created_before),
+            ("updated_at", filters.updated_after, filters.updated_before),
+        ):
+            if after is not None or before is not None:
+                conditions.append(FieldCondition(key=key, range=DatetimeRange(gte=after, lt=before)))
+        return Filter(must=conditions)
+
+    async def list_jobs(
+        self,
+        filters: JobFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Job], Optional[str]]:
+        await self.ensure_collection()
+        # Keyset pagination on the point id: the scroll offset is the first id of
+        # the next page, so every page is one indexed, server-side filtered read.
+        points, next_offset = await self._client.scroll(
+            collection_name=self._collection_name,
+            scroll_filter=self._listing_filter(filters),
+            limit=limit,
+            offset=cursor,
+            with_payload=True,
+            with_vectors=False,
+        )
+        jobs = [self._from_payload(point.payload or {}) for point in points]
+        return jobs, str(next_offset) if next_offset is not None else None
+
+    async def find_completed_by_input_hash(
+        self,
+        input_hash: str,
+        completed_after: datetime,
+    ) -> Optional[Job]:
+        await self.ensure_collection()
+        points, _ = await self._client.scroll(
+            collection_name=self._collection_name,
+            scroll_filter=Filter(must=[
+                FieldCondition(key="input_hash", match=MatchValue(value=input_hash)),
+                FieldCondition(key="status", match=MatchValue(value=JobStatus.COMPLETED.value)),
+                FieldCondition(key="updated_at", range=DatetimeRange(gte=completed_after)),
+            ]),
+            limit=1,
+            order_by=OrderBy(key="updated_at", direction=Direction.DESC),
+            with_payload=True,
+            with_vectors=False,
+        )
+        if not points:
+            return None
+        return self._from_payload(points[0].payload or {})
+
+    async def recover_stale_running_jobs(
+        self,
+        timeout_minutes: int,
+        page_size: int = _RECOVERY_PAGE_SIZE,
+    ) -> int:
+        return len(await self.fail_stale_running_jobs(timeout_minutes=timeout_minutes, page_size=page_size))
+
+    async def fail_stale_running_jobs(
+        self,
+        timeout_minutes: int,
+        page_size: int = _RECOVERY_PAGE_SIZE,
+    ) -> list[Job]:
+        """Fail RUNNING jobs not updated for ``timeout_minutes``; returns the jobs this call failed."""
+        await self.ensure_collection()
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=timeout_minutes)
-        recovered = 0
-        with self._lock:
-            points, _ = self._client.scroll(
+        stale = [
+            FieldCondition(key="status", match=MatchValue(value=JobStatus.RUNNING.value)),
+            FieldCondition(key="updated_at", range=DatetimeRange(lt=cutoff)),
+        ]
+        # One revision token for the whole sweep identifies the jobs this call
+        # failed afterwards, even though set_payload reports nothing back.
+        sweep_revision = uuid.uuid4().hex
+        offset = None
+        while True:
+            points, offset = await self._client.scroll(
                 collection_name=self._collection_name,
-                with_payload=True,
-                limit=10_000,
+                scroll_filter=Filter(must=stale),
+                limit=page_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
             )
-            for point in points:
-                payload = point.payload or {}
-                if payload.get("status") != JobStatus.RUNNING.value:
-                    continue
-                updated_at = datetime.fromisoformat(str(payload["updated_at"]))
-                if updated_at > cutoff:
-                    continue
-                payload["status"] = JobStatus.FAILED.value
-                payload["error"] = "Job timed out — recovered on restart"
-                payload["updated_at"] = datetime.now(timezone.utc).isoformat()
-                self._client.upsert(
+            if points:
+                # Re-applying the stale conditions keeps a job that transitioned
+                # since the scroll page was read from being clobbered.
+                await self._client.set_payload(
                     collection_name=self._collection_name,
-                    points=[PointStruct(id=point.id, vector=[0.0], payload=payload)],
+                    payload={
+                        "status": JobStatus.FAILED.value,
+                        "error": "Job timed out — reaped by stale-job sweeper",
+                        "updated_at": datetime.now(timezone.utc).isoformat(),
+                        _REVISION_KEY: sweep_revision,
+                    },
+                    points=Filter(must=[HasIdCondition(has_id=[p.id for p in points]), *stale]),
                 )
-                recovered += 1
-        return recovered
+            if offset is None:
+                break
+        failed = []
+        offset = None
+        while True:
+            points, offset = await self._client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=Filter(must=[FieldCondition(key=_REVISION_KEY, match=MatchValue(value=sweep_revision))]),
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            failed.extend(self._from_payload(point.payload) for point in points)
+            if offset is None:
+                return failed
 
-    def health_check(self) -> bool:
+    async def health_check(self) -> bool:
         try:
-            self._client.count(collection_name=self._collection_name, exact=False)
+            await self.ensure_collection()
+            await self._client.count(collection_name=self._collection_name, exact=False)
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
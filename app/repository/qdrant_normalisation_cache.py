@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    DatetimeRange,
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    OrderBy,
+    PayloadSchemaType,
+    PointIdsList,
+    PointStruct,
+    VectorParams,
+)
+
+from app.db.qdrant import get_qdrant
+from app.ports.normalisation_cache_port import NormalisationCachePort
+
+
+logger = logging.getLogger(__name__)
+
+class QdrantNormalisationCache(NormalisationCachePort):
+    """Persistent normalisation results, one point per cache key.
+
+    Survives restarts and is shared by every worker on the same Qdrant. Entries
+    older than ``ttl_seconds`` are ignored on read. ``prune`` deletes them and,
+    when the collection has grown past ``max_entries``, the oldest entries; it
+    runs on a schedule via ``run_pruner`` so a write is a single upsert.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        collection_name: str = "normalisation_cache",
+        client: Optional[AsyncQdrantClient] = None,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._collection_name = collection_name
+        self._client = client or get_qdrant()
+        self._ready = False
+        self._init_lock = asyncio.Lock()
+
+    async def _ensure_collection(self) -> None:
+        if self._ready:
+            return
+        async with self._init_lock:
+            if self._ready:
+                return
+            if not await self._client.collection_exists(self._collection_name):
+                await self._client.create_collection(
+                    collection_name=self._collection_name,
+                    vectors_config=VectorParams(size=1, distance=Distance.COSINE),
+                )
+            await self._client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name="created_at",
+                field_schema=PayloadSchemaType.DATETIME,
+            )
+            self._ready = True
+
+    @staticmethod
+    def _point_id(key: str) -> str:
+        # Keys are SHA-256 hex digests; Qdrant point ids must be UUIDs or integers.
+        return str(uuid.UUID(hex=key[:32]))
+
+    async def get(self, key: str) -> Optional[dict]:
+        await self._ensure_collection()
+        points = await self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=[self._point_id(key)],
+            with_payload=True,
+        )
+        if not points or not points[0].payload:
+            return None
+        payload = points[0].payload
+        created_at = datetime.fromisoformat(payload["created_at"])
+        if payload.get("key") != key or created_at < datetime.now(timezone.utc) - timedelta(seconds=self._ttl_seconds):
+            return None
+        return payload["normalised"]
+
+    async def put(self, key: str, normalised: dict) -> None:
+        await self._ensure_collection()
+        await self._client.upsert(
+            collection_name=self._collection_name,
+            points=[
+                PointStruct(
+                    id=self._point_id(key),
+                    vector=[0.0],
+                    payload={
+                        "key": key,
+                        "normalised": normalised,
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+            ],
+        )
+
+    async def prune(self) -> None:
+        """Delete expired entries, then the oldest ones beyond ``max_entries``."""
+        await self._ensure_collection()
+        now = datetime.now(timezone.utc)
+        await self._client.delete(
+            collection_name=self._collection_name,
+            points_selector=FilterSelector(filter=Filter(must=[
+                FieldCondition(
+                    key="created_at",
+                    range=DatetimeRange(lt=now - timedelta(seconds=self._ttl_seconds)),
+                ),
+            ])),
+        )
+        response = await self._client.count(collection_name=self._collection_name, exact=True)
+        overflow = int(response.count) - self._max_entries
+        if overflow > 0:
+            oldest, _ = await self._client.scroll(
+                collection_name=self._collection_name,
+                limit=overflow,
+                order_by=OrderBy(key="created_at"),
+                with_payload=False,
+                with_vectors=False,
+            )
+            await self._client.delete(
+                collection_name=self._collection_name,
+                points_selector=PointIdsList(points=[point.id for point in oldest]),
+            )
+
+    async def run_pruner(self, interval_seconds: float) -> None:
+        """Prune forever; cancelled on shutdown."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.prune()
+            except Exception:
+                logger.exception("Normalisation cache prune failed", extra={"job_id": "normaliser"})
@@ -0,0 +1,173 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from qdrant_client.models import (
+    DatetimeRange,
+    FieldCondition,
+    Filter,
+    HasIdCondition,
+    MatchValue,
+    OrderBy,
+    PayloadSchemaType,
+)
+
+from app.domain.models import WorkItem
+from app.ports.work_queue_port import WorkQueuePort
+from app.repository.qdrant_job_repo import QdrantJobRepository
+
+
+_QUEUED = "queued"
+_LEASED = "leased"
+_DONE = "done"
+
+_PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "queue_state": PayloadSchemaType.KEYWORD,
+    "queue_priority": PayloadSchemaType.INTEGER,
+    "lease_expires_at": PayloadSchemaType.DATETIME,
+    "lease_token": PayloadSchemaType.KEYWORD,
+}
+_CLAIM_CANDIDATES = 8
+
+
+class QdrantWorkQueue(WorkQueuePort):
+    """Durable work queue stored on the job points of the jobs collection.
+
+    Queue state lives next to the job it drives, so any worker sharing the
+    collection can claim it. A claim is a conditional set_payload on a point
+    that is queued or whose lease has expired; the lease token read back
+    afterwards tells the worker whether it won.
+    """
+
+    def __init__(self, jobs: QdrantJobRepository):
+        self._jobs = jobs
+        self._client = jobs.client
+        self._collection_name = jobs.collection_name
+        self._ready = False
+
+    async def _ensure_indexes(self) -> None:
+        if self._ready:
+            return
+        await self._jobs.ensure_collection()
+        for field_name, schema in _PAYLOAD_INDEXES.items():
+            await self._client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name=field_name,
+                field_schema=schema,
+            )
+        self._ready = True
+
+    @staticmethod
+    def _claimable(now: datetime) -> Filter:
+        return Filter(should=[
+            FieldCondition(key="queue_state", match=MatchValue(value=_QUEUED)),
+            Filter(must=[
+                FieldCondition(key="queue_state", match=MatchValue(value=_LEASED)),
+                FieldCondition(key="lease_expires_at", range=DatetimeRange(lt=now)),
+            ]),
+        ])
+
+    @staticmethod
+    def _owned(item: WorkItem) -> Filter:
+        return Filter(must=[
+            HasIdCondition(has_id=[item.job_id]),
+            FieldCondition(key="lease_token", match=MatchValue(value=item.lease_token)),
+        ])
+
+    async def enqueue(self, job_id: str, raw_input: dict, priority: int) -> None:
+        await self._ensure_indexes()
+        await self._client.set_payload(
+            collection_name=self._collection_name,
+            payload={
+                "queue_state": _QUEUED,
+                "queue_priority": priority,
+                "queue_input": raw_input,
+                "queue_enqueued_at": time.time(),
+                "lease_owner": None,
+                "lease_token": None,
+                "lease_expires_at": None,
+            },
+            points=[job_id],
+        )
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkItem]:
+        await self._ensure_indexes()
+        now = datetime.now(timezone.utc)
+        candidates, _ = await self._client.scroll(
+            collection_name=self._collection_name,
+            scroll_filter=self._claimable(now),
+            limit=_CLAIM_CANDIDATES,
+            order_by=OrderBy(key="queue_priority"),
+            with_payload=False,
+            with_vectors=False,
+        )
+        for candidate in candidates:
+            lease_token = uuid.uuid4().hex
+            await self._client.set_payload(
+                collection_name=self._collection_name,
+                payload={
+                    "queue_state": _LEASED,
+                    "lease_owner": worker_id,
+                    "lease_token": lease_token,
+                    "lease_expires_at": (now + timedelta(seconds=lease_seconds)).isoformat(),
+                },
+                points=Filter(must=[HasIdCondition(has_id=[candidate.id]), self._claimable(now)]),
+            )
+            points = await self._client.retrieve(
+                collection_name=self._collection_name,
+                ids=[candidate.id],
+                with_payload=["lease_token", "queue_input", "queue_priority", "queue_enqueued_at"],
+            )
+            payload = points[0].payload if points else {}
+            if payload and payload.get("lease_token") == lease_token:
+                return WorkItem(
+                    job_id=str(candidate.id),
+                    raw_input=payload.get("queue_input") or {},
+                    priority=int(payload["queue_priority"]),
+                    lease_token=lease_token,
+                    enqueued_at=payload.get("queue_enqueued_at"),
+                )
+        return None
+
+    async def heartbeat(self, item: WorkItem, lease_seconds: float) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        await self._client.set_payload(
+            collection_name=self._collection_name,
+            payload={"lease_expires_at": expires_at.isoformat()},
+            points=self._owned(item),
+        )
+
+    async def complete(self, item: WorkItem) -> None:
+        await self._client.set_payload(
+            collection_name=self._collection_name,
+            payload={
+                "queue_state": _DONE,
+                "queue_input": None,
+                "lease_owner": None,
+                "lease_token": None,
+                "lease_expires_at": None,
+            },
+            points=self._owned(item),
+        )
+
+    async def release(self, item: WorkItem) -> None:
+        await self._client.set_payload(
+            collection_name=self._collection_name,
+            payload={
+                "queue_state": _QUEUED,
+                "lease_owner": None,
+                "lease_token": None,
+                "lease_expires_at": None,
+            },
+            points=self._owned(item),
+        )
+
+    async def depth(self) -> int:
+        await self._ensure_indexes()
+        response = await self._client.count(
+            collection_name=self._collection_name,
+            count_filter=Filter(must=[FieldCondition(key="queue_state", match=MatchValue(value=_QUEUED))]),
+            exact=True,
+        )
+        return int(response.count)
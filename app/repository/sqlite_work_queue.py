@@ -0,0 +1,124 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Optional
+
+from app.domain.models import WorkItem
+from app.ports.work_queue_port import WorkQueuePort
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    job_id           TEXT PRIMARY KEY,
+    priority         INTEGER NOT NULL,
+    raw_input        TEXT NOT NULL,
+    enqueued_at      REAL NOT NULL,
+    lease_owner      TEXT,
+    lease_token      TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS work_items_claim ON work_items (priority, enqueued_at);
+"""
+
+
+class SqliteWorkQueue(WorkQueuePort):
+    """Durable work queue in a local SQLite file.
+
+    Shared by every worker process on the host. Claims run inside
+    ``BEGIN IMMEDIATE`` so two processes can never lease the same item, and
+    blocking sqlite calls are pushed onto a thread to keep the event loop free.
+    """
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _enqueue(self, job_id: str, raw_input: dict, priority: int) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO work_items (job_id, priority, raw_input, enqueued_at) VALUES (?, ?, ?, ?)",
+                (job_id, priority, json.dumps(raw_input), time.time()),
+            )
+
+    def _claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkItem]:
+        now = time.time()
+        lease_token = uuid.uuid4().hex
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT job_id, priority, raw_input, enqueued_at FROM work_items "
+                    "WHERE lease_token IS NULL OR lease_expires_at < ? "
+                    "ORDER BY priority, enqueued_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE work_items SET lease_owner = ?, lease_token = ?, lease_expires_at = ? WHERE job_id = ?",
+                        (worker_id, lease_token, now + lease_seconds, row[0]),
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return WorkItem(
+            job_id=row[0],
+            raw_input=json.loads(row[2]),
+            priority=row[1],
+            lease_token=lease_token,
+            enqueued_at=row[3],
+        )
+
+    def _heartbeat(self, item: WorkItem, lease_seconds: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE work_items SET lease_expires_at = ? WHERE job_id = ? AND lease_token = ?",
+                (time.time() + lease_seconds, item.job_id, item.lease_token),
+            )
+
+    def _complete(self, item: WorkItem) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM work_items WHERE job_id = ? AND lease_token = ?",
+                (item.job_id, item.lease_token),
+            )
+
+    def _release(self, item: WorkItem) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE work_items SET lease_owner = NULL, lease_token = NULL, lease_expires_at = NULL "
+                "WHERE job_id = ? AND lease_token = ?",
+                (item.job_id, item.lease_token),
+            )
+
+    def _depth(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM work_items WHERE lease_token IS NULL"
+            ).fetchone()
+        return int(row[0])
+
+    async def enqueue(self, job_id: str, raw_input: dict, priority: int) -> None:
+        await asyncio.to_thread(self._enqueue, job_id, raw_input, priority)
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkItem]:
+        return await asyncio.to_thread(self._claim, worker_id, lease_seconds)
+
+    async def heartbeat(self, item: WorkItem, lease_seconds: float) -> None:
+        await asyncio.to_thread(self._heartbeat, item, lease_seconds)
+
+    async def complete(self, item: WorkItem) -> None:
+        await asyncio.to_thread(self._complete, item)
+
+    async def release(self, item: WorkItem) -> None:
+        await asyncio.to_thread(self._release, item)
+
+    async def depth(self) -> int:
+        return await asyncio.to_thread(self._depth)
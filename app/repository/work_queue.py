@@ -0,0 +1,74 @@
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from typing import Optional
+
+from app.domain.models import WorkItem
+from app.ports.work_queue_port import WorkQueuePort
+
+
+class InMemoryWorkQueue(WorkQueuePort):
+    """Process-local work queue. Leases still expire, but nothing survives a restart."""
+
+    def __init__(self):
+        self._heap: list[tuple[int, int, str]] = []
+        self._items: dict[str, tuple[dict, int, float]] = {}
+        self._leases: dict[str, tuple[str, float]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    async def enqueue(self, job_id: str, raw_input: dict, priority: int) -> None:
+        with self._lock:
+            self._items[job_id] = (raw_input, priority, time.time())
+            heapq.heappush(self._heap, (priority, next(self._sequence), job_id))
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[WorkItem]:
+        now = time.monotonic()
+        with self._lock:
+            for job_id, (_, expires_at) in list(self._leases.items()):
+                if expires_at <= now:
+                    del self._leases[job_id]
+                    heapq.heappush(self._heap, (self._items[job_id][1], next(self._sequence), job_id))
+            while self._heap:
+                _, _, job_id = heapq.heappop(self._heap)
+                if job_id not in self._items or job_id in self._leases:
+                    continue
+                lease_token = uuid.uuid4().hex
+                self._leases[job_id] = (lease_token, now + lease_seconds)
+                raw_input, priority, enqueued_at = self._items[job_id]
+                return WorkItem(
+                    job_id=job_id,
+                    raw_input=raw_input,
+                    priority=priority,
+                    lease_token=lease_token,
+                    enqueued_at=enqueued_at,
+                )
+        return None
+
+    async def heartbeat(self, item: WorkItem, lease_seconds: float) -> None:
+        with self._lock:
+            lease = self._leases.get(item.job_id)
+            if lease is not None and lease[0] == item.lease_token:
+                self._leases[item.job_id] = (item.lease_token, time.monotonic() + lease_seconds)
+
+    async def complete(self, item: WorkItem) -> None:
+        with self._lock:
+            lease = self._leases.get(item.job_id)
+            if lease is None or lease[0] != item.lease_token:
+                return
+            del self._leases[item.job_id]
+            del self._items[item.job_id]
+
+    async def release(self, item: WorkItem) -> None:
+        with self._lock:
+            lease = self._leases.get(item.job_id)
+            if lease is None or lease[0] != item.lease_token:
+                return
+            del self._leases[item.job_id]
+            heapq.heappush(self._heap, (self._items[item.job_id][1], next(self._sequence), item.job_id))
+
+    async def depth(self) -> int:
+        with self._lock:
+            return len(self._items) - len(self._leases)
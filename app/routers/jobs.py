@@ -1,16 +1,35 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+import asyncio
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from app.core.config import limiter
-from app.domain.models import Job, JobStatus
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.config import limiter, settings
+from app.core.resilience import ResilienceRegistry
+from app.domain.exceptions import JobNotFoundError
+from app.domain.models import TERMINAL_STATUSES, Job, JobFilter, JobStatus
 from app.ports.job_repository_port import JobRepositoryPort
 from app.ports.normalisation_port import NormalisationPort
 from app.ports.orchestrator_port import OrchestratorPort
 from app.ports.payment_port import PaymentPort
 from app.repository.job_repo import InMemoryJobRepository
-from app.schemas.requests import StartJobRequest, ProvideInputRequest
+from app.schemas.requests import StartJobRequest, StartJobsRequest, StatusBatchRequest, ProvideInputRequest
+from app.schemas.responses import (
+    JobListResponse,
+    StartJobsItem,
+    StartJobsResponse,
+    StatusBatchItem,
+    StatusBatchResponse,
+)
 from app.services import job_service
-from app.services.agent_runner import execute_agent_task
-from app.utils.hashing import hash_inputs
+from app.services.job_events import JobEventBus
+from app.services.health_monitor import HealthMonitor
+from app.services.job_executor import JobExecutor
+from app.services.result_reuse import ResultReuse
+from app.services.orchestrator_prewarm import OrchestratorPrewarmer
+from app.utils.hashing import hash_inputs, job_etag
 from app.utils.signatures import verify_signature
 
 router = APIRouter()
@@ -32,21 +51,135 @@ def get_orchestrator(request: Request) -> OrchestratorPort:
     return request.app.state.orchestrator
 
 
+def get_events(request: Request) -> JobEventBus:
+    return request.app.state.events
+
+
+def get_executor(request: Request) -> JobExecutor:
+    return request.app.state.executor
+
+
+def get_health(request: Request) -> HealthMonitor:
+    return request.app.state.health
+
+
+def get_resilience(request: Request) -> ResilienceRegistry:
+    return request.app.state.resilience
+
+
+def get_results(request: Request) -> ResultReuse:
+    return request.app.state.results
+
+
+def get_prewarmer(request: Request) -> Optional[OrchestratorPrewarmer]:
+    return request.app.state.prewarmer
+
+
+def _start_job_inputs(body: StartJobRequest) -> dict:
+    return {
+        "target_domain": str(body.target_domain),
+        "my_product_usp": body.my_product_usp,
+        "ideal_customer_profile": body.ideal_customer_profile,
+    }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def _sse_event(job: Job) -> str:
+    return f"event: status\nid: {job.job_id}:{job.updated_at.isoformat()}\ndata: {job.model_dump_json(by_alias=True)}\n\n"
+
+
+async def _transition_stream(
+    job_ids: list[str],
+    repo: JobRepositoryPort,
+    events: JobEventBus,
+) -> AsyncIterator[str]:
+    # Each connection only waits on its own subscription; the bus's shared
+    # poller covers transitions made by other worker processes.
+    with events.subscribe(*job_ids) as transitions:
+        last_seen = {}
+        open_ids = set()
+        for job_id in job_ids:
+            # Read after subscribing so a transition that lands in between is still delivered.
+            job = await repo.get(job_id)
+            last_seen[job_id] = job.updated_at
+            if job.status not in TERMINAL_STATUSES:
+                open_ids.add(job_id)
+            yield _sse_event(job)
+
+        while open_ids:
+            try:
+                job = await asyncio.wait_for(transitions.get(), timeout=settings.events_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if job.updated_at <= last_seen[job.job_id]:
+                continue
+            last_seen[job.job_id] = job.updated_at
+            if job.status in TERMINAL_STATUSES:
+                open_ids.discard(job.job_id)
+            yield _sse_event(job)
+
+
+async def _event_stream_response(
+    job_ids: list[str],
+    repo: JobRepositoryPort,
+    events: JobEventBus,
+) -> StreamingResponse:
+    for job_id in job_ids:
+        await repo.get(job_id)  # unknown ids fail with 404 before the stream opens
+    return StreamingResponse(
+        _transition_stream(job_ids, repo, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/availability")
 async def availability(
     request: Request,
+    fresh: bool = Query(
+        default=False,
+        description="Probe dependencies live instead of using cached results. Ignored without a valid X-API-Key.",
+    ),
+    x_api_key: Optional[str] = Header(default=None),
+    health: HealthMonitor = Depends(get_health),
+    resilience: ResilienceRegistry = Depends(get_resilience),
+):
+    # The route is auth-exempt; only authenticated callers may force live upstream probes.
+    fresh = fresh and request.app.state.auth.is_authorized(x_api_key)
+    checks, checked_at = await health.results(fresh=fresh)
+    circuits = resilience.snapshot()
+    body = {"service_type": "masumi-agent", "checked_at": checked_at.isoformat(), "circuits": circuits}
+    if all(checks.values()) and all(circuit["state"] != "open" for circuit in circuits.values()):
+        return {"status": "available", **body}
+    return {"status": "degraded", **body, "details": checks}
+
+
+@router.get("/stats")
+async def stats(
     repo: JobRepositoryPort = Depends(get_repo),
-    payment: PaymentPort = Depends(get_payment),
+    events: JobEventBus = Depends(get_events),
+    executor: JobExecutor = Depends(get_executor),
     normaliser: NormalisationPort = Depends(get_normaliser),
+    results: ResultReuse = Depends(get_results),
+    payment: PaymentPort = Depends(get_payment),
+    prewarmer: Optional[OrchestratorPrewarmer] = Depends(get_prewarmer),
 ):
-    checks = {
-        "masumi": await payment.health_check(),
-        "openrouter": await normaliser.health_check(),
-        "qdrant": bool(getattr(repo, "health_check", lambda: True)()),
+    return {
+        "job_cache": repo.stats() if hasattr(repo, "stats") else None,
+        "normalisation": normaliser.stats() if hasattr(normaliser, "stats") else None,
+        "job_events": events.stats(),
+        "executor": await executor.stats(),
+        "result_reuse": results.stats(),
+        "payment": payment.stats() if hasattr(payment, "stats") else None,
+        "prewarm": prewarmer.stats() if prewarmer is not None else None,
     }
-    if all(checks.values()):
-        return {"status": "available", "service_type": "masumi-agent"}
-    return {"status": "degraded", "service_type": "masumi-agent", "details": checks}
 
 
 @router.get("/input_schema")
@@ -62,45 +195,146 @@ async def start_job(
     background_tasks: BackgroundTasks,
     repo: JobRepositoryPort = Depends(get_repo),
     payment: PaymentPort = Depends(get_payment),
+    prewarmer: Optional[OrchestratorPrewarmer] = Depends(get_prewarmer),
 ) -> Job:
-    input_hash = hash_inputs(
-        target_domain=str(body.target_domain),
-        my_product_usp=body.my_product_usp,
-        ideal_customer_profile=body.ideal_customer_profile,
+    job = await job_service.create_job(repo, payment, hash_inputs(**_start_job_inputs(body)))
+    if prewarmer is not None:
+        prewarmer.start()
+    return job
+
+
+@router.post("/start_jobs", response_model=StartJobsResponse, response_model_by_alias=True)
+@limiter.limit("5/minute")
+async def start_jobs(
+    request: Request,
+    body: StartJobsRequest,
+    repo: JobRepositoryPort = Depends(get_repo),
+    payment: PaymentPort = Depends(get_payment),
+    prewarmer: Optional[OrchestratorPrewarmer] = Depends(get_prewarmer),
+) -> StartJobsResponse:
+    inputs = [_start_job_inputs(item) for item in body.jobs]
+    outcomes = await job_service.create_jobs(
+        repo, payment, [hash_inputs(**item) for item in inputs], concurrency=settings.start_jobs_payment_concurrency
     )
-    job = await job_service.create_job(repo, payment, input_hash)
+    if prewarmer is not None and not all(isinstance(outcome, Exception) for outcome in outcomes):
+        prewarmer.start()
+    results = [
+        StartJobsItem(index=i, error=str(outcome)) if isinstance(outcome, Exception) else StartJobsItem(index=i, job=outcome)
+        for i, outcome in enumerate(outcomes)
+    ]
+    failed = sum(1 for item in results if item.error is not None)
+    return StartJobsResponse(created=len(results) - failed, failed=failed, results=results)
+
+
+@router.get(
+    "/status/{job_id}",
+    response_model=Job,
+    response_model_by_alias=True,
+    responses={304: {"description": "Job unchanged since the supplied ETag."}},
+)
+async def get_status(
+    job_id: str,
+    response: Response,
+    wait: float = Query(default=0.0, ge=0.0, le=settings.status_max_wait_seconds),
+    if_none_match: Optional[str] = Header(default=None),
+    repo: JobRepositoryPort = Depends(get_repo),
+    events: JobEventBus = Depends(get_events),
+):
+    job = await repo.get(job_id)
+    baseline = if_none_match or job_etag(job.job_id, job.updated_at)
+    if wait and job.status not in TERMINAL_STATUSES and _etag_matches(baseline, job_etag(job.job_id, job.updated_at)):
+        with events.subscribe(job_id) as transitions:
+            # Re-read after subscribing so a transition that landed in between is not missed.
+            job = await repo.get(job_id)
+            if _etag_matches(baseline, job_etag(job.job_id, job.updated_at)):
+                try:
+                    job = await asyncio.wait_for(transitions.get(), timeout=wait)
+                except asyncio.TimeoutError:
+                    # Transitions made by other workers are not published here.
+                    job = await repo.get(job_id)
+
+    etag = job_etag(job.job_id, job.updated_at)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return job
 
 
-@router.get("/status/{job_id}", response_model=Job, response_model_by_alias=True)
-def get_status(
+@router.post("/status:batch", response_model=StatusBatchResponse, response_model_by_alias=True)
+async def get_status_batch(
+    body: StatusBatchRequest,
+    repo: JobRepositoryPort = Depends(get_repo),
+) -> StatusBatchResponse:
+    job_ids = list(dict.fromkeys(body.job_ids))
+    jobs = await repo.get_many(job_ids)
+    results = [
+        StatusBatchItem(job_id=job_id, job=jobs[job_id]) if job_id in jobs
+        else StatusBatchItem(job_id=job_id, error=str(JobNotFoundError(job_id)))
+        for job_id in job_ids
+    ]
+    return StatusBatchResponse(found=len(jobs), missing=len(job_ids) - len(jobs), results=results)
+
+
+@router.get("/jobs", response_model=JobListResponse, response_model_by_alias=True)
+async def list_jobs(
+    status: list[JobStatus] = Query(default=[]),
+    input_hash: Optional[str] = Query(default=None),
+    created_after: Optional[datetime] = Query(default=None),
+    created_before: Optional[datetime] = Query(default=None),
+    updated_after: Optional[datetime] = Query(default=None),
+    updated_before: Optional[datetime] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=settings.jobs_page_max_limit),
+    cursor: Optional[str] = Query(default=None),
+    repo: JobRepositoryPort = Depends(get_repo),
+) -> JobListResponse:
+    if cursor is not None:
+        try:
+            uuid.UUID(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor.") from None
+    filters = JobFilter(
+        statuses=tuple(status),
+        input_hash=input_hash,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+    )
+    jobs, next_cursor = await repo.list_jobs(filters, limit=limit, cursor=cursor)
+    return JobListResponse(jobs=jobs, next_cursor=next_cursor)
+
+
+@router.get("/jobs/events", response_class=StreamingResponse)
+async def stream_jobs_events(
+    job_id: list[str] = Query(min_length=1, max_length=settings.events_max_jobs_per_stream),
+    repo: JobRepositoryPort = Depends(get_repo),
+    events: JobEventBus = Depends(get_events),
+) -> StreamingResponse:
+    return await _event_stream_response(list(dict.fromkeys(job_id)), repo, events)
+
+
+@router.get("/jobs/{job_id}/events", response_class=StreamingResponse)
+async def stream_job_events(
     job_id: str,
     repo: JobRepositoryPort = Depends(get_repo),
-) -> Job:
-    return repo.get(job_id)
+    events: JobEventBus = Depends(get_events),
+) -> StreamingResponse:
+    return await _event_stream_response([job_id], repo, events)
 
 
 @router.post("/provide_input", response_model=Job, response_model_by_alias=True)
 async def provide_input(
     body: ProvideInputRequest,
-    background_tasks: BackgroundTasks,
     repo: JobRepositoryPort = Depends(get_repo),
     payment: PaymentPort = Depends(get_payment),
-    normaliser: NormalisationPort = Depends(get_normaliser),
-    orchestrator: OrchestratorPort = Depends(get_orchestrator),
+    executor: JobExecutor = Depends(get_executor),
 ) -> Job:
-    job = repo.get(body.job_id)
+    job = await repo.get(body.job_id)
     verify_signature(body.job_id, body.signature)
     paid = await job_service.verify_payment(payment, job.blockchain_identifier)
     if not paid:
         raise HTTPException(status_code=402, detail="Payment is not yet confirmed on-chain.")
-    updated = job_service.advance_job_state(repo, body.job_id, JobStatus.RUNNING)
-    background_tasks.add_task(
-        execute_agent_task,
-        body.job_id,
-        repo,
-        normaliser,
-        orchestrator,
-        body.data,
-    )
+    async with executor.reserve():
+        updated = await job_service.advance_job_state(repo, body.job_id, JobStatus.RUNNING)
+        await executor.submit(body.job_id, body.data, priority=updated.submit_result_time)
     return updated
\ No newline at end of file
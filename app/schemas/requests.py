@@ -21,6 +21,26 @@ class StartJobRequest(BaseModel):
     )
 
 
+class StartJobsRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    jobs: list[StartJobRequest] = Field(
+        min_length=1,
+        max_length=100,
+        description='Jobs to start; each is validated like a single /start_job body.',
+    )
+
+
+class StatusBatchRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    job_ids: list[str] = Field(
+        min_length=1,
+        max_length=500,
+        description='Job ids to look up; unknown ids are reported inline.',
+    )
+
+
 class ProvideInputRequest(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
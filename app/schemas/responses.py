@@ -0,0 +1,37 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.domain.models import Job
+
+
+class StartJobsItem(BaseModel):
+    index: int = Field(description='Position of the item in the request.')
+    job: Optional[Job] = None
+    error: Optional[str] = None
+
+
+class StartJobsResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[StartJobsItem]
+
+
+class StatusBatchItem(BaseModel):
+    job_id: str
+    job: Optional[Job] = None
+    error: Optional[str] = None
+
+
+class StatusBatchResponse(BaseModel):
+    found: int
+    missing: int
+    results: list[StatusBatchItem]
+
+
+class JobListResponse(BaseModel):
+    jobs: list[Job]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description='Pass as ``cursor`` to fetch the next page; absent on the last page.',
+    )
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
 
+from app.core.config import settings
+from app.domain.exceptions import StageDeadlineError
 from app.domain.models import JobStatus
 from app.ports.job_repository_port import JobRepositoryPort
 from app.ports.normalisation_port import NormalisationPort
 from app.ports.orchestrator_port import OrchestratorPort
 from app.services import job_service
+from app.services.result_reuse import ResultReuse
+
+T = TypeVar("T")
+
+
+async def _run_stage(
+  stage: str,
+  start: Callable[[], Awaitable[T]],
+  deadline: float,
+  stage_timeout: float,
+) -> T:
+  """Run one pipeline stage within its own timeout and the job's deadline."""
+  remaining = deadline - time.time()
+  if remaining <= 0:
+    raise StageDeadlineError(stage, "submit_result_time has passed")
+  timeout = min(stage_timeout, remaining)
+  try:
+    return await asyncio.wait_for(start(), timeout=timeout)
+  except asyncio.TimeoutError:
+    reason = "submit_result_time reached" if timeout < stage_timeout else f"timed out after {stage_timeout:g}s"
+    raise StageDeadlineError(stage, reason) from None
 
 
 async def execute_agent_task(
@@ -15,19 +40,44 @@ async def execute_agent_task(
   normaliser: NormalisationPort,
   orchestrator: OrchestratorPort,
   raw_input: dict,
+  results: Optional[ResultReuse] = None,
 ) -> None:
-  await asyncio.sleep(5)
+  job = await repo.get(job_id)
+  if job.status != JobStatus.RUNNING:
+    # Already finished elsewhere, e.g. failed by the stale-job sweeper.
+    return
+  if settings.agent_start_delay_seconds > 0:
+    await asyncio.sleep(settings.agent_start_delay_seconds)
+
+  deadline = float(job.submit_result_time)
+
+  async def pipeline() -> str:
+    normalised = await _run_stage(
+      "normalise",
+      lambda: normaliser.normalise(raw_input),
+      deadline,
+      settings.normalise_timeout_seconds,
+    )
+    return await _run_stage(
+      "orchestrate",
+      lambda: orchestrator.execute(job_id, normalised),
+      deadline,
+      settings.orchestrate_timeout_seconds,
+    )
+
   try:
-    normalised = await normaliser.normalise(raw_input)
-    result = await orchestrator.execute(job_id, normalised)
-    job_service.advance_job_state(
+    if results is None:
+      result = await pipeline()
+    else:
+      result = await results.run(repo, job, pipeline, deadline)
+    await job_service.advance_job_state(
       repo,
       job_id,
       JobStatus.COMPLETED,
       result=result,
     )
   except Exception as exc:
-    job_service.advance_job_state(
+    await job_service.advance_job_state(
       repo,
       job_id,
       JobStatus.FAILED,
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Awaitable[bool]]
+
+
+class HealthMonitor:
+    """Concurrent dependency probes with cached, timestamped results.
+
+    ``refresh`` runs every probe at once, each under ``timeout_seconds``, so
+    a check costs the slowest dependency rather than the sum of all of them.
+    Concurrent refreshes share one round of probes. ``run`` keeps the cache
+    warm in the background so /availability can answer from memory.
+    """
+
+    def __init__(self, probes: dict[str, Probe], timeout_seconds: float, max_age_seconds: float):
+        self._probes = probes
+        self._timeout_seconds = timeout_seconds
+        self._max_age_seconds = max_age_seconds
+        self._results: dict[str, bool] = {}
+        self._checked_at: Optional[datetime] = None
+        self._checked_monotonic = 0.0
+        self._refreshing: Optional[asyncio.Task[None]] = None
+
+    async def _probe(self, name: str, probe: Probe) -> bool:
+        try:
+            return bool(await asyncio.wait_for(probe(), timeout=self._timeout_seconds))
+        except Exception:
+            logger.warning("Health probe failed", extra={"job_id": f"health:{name}"})
+            return False
+
+    async def _refresh(self) -> None:
+        names = list(self._probes)
+        outcomes = await asyncio.gather(*(self._probe(name, self._probes[name]) for name in names))
+        self._results = dict(zip(names, outcomes))
+        self._checked_at = datetime.now(timezone.utc)
+        self._checked_monotonic = time.monotonic()
+
+    async def refresh(self) -> None:
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refreshing)
+
+    @property
+    def is_stale(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_monotonic > self._max_age_seconds
+
+    async def results(self, fresh: bool = False) -> tuple[dict[str, bool], datetime]:
+        if fresh or self.is_stale:
+            await self.refresh()
+        return dict(self._results), self._checked_at
+
+    async def run(self, interval_seconds: float) -> None:
+        """Refresh forever; cancelled on shutdown."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health refresh failed", extra={"job_id": "health"})
+            await asyncio.sleep(interval_seconds)
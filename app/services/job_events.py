@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+from app.domain.models import Job
+from app.ports.job_repository_port import JobRepositoryPort
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobSubscription:
+    """Latest pending snapshot per watched job, delivered oldest job first.
+
+    A newer snapshot replaces the pending one for the same job instead of
+    queueing behind it, so memory is bounded by the number of watched jobs
+    and a burst on one job can never push out another job's terminal state.
+    """
+
+    def __init__(self):
+        self._pending: dict[str, Job] = {}
+        self._ready = asyncio.Event()
+
+    def put(self, job: Job) -> None:
+        current = self._pending.get(job.job_id)
+        if current is None or job.updated_at >= current.updated_at:
+            self._pending[job.job_id] = job
+        self._ready.set()
+
+    async def get(self) -> Job:
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        job_id = next(iter(self._pending))
+        return self._pending.pop(job_id)
+
+
+class JobEventBus:
+    """In-process fan-out of job state transitions.
+
+    Each subscriber gets a ``JobSubscription`` for the job ids it asked for.
+    Publishing never blocks; a slow subscriber only ever holds the latest
+    snapshot of each job, since only the latest state matters. Transitions
+    made by other worker processes never pass through this bus, so
+    ``run_poller`` re-reads every watched job with one ``get_many`` per
+    interval and publishes whatever moved on.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[JobSubscription]] = defaultdict(set)
+        self._latest: dict[str, datetime] = {}
+        self._polls = 0
+        self._polled_transitions = 0
+
+    @contextmanager
+    def subscribe(self, *job_ids: str) -> Iterator[JobSubscription]:
+        subscription = JobSubscription()
+        for job_id in job_ids:
+            self._subscribers[job_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            for job_id in job_ids:
+                subscriptions = self._subscribers.get(job_id)
+                if subscriptions is None:
+                    continue
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[job_id]
+                    self._latest.pop(job_id, None)
+
+    def publish(self, job: Job) -> None:
+        subscriptions = self._subscribers.get(job.job_id)
+        if not subscriptions:
+            return
+        latest = self._latest.get(job.job_id)
+        if latest is None or job.updated_at > latest:
+            self._latest[job.job_id] = job.updated_at
+        for subscription in tuple(subscriptions):
+            subscription.put(job)
+
+    async def poll(self, repo: JobRepositoryPort) -> int:
+        """Publish watched jobs that changed without a local publish; returns how many."""
+        job_ids = sorted(self._subscribers)
+        if not job_ids:
+            return 0
+        self._polls += 1
+        published = 0
+        for job in (await repo.get_many(job_ids)).values():
+            latest = self._latest.get(job.job_id)
+            if latest is None or job.updated_at > latest:
+                self.publish(job)
+                published += 1
+        self._polled_transitions += published
+        return published
+
+    async def run_poller(self, repo: JobRepositoryPort, interval_seconds: float) -> None:
+        """Poll forever; cancelled on shutdown."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.poll(repo)
+            except Exception:
+                logger.exception("Job event poll failed", extra={"job_id": "events"})
+
+    def stats(self) -> dict:
+        return {
+            "watched_jobs": len(self._subscribers),
+            "subscriptions": sum(len(subscriptions) for subscriptions in self._subscribers.values()),
+            "polls": self._polls,
+            "polled_transitions": self._polled_transitions,
+        }
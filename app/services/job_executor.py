@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from app.domain.exceptions import ExecutorSaturatedError
+from app.domain.models import WorkItem
+from app.ports.work_queue_port import WorkQueuePort
+
+
+logger = logging.getLogger(__name__)
+
+Runner = Callable[[str, dict], Awaitable[None]]
+
+
+class JobExecutor:
+    """Bounded asyncio worker pool that drains a WorkQueuePort.
+
+    Lower priority values run first; callers pass the job's MIP-003
+    ``submit_result_time`` so the nearest deadline is served first. Each
+    claimed item is leased and kept alive by heartbeats while it runs, so with
+    a durable queue a crashed worker's jobs are picked up by any other worker
+    once the lease lapses. Workers are started lazily on the first submit or
+    ``start`` call, so the executor works whether or not the lifespan ran.
+    On shutdown workers stop claiming and in-flight items get a grace period;
+    an item still running after it is released back to the queue, not
+    completed, so another worker picks it up.
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueuePort,
+        runner: Runner,
+        concurrency: int,
+        max_queue: int,
+        retry_after_seconds: int,
+        lease_seconds: float,
+        poll_interval_seconds: float,
+    ):
+        self._queue = queue
+        self._runner = runner
+        self._concurrency = concurrency
+        self._max_queue = max_queue
+        self._retry_after_seconds = retry_after_seconds
+        self._lease_seconds = lease_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._workers: list[asyncio.Task[None]] = []
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._capacity_lock = asyncio.Lock()
+        self._reserved = 0
+        self._claiming = 0
+        self._running = 0
+        self._started = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @asynccontextmanager
+    async def reserve(self) -> AsyncIterator[None]:
+        """Hold one queue slot for a ``submit`` made inside the block.
+
+        Raises ExecutorSaturatedError when the queue is full. Taken before a
+        job is moved to RUNNING, so a rejected request leaves the job
+        untouched and the client can retry. The check and the reservation
+        happen under one lock, so concurrent requests cannot all pass the
+        check and overfill the queue.
+        """
+        async with self._capacity_lock:
+            if await self._queue.depth() + self._reserved >= self._max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(retry_after=self._retry_after_seconds)
+            self._reserved += 1
+        try:
+            yield
+        finally:
+            self._reserved -= 1
+
+    async def submit(self, job_id: str, raw_input: dict, priority: int = 0) -> None:
+        self.start()
+        await self._queue.enqueue(job_id, raw_input, priority)
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-executor-{i}")
+            for i in range(self._concurrency)
+        ]
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            self._claiming += 1
+            try:
+                item = await self._queue.claim(self._worker_id, self._lease_seconds)
+            except Exception:
+                logger.exception("Work queue claim failed", extra={"job_id": "executor"})
+                item = None
+            finally:
+                self._claiming -= 1
+            if item is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(item)
+
+    async def _run(self, item: WorkItem) -> None:
+        if item.enqueued_at is not None:
+            # Wall clock, since the item may have been queued by another process.
+            waited = max(time.time() - item.enqueued_at, 0.0)
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        self._started += 1
+        self._running += 1
+        finished = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(item, finished))
+        done = self._queue.complete
+        try:
+            await self._runner(item.job_id, item.raw_input)
+        except asyncio.CancelledError:
+            # Interrupted, not finished: hand the job back instead of dropping it.
+            done = self._queue.release
+            raise
+        except Exception:
+            logger.exception("Executor work item failed", extra={"job_id": item.job_id})
+        finally:
+            finished.set()
+            await heartbeat
+            try:
+                await done(item)
+            except Exception:
+                logger.exception("Work queue completion failed", extra={"job_id": item.job_id})
+            self._running -= 1
+
+    async def _heartbeat(self, item: WorkItem, finished: asyncio.Event) -> None:
+        interval = self._lease_seconds / 3
+        while not finished.is_set():
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                try:
+                    await self._queue.heartbeat(item, self._lease_seconds)
+                except Exception:
+                    logger.exception("Work queue heartbeat failed", extra={"job_id": item.job_id})
+
+    async def shutdown(self, grace_seconds: float = 0.0) -> None:
+        """Stop claiming, let running items finish for up to ``grace_seconds``, then cancel."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._workers and grace_seconds > 0:
+            await asyncio.wait(self._workers, timeout=grace_seconds)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def stats(self) -> dict:
+        return {
+            "worker_id": self._worker_id,
+            "concurrency": self._concurrency,
+            "max_queue": self._max_queue,
+            "queue_depth": await self._queue.depth(),
+            "reserved": self._reserved,
+            "claiming": self._claiming,
+            "running": self._running,
+            "started": self._started,
+            "rejected": self._rejected,
+            "wait_seconds_avg": self._total_wait / self._started if self._started else 0.0,
+            "wait_seconds_max": self._max_wait,
+        }
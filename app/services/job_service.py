@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import Optional, Union
 
-from app.domain.models import Job, JobStatus
+from app.domain.models import Job, JobStatus, NewJob
 from app.ports.job_repository_port import JobRepositoryPort
 from app.ports.payment_port import PaymentPort
 
 
-async def create_job(
-    repo: JobRepositoryPort,
-    payment_port: PaymentPort,
-    input_hash: str,
-) -> Job:
-    data = await payment_port.create_payment_request(input_hash)
-    return repo.create(
+def _new_job(input_hash: str, data: dict) -> NewJob:
+    return NewJob(
         input_hash=input_hash,
         blockchain_identifier=data["blockchainIdentifier"],
         pay_by_time=int(data["payByTime"]),
@@ -23,14 +19,51 @@ async def create_job(
     )
 
 
-def advance_job_state(
+async def create_job(
+    repo: JobRepositoryPort,
+    payment_port: PaymentPort,
+    input_hash: str,
+) -> Job:
+    data = await payment_port.create_payment_request(input_hash)
+    new_job = _new_job(input_hash, data)
+    return await repo.create(**new_job.model_dump())
+
+
+async def create_jobs(
+    repo: JobRepositoryPort,
+    payment_port: PaymentPort,
+    input_hashes: list[str],
+    concurrency: int,
+) -> list[Union[Job, Exception]]:
+    """Create one job per input hash; a failed payment request fails only its own item.
+
+    Payment requests run concurrently, at most ``concurrency`` at a time, and
+    every job that got one is written in a single ``create_many``. Results
+    are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request(input_hash: str) -> NewJob:
+        async with semaphore:
+            data = await payment_port.create_payment_request(input_hash)
+        return _new_job(input_hash, data)
+
+    outcomes = await asyncio.gather(*(_request(h) for h in input_hashes), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+    created = iter(await repo.create_many([o for o in outcomes if isinstance(o, NewJob)]))
+    return [outcome if isinstance(outcome, Exception) else next(created) for outcome in outcomes]
+
+
+async def advance_job_state(
     repo: JobRepositoryPort,
     job_id: str,
     target: JobStatus,
     result: Optional[str] = None,
     error: Optional[str] = None,
 ) -> Job:
-    return repo.update_status(job_id, target, result=result, error=error)
+    return await repo.update_status(job_id, target, result=result, error=error)
 
 
 async def verify_payment(payment_port: PaymentPort, blockchain_identifier: str) -> bool:
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.ports.job_repository_port import JobRepositoryPort
+
+
+logger = logging.getLogger(__name__)
+
+
+async def run_stale_job_sweeper(
+    repo: JobRepositoryPort,
+    timeout_minutes: int,
+    interval_seconds: float,
+) -> None:
+    """Periodically fail RUNNING jobs whose worker stopped updating them.
+
+    Runs until cancelled. A failed sweep is logged and retried on the next
+    tick so a transient Qdrant outage never kills the loop.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            recovered = await repo.recover_stale_running_jobs(timeout_minutes=timeout_minutes)
+        except Exception:
+            logger.exception("Stale job sweep failed", extra={"job_id": "sweeper"})
+            continue
+        if recovered:
+            logger.info(
+                "Stale job sweep complete",
+                extra={"job_id": "sweeper", "from_state": "running", "to_state": f"failed:{recovered}"},
+            )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.ports.orchestrator_port import OrchestratorPort
+
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestratorPrewarmer:
+    """Open a pooled orchestrator connection while new jobs await payment.
+
+    ``start`` is called as jobs are created, so the connection is usually
+    established by the time payment clears and the job reaches the
+    orchestrator. Only one warm runs at a time, since one open connection is
+    all a warm buys; calls made while one is in flight are counted and dropped.
+    """
+
+    def __init__(self, orchestrator: OrchestratorPort):
+        self._orchestrator = orchestrator
+        self._warming: Optional[asyncio.Task[None]] = None
+        self._started = 0
+        self._skipped = 0
+        self._failed = 0
+
+    def stats(self) -> dict:
+        return {
+            "started": self._started,
+            "skipped": self._skipped,
+            "failed": self._failed,
+            "in_flight": self._warming is not None,
+        }
+
+    async def _warm(self) -> None:
+        try:
+            await self._orchestrator.warm()
+        except Exception:
+            self._failed += 1
+            logger.warning("Orchestrator pre-warm failed", extra={"job_id": "prewarm"})
+
+    def _finished(self, task: asyncio.Task[None]) -> None:
+        if self._warming is task:
+            self._warming = None
+
+    def start(self) -> None:
+        if self._warming is not None:
+            self._skipped += 1
+            return
+        self._started += 1
+        self._warming = asyncio.create_task(self._warm(), name="orchestrator-prewarm")
+        self._warming.add_done_callback(self._finished)
+
+    async def shutdown(self) -> None:
+        if self._warming is None:
+            return
+        self._warming.cancel()
+        await asyncio.gather(self._warming, return_exceptions=True)
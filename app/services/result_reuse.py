@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.domain.exceptions import StageDeadlineError
+from app.domain.models import Job
+from app.ports.job_repository_port import JobRepositoryPort
+
+
+class ResultReuse:
+    """Serve identical jobs from one pipeline run.
+
+    A job whose ``input_hash`` matches a job COMPLETED within
+    ``window_seconds`` takes that job's result without running anything.
+    Identical jobs running at the same time in this process share a single
+    in-flight execution; if the leading run fails, each follower runs the
+    pipeline itself rather than inheriting another job's error.
+    """
+
+    def __init__(self, window_seconds: float):
+        self._window_seconds = window_seconds
+        self._inflight: dict[str, asyncio.Future[Optional[str]]] = {}
+        self._executed = 0
+        self._reused = 0
+        self._coalesced = 0
+
+    def stats(self) -> dict:
+        return {
+            "window_seconds": self._window_seconds,
+            "inflight": len(self._inflight),
+            "executed": self._executed,
+            "reused": self._reused,
+            "coalesced": self._coalesced,
+        }
+
+    async def run(
+        self,
+        repo: JobRepositoryPort,
+        job: Job,
+        compute: Callable[[], Awaitable[str]],
+        deadline: float,
+    ) -> str:
+        if self._window_seconds <= 0:
+            self._executed += 1
+            return await compute()
+
+        completed_after = datetime.now(timezone.utc) - timedelta(seconds=self._window_seconds)
+        previous = await repo.find_completed_by_input_hash(job.input_hash, completed_after)
+        if previous is not None and previous.result is not None:
+            self._reused += 1
+            return previous.result
+
+        leader = self._inflight.get(job.input_hash)
+        if leader is not None:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(leader), timeout=max(deadline - time.time(), 0))
+            except asyncio.TimeoutError:
+                raise StageDeadlineError("coalesce", "submit_result_time reached") from None
+            if result is not None:
+                self._coalesced += 1
+                return result
+            self._executed += 1
+            return await compute()
+
+        future: asyncio.Future[Optional[str]] = asyncio.get_running_loop().create_future()
+        self._inflight[job.input_hash] = future
+        result = None
+        try:
+            self._executed += 1
+            result = await compute()
+            return result
+        finally:
+            del self._inflight[job.input_hash]
+            future.set_result(result)
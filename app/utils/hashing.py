@@ -1,5 +1,6 @@
 import hashlib
 import json
+from datetime import datetime
 
 
 def hash_inputs(
@@ -18,3 +19,23 @@ def hash_inputs(
     }
     canonical = json.dumps(canonical_payload, sort_keys=True, separators=(',', ':'))
     return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def job_etag(job_id: str, updated_at: datetime) -> str:
+    """
+    Strong HTTP entity tag for a job snapshot.
+    updated_at changes on every transition, so the tag changes exactly
+    when the job does.
+    """
+    digest = hashlib.sha256(f"{job_id}:{updated_at.isoformat()}".encode('utf-8')).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def normalisation_cache_key(raw_input: dict, model: str) -> str:
+    """
+    Content address of a normalisation result.
+    The model is part of the key so a model change never serves output
+    produced by another model.
+    """
+    canonical = json.dumps({'input': raw_input, 'model': model}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
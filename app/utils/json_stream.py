@@ -0,0 +1,129 @@
+import json
+from typing import Optional
+
+
+_WHITESPACE = " \t\r\n"
+_FENCE = "```"
+
+
+class JsonStreamError(ValueError):
+    """The streamed text is not (or is no longer) the expected JSON object."""
+
+
+class IncrementalJsonObject:
+    """Scan a JSON object arriving in chunks, one character at a time.
+
+    ``feed`` returns the object as soon as every key in ``required_keys`` has
+    a complete value, even if the model is still generating more members, and
+    raises JsonStreamError the moment the text stops looking like one JSON
+    object. A leading markdown code fence is tolerated. Each member boundary
+    at the top level is checked by parsing the prefix closed with ``}``, so
+    the cost is one ``json.loads`` per top-level member.
+    """
+
+    def __init__(self, required_keys: tuple[str, ...], max_chars: int = 16_384):
+        self._required_keys = required_keys
+        self._max_chars = max_chars
+        self._preamble = ""
+        self._buffer: list[str] = []
+        self._size = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._in_value = False
+        self._checked = False
+        self._fenced = False
+
+    @property
+    def closed(self) -> bool:
+        """True once the object's closing brace has been read."""
+        return self._started and self._depth == 0
+
+    def _prefix_object(self) -> Optional[dict]:
+        text = "".join(self._buffer)
+        try:
+            parsed = json.loads(text if self._depth == 0 else text + "}")
+        except ValueError:
+            raise JsonStreamError("streamed JSON object is malformed") from None
+        if not isinstance(parsed, dict):
+            raise JsonStreamError("streamed JSON is not an object")
+        if all(key in parsed for key in self._required_keys):
+            return parsed
+        if self._depth == 0:
+            raise JsonStreamError("streamed JSON object is missing required keys")
+        return None
+
+    def _start(self, char: str) -> None:
+        self._preamble += char
+        stripped = self._preamble.lstrip(_WHITESPACE)
+        if not stripped or (not self._fenced and _FENCE.startswith(stripped)):
+            return
+        if not self._fenced and stripped.startswith(_FENCE):
+            # Skip a ```json fence line; the object starts on the next line.
+            if char == "\n":
+                self._fenced = True
+                self._preamble = ""
+            return
+        if stripped != "{":
+            raise JsonStreamError("stream does not start with a JSON object")
+        self._started = True
+        self._depth = 1
+        self._buffer.append("{")
+        self._size = 1
+
+    def _member_done(self) -> Optional[dict]:
+        self._checked = True
+        return self._prefix_object()
+
+    def _scan(self, char: str) -> Optional[dict]:
+        self._buffer.append(char)
+        self._size += 1
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 1 and self._in_value:
+                    return self._member_done()
+            return None
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 0 and self._checked:
+                # The last member was already checked; what is left is just the close.
+                raise JsonStreamError("streamed JSON object is missing required keys")
+            if self._depth <= 1:
+                return self._member_done()
+        elif self._depth == 1:
+            if char == ":":
+                self._in_value = True
+                self._checked = False
+            elif char == ",":
+                self._in_value = False
+                if self._checked:
+                    return None
+                self._buffer.pop()
+                parsed = self._member_done()
+                self._buffer.append(",")
+                return parsed
+            elif not self._in_value and char not in _WHITESPACE:
+                raise JsonStreamError("unexpected text between JSON object members")
+        return None
+
+    def feed(self, text: str) -> Optional[dict]:
+        for char in text:
+            if not self._started:
+                self._start(char)
+                continue
+            parsed = self._scan(char)
+            if parsed is not None:
+                return parsed
+            if self._size > self._max_chars:
+                raise JsonStreamError("streamed JSON object is too large")
+        return None
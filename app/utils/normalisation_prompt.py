@@ -0,0 +1,137 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+
+SCHEMA_KEYS = ("target_domain", "my_product_usp", "ideal_customer_profile")
+_MAX_FIELD_CHARS = 500  # StartJobRequest max_length for the text fields
+_MAX_KEY_CHARS = 100
+_TOKEN_PIECES = re.compile(r"\w+|[^\w\s]")
+
+SYSTEM_PROMPT = (
+    "You normalise job inputs for a lead-generation agent. "
+    "Reply with one JSON object and nothing else, with exactly these keys: "
+    "target_domain (the company's website as an absolute https URL), "
+    "my_product_usp (the seller's unique selling proposition, at most 500 characters), "
+    "ideal_customer_profile (who the seller wants to reach, at most 500 characters). "
+    "Map differently named or nested input fields onto these keys, fix obvious typos "
+    "and whitespace, and ignore anything unrelated."
+)
+BATCH_INSTRUCTIONS = (
+    "This request holds several inputs under \"items\", each with an \"id\". "
+    "Instead of a single object, reply with {\"results\": [...]}: one object per item, "
+    "carrying that item's \"id\" and its normalised keys."
+)
+
+
+def count_tokens(text: str) -> int:
+    """
+    Local, dependency-free token estimate.
+    Every word costs one token per four characters and every punctuation
+    mark one token, which tracks BPE tokenisers closely enough for budgeting.
+    """
+    tokens = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        is_word = piece[0].isalnum() or piece[0] == "_"
+        tokens += len(piece) // 4 + 1 if is_word else 1
+    return tokens
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class NormalisationPrompt:
+    messages: list[dict]
+    prompt_tokens: int
+    raw_tokens: int
+    truncated_fields: int
+    dropped_keys: int
+
+
+def compact_input(raw_input: dict, max_tokens: int) -> tuple[dict, int, int]:
+    """Trim ``raw_input`` to what the normaliser needs, within ``max_tokens``.
+
+    Text longer than the StartJobRequest limit is cut to it, and nested values
+    are flattened to JSON text and cut the same way. Schema keys always stay;
+    other keys are kept in input order while they fit the budget. Returns the
+    compacted input and the number of truncated fields and dropped keys.
+    """
+    truncated = 0
+    dropped = 0
+    compacted: dict = {}
+    used = 2  # the enclosing braces
+    ordered = [key for key in SCHEMA_KEYS if key in raw_input]
+    ordered += [key for key in raw_input if key not in SCHEMA_KEYS]
+    for key in ordered:
+        if not isinstance(key, str) or len(key) > _MAX_KEY_CHARS:
+            dropped += 1
+            continue
+        value = raw_input[key]
+        if isinstance(value, (dict, list)) and len(_dump(value)) > _MAX_FIELD_CHARS:
+            value = _dump(value)
+        cut = isinstance(value, str) and len(value) > _MAX_FIELD_CHARS
+        if cut:
+            value = value[:_MAX_FIELD_CHARS]
+        cost = count_tokens(f"{_dump(key)}:{_dump(value)},")
+        if key not in SCHEMA_KEYS and used + cost > max_tokens:
+            dropped += 1
+            continue
+        compacted[key] = value
+        truncated += cut
+        used += cost
+    return compacted, truncated, dropped
+
+
+def _system_message(cache_prefix: bool, *suffix: str) -> dict:
+    if not cache_prefix:
+        return {"role": "system", "content": " ".join((SYSTEM_PROMPT, *suffix))}
+    parts = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+    return {"role": "system", "content": parts + [{"type": "text", "text": text} for text in suffix]}
+
+
+def build_normalisation_prompt(raw_input: dict, max_tokens: int, cache_prefix: bool) -> NormalisationPrompt:
+    """
+    Chat messages for one normalisation call.
+    The static instructions travel alone in the system message, byte-identical
+    on every call, so providers can serve them from their prompt cache; with
+    ``cache_prefix`` they also carry an explicit cache breakpoint.
+    """
+    compacted, truncated, dropped = compact_input(raw_input, max_tokens)
+    user_content = _dump(compacted)
+    system_tokens = count_tokens(SYSTEM_PROMPT)
+    return NormalisationPrompt(
+        messages=[_system_message(cache_prefix), {"role": "user", "content": user_content}],
+        prompt_tokens=system_tokens + count_tokens(user_content),
+        raw_tokens=system_tokens + count_tokens(_dump(raw_input)),
+        truncated_fields=truncated,
+        dropped_keys=dropped,
+    )
+
+
+def build_batch_normalisation_prompt(raw_inputs: list[dict], max_tokens: int, cache_prefix: bool) -> NormalisationPrompt:
+    """
+    Chat messages that normalise several inputs in one call.
+    Items are keyed by their position as a string id, each compacted to
+    ``max_tokens`` on its own. The batch instructions follow the single-call
+    instructions, so both kinds of call share one cacheable prefix.
+    """
+    items = []
+    truncated = dropped = 0
+    for index, raw_input in enumerate(raw_inputs):
+        compacted, item_truncated, item_dropped = compact_input(raw_input, max_tokens)
+        items.append({"id": str(index), "input": compacted})
+        truncated += item_truncated
+        dropped += item_dropped
+    user_content = _dump({"items": items})
+    system_tokens = count_tokens(SYSTEM_PROMPT) + count_tokens(BATCH_INSTRUCTIONS)
+    raw_items = [{"id": str(index), "input": raw_input} for index, raw_input in enumerate(raw_inputs)]
+    return NormalisationPrompt(
+        messages=[_system_message(cache_prefix, BATCH_INSTRUCTIONS), {"role": "user", "content": user_content}],
+        prompt_tokens=system_tokens + count_tokens(user_content),
+        raw_tokens=system_tokens + count_tokens(_dump({"items": raw_items})),
+        truncated_fields=truncated,
+        dropped_keys=dropped,
+    )
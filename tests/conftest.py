@@ -1,7 +1,12 @@
+import asyncio
+from asyncio import sleep as real_sleep
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.core.config import limiter
+from app.core.http import HttpClientManager
 
 # Dummy payload matching the masumi SDK response shape.
 # payByTime = year 2286 — always passes test_pay_by_time_is_future.
@@ -16,6 +21,27 @@ MOCK_PAYMENT_DATA = {
 }
 
 
+def open_http(handler) -> HttpClientManager:
+    """An opened HttpClientManager whose upstreams are all served by ``handler``."""
+    http = HttpClientManager(transport=httpx.MockTransport(handler))
+    http.open()
+    return http
+
+
+async def drain_executor(executor, timeout: float = 5.0) -> None:
+    """Wait until the executor has nothing queued, being claimed or running."""
+
+    async def _idle() -> None:
+        while True:
+            stats = await executor.stats()
+            if not (stats["queue_depth"] or stats["claiming"] or stats["running"]):
+                return
+            # asyncio.sleep is patched below, so poll with the real one.
+            await real_sleep(0.01)
+
+    await asyncio.wait_for(_idle(), timeout=timeout)
+
+
 @pytest.fixture(autouse=True)
 def mock_payment_sdk():
     """Patch masumi.Payment.create_payment_request for ALL tests.
@@ -49,8 +75,8 @@ def mock_qdrant_client():
 def mock_agent_sleep():
     """Patch asyncio.sleep inside agent_runner for ALL tests.
 
-    Prevents any real 5-second pause when execute_agent_task is invoked
-    directly inside a test.
+    Prevents any real pause when execute_agent_task is invoked with a
+    configured start delay inside a test.
     """
     with patch(
         "app.services.agent_runner.asyncio.sleep",
@@ -3,7 +3,7 @@ import pytest
 from datetime import datetime
 from pydantic import ValidationError
 
-from app.domain.models import Job, JobStatus, validate_transition
+from app.domain.models import LEGAL_SOURCES, LEGAL_TRANSITIONS, Job, JobStatus, validate_transition
 from app.domain.exceptions import InvalidStateTransitionError
 
 
@@ -101,3 +101,12 @@ def test_invalid_transition_error_attributes():
     except InvalidStateTransitionError as e:
         assert e.from_state == "completed"
         assert e.to_state == "running"
+
+
+# TC-1.7: LEGAL_SOURCES is the exact reverse of LEGAL_TRANSITIONS
+def test_legal_sources_mirror_transitions():
+    assert set(LEGAL_SOURCES) == set(JobStatus)
+    for target, sources in LEGAL_SOURCES.items():
+        for source in JobStatus:
+            assert (source in sources) == (target in LEGAL_TRANSITIONS[source])
+    assert LEGAL_SOURCES[JobStatus.AWAITING_PAYMENT] == []
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from app.domain.exceptions import InvalidStateTransitionError
+from app.domain.models import JobStatus
+from app.repository.cached_job_repo import CachedJobRepository
+from app.repository.job_repo import InMemoryJobRepository
+
+
+class _CountingRepo(InMemoryJobRepository):
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, job_id: str):
+        self.gets += 1
+        return await super().get(job_id)
+
+
+class _SlowReadRepo(InMemoryJobRepository):
+    """Fetches the snapshot, then waits before returning it."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetched = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def get(self, job_id: str):
+        job = await super().get(job_id)
+        self.fetched.set()
+        await self.release.wait()
+        return job
+
+    async def get_many(self, job_ids: list[str]):
+        jobs = await super().get_many(job_ids)
+        self.fetched.set()
+        await self.release.wait()
+        return jobs
+
+
+async def _make_job(repo):
+    return await repo.create(
+        input_hash="c" * 64,
+        blockchain_identifier="mock_bc_cache",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_cache",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_polls_after_create_without_touching_inner():
+    inner = _CountingRepo()
+    repo = CachedJobRepository(inner, max_entries=10, ttl_seconds=60)
+    job = await _make_job(repo)
+
+    for _ in range(5):
+        assert (await repo.get(job.job_id)).job_id == job.job_id
+
+    assert inner.gets == 0
+    assert repo.stats()["hits"] == 5
+    assert repo.stats()["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_writes_through_transitions():
+    repo = CachedJobRepository(_CountingRepo(), max_entries=10, ttl_seconds=60)
+    job = await _make_job(repo)
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo.update_status(job.job_id, JobStatus.COMPLETED, result="done")
+
+    cached = await repo.get(job.job_id)
+    assert cached.status == JobStatus.COMPLETED
+    assert cached.result == "done"
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_non_terminal_but_keeps_terminal():
+    inner = _CountingRepo()
+    repo = CachedJobRepository(inner, max_entries=10, ttl_seconds=0)
+    pending = await _make_job(repo)
+    done = await _make_job(repo)
+    await repo.update_status(done.job_id, JobStatus.RUNNING)
+    await repo.update_status(done.job_id, JobStatus.FAILED, error="boom")
+
+    await repo.get(pending.job_id)
+    await repo.get(done.job_id)
+
+    assert inner.gets == 1
+    assert repo.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_counts_evictions():
+    inner = _CountingRepo()
+    repo = CachedJobRepository(inner, max_entries=2, ttl_seconds=60)
+    first = await _make_job(repo)
+    await _make_job(repo)
+    await _make_job(repo)
+
+    assert repo.stats()["size"] == 2
+    assert repo.stats()["evictions"] == 1
+    await repo.get(first.job_id)
+    assert inner.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidates_on_rejected_transition():
+    repo = CachedJobRepository(_CountingRepo(), max_entries=10, ttl_seconds=60)
+    job = await _make_job(repo)
+    with pytest.raises(InvalidStateTransitionError):
+        await repo.update_status(job.job_id, JobStatus.COMPLETED)
+    assert repo.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_many_only_fetches_cache_misses():
+    inner = _CountingRepo()
+    cached = await _make_job(inner)
+    uncached = await _make_job(inner)
+    repo = CachedJobRepository(inner, max_entries=10, ttl_seconds=60)
+    await repo.get(cached.job_id)
+
+    jobs = await repo.get_many([cached.job_id, uncached.job_id, "missing"])
+
+    assert set(jobs) == {cached.job_id, uncached.job_id}
+    assert repo.stats()["hits"] == 1
+    assert repo.stats()["misses"] == 3
+    assert (await repo.get(uncached.job_id)).job_id == uncached.job_id
+    assert repo.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("many", [False, True])
+async def test_read_started_before_a_write_does_not_cache_its_older_snapshot(many):
+    inner = _SlowReadRepo()
+    repo = CachedJobRepository(inner, max_entries=10, ttl_seconds=60)
+    job = await _make_job(inner)
+    await inner.update_status(job.job_id, JobStatus.RUNNING)
+
+    read = asyncio.create_task(repo.get_many([job.job_id]) if many else repo.get(job.job_id))
+    await inner.fetched.wait()
+    await repo.update_status(job.job_id, JobStatus.COMPLETED, result="done")
+    inner.release.set()
+    stale = await read
+
+    stale = stale[job.job_id] if many else stale
+    assert stale.status == JobStatus.RUNNING
+    assert (await repo.get(job.job_id)).status == JobStatus.COMPLETED
+    assert repo.stats()["hits"] == 1
@@ -0,0 +1,81 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+from app.domain.models import JobFilter, JobStatus, NewJob
+from app.repository.job_repo import InMemoryJobRepository
+from app.repository.qdrant_job_repo import QdrantJobRepository
+
+
+def _new_job(marker: str) -> NewJob:
+    return NewJob(
+        input_hash=marker * 64,
+        blockchain_identifier="mock_bc_list",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_list",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+
+
+@pytest_asyncio.fixture(params=["memory", "qdrant"])
+async def repo_and_jobs(request):
+    if request.param == "memory":
+        repo = InMemoryJobRepository()
+    else:
+        repo = QdrantJobRepository(collection_name=f"jobs_test_list_{uuid.uuid4().hex}")
+    jobs = await repo.create_many([_new_job("a" if i % 3 else "b") for i in range(12)])
+    for job in jobs[:4]:
+        await repo.update_status(job.job_id, JobStatus.RUNNING)
+    for job in jobs[:2]:
+        await repo.update_status(job.job_id, JobStatus.COMPLETED, result="done")
+    return repo, jobs
+
+
+async def _collect(repo, filters: JobFilter, limit: int) -> list[str]:
+    seen, cursor = [], None
+    while True:
+        page, cursor = await repo.list_jobs(filters, limit=limit, cursor=cursor)
+        assert len(page) <= limit
+        seen.extend(job.job_id for job in page)
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_every_job_once_in_id_order(repo_and_jobs):
+    repo, jobs = repo_and_jobs
+
+    seen = await _collect(repo, JobFilter(), limit=5)
+
+    assert seen == sorted(job.job_id for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_filters_on_status_and_input_hash(repo_and_jobs):
+    repo, jobs = repo_and_jobs
+
+    running = await _collect(repo, JobFilter(statuses=(JobStatus.RUNNING,)), limit=1)
+    assert running == sorted(job.job_id for job in jobs[2:4])
+
+    started = await _collect(repo, JobFilter(statuses=(JobStatus.RUNNING, JobStatus.COMPLETED)), limit=3)
+    assert started == sorted(job.job_id for job in jobs[:4])
+
+    hashed = await _collect(repo, JobFilter(input_hash="b" * 64, statuses=(JobStatus.AWAITING_PAYMENT,)), limit=2)
+    assert hashed == sorted(job.job_id for job in jobs[4:] if job.input_hash == "b" * 64)
+
+
+@pytest.mark.asyncio
+async def test_filters_on_time_windows(repo_and_jobs):
+    repo, jobs = repo_and_jobs
+    now = datetime.now(timezone.utc)
+
+    assert await _collect(repo, JobFilter(created_before=now - timedelta(hours=1)), limit=10) == []
+    assert len(await _collect(repo, JobFilter(created_after=now - timedelta(hours=1)), limit=10)) == 12
+
+    touched = jobs[5]
+    await repo.update_status(touched.job_id, JobStatus.RUNNING)
+    since = (await repo.get(touched.job_id)).updated_at
+    assert await _collect(repo, JobFilter(updated_after=since), limit=10) == [touched.job_id]
@@ -1,21 +1,27 @@
+import asyncio
+from asyncio import sleep as real_sleep
 from datetime import datetime, timedelta, timezone
 import uuid
 
+import pytest
 from qdrant_client.models import PointStruct
 
-from app.domain.models import JobStatus
+from app.domain.exceptions import InvalidStateTransitionError
+from app.domain.models import JobStatus, NewJob
 from app.repository.qdrant_job_repo import QdrantJobRepository
+from app.services.job_sweeper import run_stale_job_sweeper
 
 
 def _make_repo() -> QdrantJobRepository:
     return QdrantJobRepository(collection_name=f"jobs_test_phase2_{uuid.uuid4().hex}")
 
 
-def test_qdrant_repository_create_get_update_count():
+@pytest.mark.asyncio
+async def test_qdrant_repository_create_get_update_count():
     repo = _make_repo()
-    assert repo.count() == 0
+    assert await repo.count() == 0
 
-    job = repo.create(
+    job = await repo.create(
         input_hash="x" * 64,
         blockchain_identifier="mock_bc_qdrant",
         pay_by_time=9_999_999_999,
@@ -23,19 +29,20 @@ def test_qdrant_repository_create_get_update_count():
         submit_result_time=9_999_999_999 + 3600,
         unlock_time=9_999_999_999 + 86_400,
     )
-    assert repo.count() == 1
+    assert await repo.count() == 1
 
-    fetched = repo.get(job.job_id)
+    fetched = await repo.get(job.job_id)
     assert fetched.job_id == job.job_id
     assert fetched.status == JobStatus.AWAITING_PAYMENT
 
-    running = repo.update_status(job.job_id, JobStatus.RUNNING)
+    running = await repo.update_status(job.job_id, JobStatus.RUNNING)
     assert running.status == JobStatus.RUNNING
 
 
-def test_qdrant_recover_stale_running_jobs():
+@pytest.mark.asyncio
+async def test_qdrant_recover_stale_running_jobs():
     repo = _make_repo()
-    job = repo.create(
+    job = await repo.create(
         input_hash="y" * 64,
         blockchain_identifier="mock_bc_qdrant_2",
         pay_by_time=9_999_999_999,
@@ -43,20 +50,241 @@ def test_qdrant_recover_stale_running_jobs():
         submit_result_time=9_999_999_999 + 3600,
         unlock_time=9_999_999_999 + 86_400,
     )
-    repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
 
-    stale_payload = repo.get(job.job_id).model_dump(by_alias=True)
+    stale_payload = (await repo.get(job.job_id)).model_dump(by_alias=True)
     stale_payload["status"] = JobStatus.RUNNING.value
     stale_payload["updated_at"] = (datetime.now(timezone.utc) - timedelta(minutes=61)).isoformat()
     stale_payload["created_at"] = stale_payload["created_at"].isoformat()
-    repo._client.upsert(
+    await repo._client.upsert(
         collection_name=repo._collection_name,
         points=[PointStruct(id=job.job_id, vector=[0.0], payload=stale_payload)],
     )
 
-    recovered = repo.recover_stale_running_jobs(timeout_minutes=30)
+    recovered = await repo.recover_stale_running_jobs(timeout_minutes=30)
     assert recovered >= 1
 
-    failed = repo.get(job.job_id)
+    failed = await repo.get(job.job_id)
     assert failed.status == JobStatus.FAILED
-    assert failed.error == "Job timed out — recovered on restart"
+    assert failed.error == "Job timed out — reaped by stale-job sweeper"
+
+
+@pytest.mark.asyncio
+async def test_qdrant_concurrent_transitions_single_winner():
+    repo = _make_repo()
+    job = await repo.create(
+        input_hash="z" * 64,
+        blockchain_identifier="mock_bc_qdrant_3",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_qdrant_3",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+
+    outcomes = await asyncio.gather(
+        repo.update_status(job.job_id, JobStatus.COMPLETED, result="a"),
+        repo.update_status(job.job_id, JobStatus.FAILED, error="b"),
+        return_exceptions=True,
+    )
+    winners = [o for o in outcomes if not isinstance(o, Exception)]
+    losers = [o for o in outcomes if isinstance(o, InvalidStateTransitionError)]
+    assert len(winners) == 1
+    assert len(losers) == 1
+    assert (await repo.get(job.job_id)).status == winners[0].status
+
+
+@pytest.mark.asyncio
+async def test_qdrant_transition_is_applied_once_when_job_returns_to_the_same_state(monkeypatch):
+    repo = _make_repo()
+    other_worker = QdrantJobRepository(collection_name=repo._collection_name)
+    job = await repo.create(
+        input_hash="v" * 64,
+        blockchain_identifier="mock_bc_qdrant_aba",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_qdrant_aba",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+
+    set_payload = repo._client.set_payload
+    writes = []
+
+    async def interleaved_set_payload(**kwargs):
+        await set_payload(**kwargs)
+        writes.append(kwargs["payload"].get("status"))
+        if len(writes) == 1:
+            # Another worker moves the job A -> B -> A before this writer reads back.
+            await other_worker.update_status(job.job_id, JobStatus.RUNNING)
+
+    monkeypatch.setattr(repo._client, "set_payload", interleaved_set_payload)
+    updated = await repo.update_status(job.job_id, JobStatus.AWAITING_INPUT)
+
+    assert updated.status == JobStatus.AWAITING_INPUT
+    assert writes == ["awaiting_input", "running"]
+    assert (await other_worker.get(job.job_id)).status == JobStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_qdrant_illegal_transition_leaves_job_untouched():
+    repo = _make_repo()
+    job = await repo.create(
+        input_hash="w" * 64,
+        blockchain_identifier="mock_bc_qdrant_4",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_qdrant_4",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    with pytest.raises(InvalidStateTransitionError):
+        await repo.update_status(job.job_id, JobStatus.COMPLETED, result="nope")
+
+    unchanged = await repo.get(job.job_id)
+    assert unchanged.status == JobStatus.AWAITING_PAYMENT
+    assert unchanged.result is None
+    assert unchanged.updated_at == job.updated_at
+
+
+async def _make_stale_running_job(repo: QdrantJobRepository, marker: str) -> str:
+    job = await repo.create(
+        input_hash=marker * 64,
+        blockchain_identifier=f"mock_bc_{marker}",
+        pay_by_time=9_999_999_999,
+        seller_vkey=f"mock_vkey_{marker}",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo._client.set_payload(
+        collection_name=repo._collection_name,
+        payload={"updated_at": (datetime.now(timezone.utc) - timedelta(minutes=61)).isoformat()},
+        points=[job.job_id],
+    )
+    return job.job_id
+
+
+@pytest.mark.asyncio
+async def test_qdrant_recovery_pages_through_every_match():
+    repo = _make_repo()
+    stale_ids = [await _make_stale_running_job(repo, m) for m in "abcde"]
+    fresh = await repo.create(
+        input_hash="f" * 64,
+        blockchain_identifier="mock_bc_fresh",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_fresh",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    await repo.update_status(fresh.job_id, JobStatus.RUNNING)
+
+    recovered = await repo.recover_stale_running_jobs(timeout_minutes=30, page_size=2)
+
+    assert recovered == len(stale_ids)
+    for job_id in stale_ids:
+        assert (await repo.get(job_id)).status == JobStatus.FAILED
+    assert (await repo.get(fresh.job_id)).status == JobStatus.RUNNING
+    assert await repo.recover_stale_running_jobs(timeout_minutes=30) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_job_sweeper_reaps_without_restart(mock_agent_sleep):
+    # conftest patches asyncio.sleep globally; the sweeper needs a real tick.
+    mock_agent_sleep.side_effect = real_sleep
+    repo = _make_repo()
+    job_id = await _make_stale_running_job(repo, "s")
+
+    sweeper = asyncio.create_task(
+        run_stale_job_sweeper(repo, timeout_minutes=30, interval_seconds=0.01)
+    )
+    try:
+        for _ in range(100):
+            if (await repo.get(job_id)).status == JobStatus.FAILED:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        sweeper.cancel()
+
+    assert (await repo.get(job_id)).status == JobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_find_completed_by_input_hash_returns_newest_fresh_result():
+    repo = _make_repo()
+    since = datetime.now(timezone.utc) - timedelta(minutes=5)
+    ids = []
+    for result in ("first", "second"):
+        job = await repo.create(
+            input_hash="d" * 64,
+            blockchain_identifier="mock_bc_dedup",
+            pay_by_time=9_999_999_999,
+            seller_vkey="mock_vkey_dedup",
+            submit_result_time=9_999_999_999 + 3600,
+            unlock_time=9_999_999_999 + 86_400,
+        )
+        ids.append(job.job_id)
+        await repo.update_status(job.job_id, JobStatus.RUNNING)
+        await repo.update_status(job.job_id, JobStatus.COMPLETED, result=result)
+    await _make_stale_running_job(repo, "d")
+
+    found = await repo.find_completed_by_input_hash("d" * 64, since)
+    assert found.job_id == ids[1]
+    assert found.result == "second"
+    assert await repo.find_completed_by_input_hash("e" * 64, since) is None
+    assert await repo.find_completed_by_input_hash("d" * 64, datetime.now(timezone.utc) + timedelta(seconds=1)) is None
+
+
+@pytest.mark.asyncio
+async def test_create_many_writes_batch_in_one_upsert(monkeypatch):
+    repo = _make_repo()
+    new_jobs = [
+        NewJob(
+            input_hash=marker * 64,
+            blockchain_identifier="mock_bc_batch",
+            pay_by_time=9_999_999_999,
+            seller_vkey="mock_vkey_batch",
+            submit_result_time=9_999_999_999 + 3600,
+            unlock_time=9_999_999_999 + 86_400,
+        )
+        for marker in "abc"
+    ]
+    await repo.ensure_collection()
+    upsert = repo._client.upsert
+    calls = 0
+
+    async def _counting_upsert(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await upsert(*args, **kwargs)
+
+    monkeypatch.setattr(repo._client, "upsert", _counting_upsert)
+    jobs = await repo.create_many(new_jobs)
+
+    assert calls == 1
+    assert await repo.count() == 3
+    for job in jobs:
+        fetched = await repo.get(job.job_id)
+        assert fetched.input_hash == job.input_hash
+        assert fetched.status == JobStatus.AWAITING_PAYMENT
+
+
+@pytest.mark.asyncio
+async def test_get_many_retrieves_known_ids_and_skips_invalid_ones():
+    repo = _make_repo()
+    jobs = await repo.create_many([
+        NewJob(
+            input_hash=marker * 64,
+            blockchain_identifier="mock_bc_many",
+            pay_by_time=9_999_999_999,
+            seller_vkey="mock_vkey_many",
+            submit_result_time=9_999_999_999 + 3600,
+            unlock_time=9_999_999_999 + 86_400,
+        )
+        for marker in "ab"
+    ])
+
+    found = await repo.get_many([jobs[0].job_id, str(uuid.uuid4()), "not-a-uuid", jobs[1].job_id])
+
+    assert set(found) == {jobs[0].job_id, jobs[1].job_id}
+    assert found[jobs[1].job_id].input_hash == "b" * 64
+    assert await repo.get_many(["not-a-uuid"]) == {}
@@ -1,7 +1,9 @@
-import threading
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
-from app.domain.models import JobStatus
+from app.domain.models import JobStatus, NewJob
 from app.domain.exceptions import JobNotFoundError, InvalidStateTransitionError
 from app.repository.job_repo import InMemoryJobRepository
 
@@ -14,8 +16,8 @@ _SRT = 9_999_999_999 + 3_600
 _UT  = 9_999_999_999 + 86_400
 
 
-def _make_job(repo: InMemoryJobRepository, input_hash: str):
-    return repo.create(
+async def _make_job(repo: InMemoryJobRepository, input_hash: str):
+    return await repo.create(
         input_hash=input_hash,
         blockchain_identifier=_BC,
         pay_by_time=_PBT,
@@ -26,9 +28,10 @@ def _make_job(repo: InMemoryJobRepository, input_hash: str):
 
 
 # TC-2.1: create() returns a job in AWAITING_PAYMENT state
-def test_create_job_initial_state():
+@pytest.mark.asyncio
+async def test_create_job_initial_state():
     repo = InMemoryJobRepository()
-    job = _make_job(repo, "a" * 64)
+    job = await _make_job(repo, "a" * 64)
     assert job.status == JobStatus.AWAITING_PAYMENT
     assert job.input_hash == "a" * 64
     assert job.blockchain_identifier == _BC
@@ -37,75 +40,123 @@ def test_create_job_initial_state():
 
 
 # TC-2.2: get() returns the same job that was created
-def test_get_returns_created_job():
+@pytest.mark.asyncio
+async def test_get_returns_created_job():
     repo = InMemoryJobRepository()
-    job = _make_job(repo, "b" * 64)
-    retrieved = repo.get(job.job_id)
+    job = await _make_job(repo, "b" * 64)
+    retrieved = await repo.get(job.job_id)
     assert retrieved.job_id == job.job_id
 
 
 # TC-2.3: get() raises JobNotFoundError for unknown ID
-def test_get_unknown_job_raises():
+@pytest.mark.asyncio
+async def test_get_unknown_job_raises():
     repo = InMemoryJobRepository()
     with pytest.raises(JobNotFoundError):
-        repo.get("nonexistent-id")
+        await repo.get("nonexistent-id")
 
 
 # TC-2.4: Legal state transition updates status and updated_at
-def test_legal_transition_updates_job():
+@pytest.mark.asyncio
+async def test_legal_transition_updates_job():
     repo = InMemoryJobRepository()
-    job = _make_job(repo, "c" * 64)
-    updated = repo.update_status(job.job_id, JobStatus.RUNNING)
+    job = await _make_job(repo, "c" * 64)
+    updated = await repo.update_status(job.job_id, JobStatus.RUNNING)
     assert updated.status == JobStatus.RUNNING
     assert updated.updated_at >= job.updated_at
 
 
 # TC-2.5: Illegal state transition raises InvalidStateTransitionError
-def test_illegal_transition_raises():
+@pytest.mark.asyncio
+async def test_illegal_transition_raises():
     repo = InMemoryJobRepository()
-    job = _make_job(repo, "d" * 64)
+    job = await _make_job(repo, "d" * 64)
     with pytest.raises(InvalidStateTransitionError):
-        repo.update_status(job.job_id, JobStatus.COMPLETED)  # skip RUNNING
+        await repo.update_status(job.job_id, JobStatus.COMPLETED)  # skip RUNNING
 
 
 # TC-2.6: count() reflects stored jobs
-def test_count_reflects_stored_jobs():
+@pytest.mark.asyncio
+async def test_count_reflects_stored_jobs():
     repo = InMemoryJobRepository()
-    assert repo.count() == 0
-    _make_job(repo, "e" * 64)
-    _make_job(repo, "f" * 64)
-    assert repo.count() == 2
+    assert await repo.count() == 0
+    await _make_job(repo, "e" * 64)
+    await _make_job(repo, "f" * 64)
+    assert await repo.count() == 2
 
 
-# TC-2.7: Thread-safety — concurrent creates produce unique IDs
-def test_concurrent_creates_are_unique():
+# TC-2.7: Concurrency — concurrent creates produce unique IDs
+@pytest.mark.asyncio
+async def test_concurrent_creates_are_unique():
     repo = InMemoryJobRepository()
-    ids = []
-    lock = threading.Lock()
-
-    def worker():
-        job = _make_job(repo, "g" * 64)
-        with lock:
-            ids.append(job.job_id)
-
-    threads = [threading.Thread(target=worker) for _ in range(100)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    jobs = await asyncio.gather(*(_make_job(repo, "g" * 64) for _ in range(100)))
+    ids = [job.job_id for job in jobs]
 
     assert len(ids) == 100
     assert len(set(ids)) == 100  # all unique
 
 
 # TC-2.8: completed job with result is stored correctly
-def test_completed_job_stores_result():
+@pytest.mark.asyncio
+async def test_completed_job_stores_result():
     repo = InMemoryJobRepository()
-    job = _make_job(repo, "h" * 64)
-    repo.update_status(job.job_id, JobStatus.RUNNING)
-    done = repo.update_status(
+    job = await _make_job(repo, "h" * 64)
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    done = await repo.update_status(
         job.job_id, JobStatus.COMPLETED, result="output_data"
     )
     assert done.status == JobStatus.COMPLETED
     assert done.result == "output_data"
     assert done.error is None
+
+
+# TC-2.9: completed jobs are found by input_hash within the freshness window
+@pytest.mark.asyncio
+async def test_find_completed_by_input_hash():
+    repo = InMemoryJobRepository()
+    job = await _make_job(repo, "i" * 64)
+    await _make_job(repo, "i" * 64)
+    since = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert await repo.find_completed_by_input_hash("i" * 64, since) is None
+
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo.update_status(job.job_id, JobStatus.COMPLETED, result="output_data")
+
+    found = await repo.find_completed_by_input_hash("i" * 64, since)
+    assert found.job_id == job.job_id
+    assert await repo.find_completed_by_input_hash("j" * 64, since) is None
+    assert await repo.find_completed_by_input_hash("i" * 64, datetime.now(timezone.utc) + timedelta(seconds=1)) is None
+
+
+# TC-2.10: create_many stores a batch with distinct ids
+@pytest.mark.asyncio
+async def test_create_many_stores_batch():
+    repo = InMemoryJobRepository()
+    new_jobs = [
+        NewJob(
+            input_hash=marker * 64,
+            blockchain_identifier="mock_bc_batch",
+            pay_by_time=9_999_999_999,
+            seller_vkey="mock_vkey_batch",
+            submit_result_time=9_999_999_999 + 3600,
+            unlock_time=9_999_999_999 + 86_400,
+        )
+        for marker in "klm"
+    ]
+    jobs = await repo.create_many(new_jobs)
+
+    assert [job.input_hash for job in jobs] == [marker * 64 for marker in "klm"]
+    assert len({job.job_id for job in jobs}) == 3
+    assert await repo.count() == 3
+    assert await repo.create_many([]) == []
+
+
+# TC-2.11: get_many returns known jobs and omits unknown ids
+@pytest.mark.asyncio
+async def test_get_many_omits_unknown_ids():
+    repo = InMemoryJobRepository()
+    job = await _make_job(repo, "n" * 64)
+
+    jobs = await repo.get_many([job.job_id, "missing"])
+
+    assert list(jobs) == [job.job_id]
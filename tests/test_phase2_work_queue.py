@@ -0,0 +1,109 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from app.repository.qdrant_job_repo import QdrantJobRepository
+from app.repository.qdrant_work_queue import QdrantWorkQueue
+from app.repository.sqlite_work_queue import SqliteWorkQueue
+from app.repository.work_queue import InMemoryWorkQueue
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "qdrant"])
+async def queue_and_ids(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryWorkQueue(), [str(uuid.uuid4()) for _ in range(3)]
+    if request.param == "sqlite":
+        return SqliteWorkQueue(str(tmp_path / "queue.sqlite3")), [str(uuid.uuid4()) for _ in range(3)]
+
+    # The Qdrant queue lives on job points, so the jobs must exist first.
+    repo = QdrantJobRepository(collection_name=f"jobs_test_queue_{uuid.uuid4().hex}")
+    ids = []
+    for _ in range(3):
+        job = await repo.create(
+            input_hash="q" * 64,
+            blockchain_identifier="mock_bc_queue",
+            pay_by_time=9_999_999_999,
+            seller_vkey="mock_vkey_queue",
+            submit_result_time=9_999_999_999 + 3600,
+            unlock_time=9_999_999_999 + 86_400,
+        )
+        ids.append(job.job_id)
+    return QdrantWorkQueue(repo), ids
+
+
+@pytest.mark.asyncio
+async def test_claims_follow_priority_and_are_exclusive(queue_and_ids):
+    queue, (a, b, c) = queue_and_ids
+    await queue.enqueue(a, {"n": 1}, priority=30)
+    await queue.enqueue(b, {"n": 2}, priority=10)
+    await queue.enqueue(c, {"n": 3}, priority=20)
+    assert await queue.depth() == 3
+
+    first = await queue.claim("w1", lease_seconds=60)
+    second = await queue.claim("w2", lease_seconds=60)
+    third = await queue.claim("w1", lease_seconds=60)
+
+    assert [item.job_id for item in (first, second, third)] == [b, c, a]
+    assert first.raw_input == {"n": 2}
+    assert first.enqueued_at is not None
+    assert await queue.claim("w3", lease_seconds=60) is None
+    assert await queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed_and_stale_owner_cannot_complete(queue_and_ids):
+    queue, (a, _, _) = queue_and_ids
+    await queue.enqueue(a, {"n": 1}, priority=1)
+
+    crashed = await queue.claim("w1", lease_seconds=0)
+    resumed = await queue.claim("w2", lease_seconds=60)
+
+    assert resumed is not None
+    assert resumed.job_id == crashed.job_id
+    assert resumed.lease_token != crashed.lease_token
+
+    await queue.complete(crashed)
+    await queue.heartbeat(resumed, lease_seconds=60)
+    assert await queue.claim("w3", lease_seconds=60) is None
+
+    await queue.complete(resumed)
+    assert await queue.claim("w3", lease_seconds=0) is None
+
+
+@pytest.mark.asyncio
+async def test_released_item_is_claimable_again(queue_and_ids):
+    queue, (a, _, _) = queue_and_ids
+    await queue.enqueue(a, {"n": 1}, priority=1)
+
+    interrupted = await queue.claim("w1", lease_seconds=60)
+    assert await queue.depth() == 0
+    await queue.release(interrupted)
+
+    assert await queue.depth() == 1
+    resumed = await queue.claim("w2", lease_seconds=60)
+    assert resumed.job_id == a
+    assert resumed.raw_input == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_qdrant_complete_clears_lease_bookkeeping():
+    repo = QdrantJobRepository(collection_name=f"jobs_test_queue_{uuid.uuid4().hex}")
+    job = await repo.create(
+        input_hash="q" * 64,
+        blockchain_identifier="mock_bc_queue",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_queue",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    queue = QdrantWorkQueue(repo)
+    await queue.enqueue(job.job_id, {"n": 1}, priority=1)
+    await queue.complete(await queue.claim("w1", lease_seconds=60))
+
+    points = await repo.client.retrieve(collection_name=repo.collection_name, ids=[job.job_id], with_payload=True)
+    payload = points[0].payload
+    assert payload["queue_state"] == "done"
+    assert payload["lease_owner"] is None
+    assert payload["lease_token"] is None
+    assert payload["lease_expires_at"] is None
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.adapters.batching_normalisation_adapter import BatchingNormalisationAdapter
+from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
+from app.core.config import settings
+from tests.conftest import open_http
+
+
+def _valid(index: int) -> dict:
+    return {"target_domain": f"https://site{index}.example", "my_product_usp": f"usp {index}", "ideal_customer_profile": "ICP"}
+
+
+class _FakeLLM:
+    def __init__(self, batch_fails: bool = False):
+        self.batches: list[int] = []
+        self.singles = 0
+        self._batch_fails = batch_fails
+
+    async def normalise(self, raw_input: dict) -> dict:
+        self.singles += 1
+        return {"single": raw_input["i"]}
+
+    async def normalise_many(self, raw_inputs: list[dict]) -> list[dict]:
+        self.batches.append(len(raw_inputs))
+        if self._batch_fails:
+            raise ValueError("batch answer missing items")
+        return [{"batched": raw_input["i"]} for raw_input in raw_inputs]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch():
+    llm = _FakeLLM()
+    normaliser = BatchingNormalisationAdapter(llm, window_seconds=0.01, max_batch_size=16)
+
+    results = await asyncio.gather(*(normaliser.normalise({"i": i}) for i in range(5)))
+
+    assert results == [{"batched": i} for i in range(5)]
+    assert llm.batches == [5]
+    assert llm.singles == 0
+    assert normaliser.stats()["avg_batch_size"] == 5
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_and_lone_call_goes_single():
+    llm = _FakeLLM()
+    normaliser = BatchingNormalisationAdapter(llm, window_seconds=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(normaliser.normalise({"i": i}) for i in range(4))), timeout=1
+    )
+    assert results == [{"batched": i} for i in range(4)]
+    assert llm.batches == [2, 2]
+
+    lone = BatchingNormalisationAdapter(llm, window_seconds=0.01, max_batch_size=2)
+    assert await lone.normalise({"i": 9}) == {"single": 9}
+
+
+@pytest.mark.asyncio
+async def test_invalid_batch_falls_back_to_single_calls():
+    llm = _FakeLLM(batch_fails=True)
+    normaliser = BatchingNormalisationAdapter(llm, window_seconds=0.01, max_batch_size=16)
+
+    results = await asyncio.gather(*(normaliser.normalise({"i": i}) for i in range(3)))
+
+    assert results == [{"single": i} for i in range(3)]
+    assert llm.batches == [3]
+    assert llm.singles == 3
+    assert normaliser.stats()["fallbacks"] == 1
+
+
+def _llm(monkeypatch, handler) -> LLMNormalisationAdapter:
+    monkeypatch.setattr(settings, "openrouter_api_key", "key")
+    monkeypatch.setattr(settings, "openrouter_url", "https://openrouter.test/chat")
+    monkeypatch.setattr(settings, "openrouter_models", "")
+    return LLMNormalisationAdapter(open_http(handler))
+
+
+@pytest.mark.asyncio
+async def test_llm_normalise_many_sends_one_keyed_request(monkeypatch):
+    sent: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append(body)
+        items = json.loads(body["messages"][1]["content"])["items"]
+        results = [{"id": item["id"], **_valid(int(item["id"]))} for item in reversed(items)]
+        return httpx.Response(200, json={"choices": [{"message": {"content": json.dumps({"results": results})}}]})
+
+    llm = _llm(monkeypatch, handler)
+    assert await llm.normalise_many([{"raw": i} for i in range(3)]) == [_valid(i) for i in range(3)]
+    assert len(sent) == 1
+    assert llm.stats()["prompt"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_normalise_many_rejects_incomplete_answer(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = json.dumps({"results": [{"id": "0", **_valid(0)}]})
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    llm = _llm(monkeypatch, handler)
+    with pytest.raises(ValueError):
+        await llm.normalise_many([{"raw": 0}, {"raw": 1}])
@@ -4,11 +4,16 @@ import httpx
 
 from app.main import create_app
 from app.core.config import settings
+from tests.conftest import MOCK_PAYMENT_DATA
 
 
 @pytest.fixture
-def client():
-    app = create_app()
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
     return httpx.AsyncClient(
         transport=httpx.ASGITransport(app=app),
         base_url="http://test",
@@ -134,3 +139,58 @@ async def test_start_job_rejects_empty_usp(client):
     async with client as c:
         r = await c.post("/start_job", json=payload, headers=_headers())
     assert r.status_code == 422
+
+
+# TC-3.11: POST /start_jobs creates every job in one batch
+@pytest.mark.asyncio
+async def test_start_jobs_creates_batch(client, app):
+    payloads = [
+        {
+            "target_domain": f"https://example{i}.com",
+            "my_product_usp": "USP",
+            "ideal_customer_profile": "ICP",
+        }
+        for i in range(3)
+    ]
+    async with client as c:
+        r = await c.post("/v1/start_jobs", json={"jobs": payloads}, headers=_headers())
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["created"] == 3
+    assert body["failed"] == 0
+    assert [item["index"] for item in body["results"]] == [0, 1, 2]
+    job_ids = {item["job"]["job_id"] for item in body["results"]}
+    assert len(job_ids) == 3
+    assert all(item["job"]["blockchainIdentifier"] for item in body["results"])
+    for job_id in job_ids:
+        assert (await app.state.repo.get(job_id)).status == "awaiting_payment"
+
+
+# TC-3.12: POST /start_jobs reports payment failures per item
+@pytest.mark.asyncio
+async def test_start_jobs_reports_partial_failure(client, mock_payment_sdk):
+    mock_payment_sdk.side_effect = [MOCK_PAYMENT_DATA, RuntimeError("payment service down"), MOCK_PAYMENT_DATA]
+    async with client as c:
+        r = await c.post("/v1/start_jobs", json={"jobs": [_start_payload()] * 3}, headers=_headers())
+
+    body = r.json()
+    assert body["created"] == 2
+    assert body["failed"] == 1
+    assert body["results"][1]["job"] is None
+    assert "payment service down" in body["results"][1]["error"]
+    assert body["results"][0]["job"] and body["results"][2]["job"]
+
+
+# TC-3.13: POST /start_jobs validates every item and rejects empty batches
+@pytest.mark.asyncio
+async def test_start_jobs_validates_items(client):
+    async with client as c:
+        empty = await c.post("/v1/start_jobs", json={"jobs": []}, headers=_headers())
+        invalid = await c.post(
+            "/v1/start_jobs",
+            json={"jobs": [{"target_domain": "not-a-url", "my_product_usp": "U", "ideal_customer_profile": "I"}]},
+            headers=_headers(),
+        )
+    assert empty.status_code == 422
+    assert invalid.status_code == 422
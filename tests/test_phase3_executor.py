@@ -0,0 +1,201 @@
+import asyncio
+from asyncio import sleep as real_sleep
+
+import pytest
+
+from app.domain.exceptions import ExecutorSaturatedError
+from app.repository.work_queue import InMemoryWorkQueue
+from app.services.job_executor import JobExecutor
+from tests.conftest import drain_executor
+
+
+async def _until(predicate) -> None:
+    # conftest patches asyncio.sleep globally, so use the real one to yield.
+    while not predicate():
+        await real_sleep(0)
+
+
+def _executor(runner, concurrency: int = 1, max_queue: int = 10, queue=None) -> JobExecutor:
+    return JobExecutor(
+        queue=queue or InMemoryWorkQueue(),
+        runner=runner,
+        concurrency=concurrency,
+        max_queue=max_queue,
+        retry_after_seconds=7,
+        lease_seconds=60,
+        poll_interval_seconds=0.05,
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_earliest_priority_first():
+    order = []
+    gate = asyncio.Event()
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        if job_id == "blocker":
+            await gate.wait()
+        order.append(job_id)
+
+    executor = _executor(runner)
+    await executor.submit("blocker", {}, priority=0)
+    await asyncio.wait_for(_until(lambda: executor._running == 1), timeout=1)
+    await executor.submit("late", {}, priority=300)
+    await executor.submit("soon", {}, priority=100)
+    await executor.submit("middle", {}, priority=200)
+    gate.set()
+    await drain_executor(executor)
+    await executor.shutdown()
+
+    assert order == ["blocker", "soon", "middle", "late"]
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrency():
+    active = 0
+    peak = 0
+    gate = asyncio.Event()
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await gate.wait()
+        active -= 1
+
+    executor = _executor(runner, concurrency=2)
+    for i in range(5):
+        await executor.submit(f"job-{i}", {"i": i})
+    await asyncio.wait_for(_until(lambda: executor._running == 2), timeout=1)
+    assert (await executor.stats())["queue_depth"] == 3
+    gate.set()
+    await drain_executor(executor)
+    await executor.shutdown()
+
+    assert peak == 2
+    assert (await executor.stats())["started"] == 5
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_queue_full():
+    async def runner(job_id: str, raw_input: dict) -> None:
+        return None
+
+    executor = _executor(runner, max_queue=0)
+    with pytest.raises(ExecutorSaturatedError) as exc_info:
+        async with executor.reserve():
+            pass
+    assert exc_info.value.retry_after == 7
+    assert (await executor.stats())["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_never_overfill_the_queue():
+    queue = InMemoryWorkQueue()
+    depth = queue.depth
+
+    async def slow_depth() -> int:
+        # Yield mid-check, as a durable queue would, to let other requests interleave.
+        await real_sleep(0.01)
+        return await depth()
+
+    queue.depth = slow_depth
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        return None
+
+    executor = _executor(runner, max_queue=2, queue=queue)
+
+    async def provide_input(job_id: str) -> bool:
+        try:
+            async with executor.reserve():
+                await real_sleep(0.01)
+                await queue.enqueue(job_id, {}, 0)
+        except ExecutorSaturatedError:
+            return False
+        return True
+
+    accepted = await asyncio.gather(*(provide_input(f"job-{i}") for i in range(5)))
+
+    assert sum(accepted) == 2
+    assert await depth() == 2
+    assert (await executor.stats())["rejected"] == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_resumes_work_abandoned_by_another_worker():
+    queue = InMemoryWorkQueue()
+    await queue.enqueue("orphan", {"k": "v"}, priority=1)
+    abandoned = await queue.claim("dead-worker", lease_seconds=0)
+    assert abandoned is not None
+
+    seen = []
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        seen.append((job_id, raw_input))
+
+    executor = _executor(runner, queue=queue)
+    executor.start()
+    await asyncio.wait_for(_until(lambda: seen), timeout=1)
+    await drain_executor(executor)
+    await executor.shutdown()
+
+    assert seen == [("orphan", {"k": "v"})]
+    assert await queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_interrupted_work_back_to_the_queue():
+    queue = InMemoryWorkQueue()
+    gate = asyncio.Event()
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        await gate.wait()
+
+    executor = _executor(runner, queue=queue)
+    await executor.submit("in-flight", {"k": "v"})
+    await asyncio.wait_for(_until(lambda: executor._running == 1), timeout=1)
+    await executor.shutdown()
+
+    assert await queue.depth() == 1
+    resumed = await queue.claim("other-worker", lease_seconds=60)
+    assert resumed is not None and resumed.job_id == "in-flight"
+
+
+@pytest.mark.asyncio
+async def test_shutdown_lets_in_flight_work_finish_within_grace():
+    queue = InMemoryWorkQueue()
+    gate = asyncio.Event()
+    finished = []
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        await gate.wait()
+        finished.append(job_id)
+
+    executor = _executor(runner, queue=queue)
+    await executor.submit("in-flight", {})
+    await asyncio.wait_for(_until(lambda: executor._running == 1), timeout=1)
+    asyncio.get_running_loop().call_later(0.05, gate.set)
+    await executor.shutdown(grace_seconds=5)
+
+    assert finished == ["in-flight"]
+    assert await queue.depth() == 0
+    assert await queue.claim("other-worker", lease_seconds=60) is None
+
+
+@pytest.mark.asyncio
+async def test_wait_time_comes_from_the_queued_item():
+    queue = InMemoryWorkQueue()
+    await queue.enqueue("queued-elsewhere", {}, priority=0)
+
+    async def runner(job_id: str, raw_input: dict) -> None:
+        return None
+
+    executor = _executor(runner, queue=queue)
+    executor.start()
+    await drain_executor(executor)
+    await executor.shutdown()
+
+    stats = await executor.stats()
+    assert stats["started"] == 1
+    assert stats["wait_seconds_max"] > 0
@@ -0,0 +1,118 @@
+import json
+
+import httpx
+import pytest
+
+from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
+from app.core.config import settings
+from app.utils.json_stream import IncrementalJsonObject, JsonStreamError
+from tests.conftest import open_http
+
+
+KEYS = ("target_domain", "my_product_usp", "ideal_customer_profile")
+ANSWER = {"target_domain": "https://example.com", "my_product_usp": "USP", "ideal_customer_profile": "ICP"}
+
+
+def _feed(text: str, chunk: int = 4):
+    parser = IncrementalJsonObject(KEYS)
+    for i in range(0, len(text), chunk):
+        parsed = parser.feed(text[i:i + chunk])
+        if parsed is not None:
+            return parsed, parser
+    return None, parser
+
+
+def test_parser_returns_once_required_keys_are_complete():
+    text = json.dumps({**ANSWER, "notes": "the model keeps talking"})
+    parsed, parser = _feed(text)
+    assert parsed == ANSWER
+    assert not parser.closed
+
+    parsed, parser = _feed("```json\n" + json.dumps({"my_product_usp": "a \"}\" b", **{k: v for k, v in ANSWER.items() if k != "my_product_usp"}}))
+    assert parsed["my_product_usp"] == 'a "}" b'
+
+
+@pytest.mark.parametrize("text", [
+    "Sure! Here is the JSON: {}",
+    '{"target_domain": "x" "my_product_usp": "y"}',
+    '{"target_domain": "x", I think',
+    '{"target_domain": "x"}',
+])
+def test_parser_rejects_drift(text):
+    with pytest.raises(JsonStreamError):
+        _feed(text)
+
+
+def _sse(content: str, chunk: int = 8, tail: str = "") -> list[bytes]:
+    events = [
+        json.dumps({"choices": [{"delta": {"content": content[i:i + chunk]}}]})
+        for i in range(0, len(content), chunk)
+    ]
+    lines = [": OPENROUTER PROCESSING\n\n"] + [f"data: {event}\n\n" for event in events]
+    return [line.encode() for line in lines] + [tail.encode(), b"data: [DONE]\n\n"]
+
+
+class _Streams:
+    """Serves one scripted SSE body per request and records how much of each was read."""
+
+    def __init__(self, *bodies: list[bytes]):
+        self._bodies = list(bodies)
+        self.sent: list[int] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        body = self._bodies.pop(0)
+        index = len(self.sent)
+        self.sent.append(0)
+
+        async def _chunks():
+            for chunk in body:
+                self.sent[index] += 1
+                yield chunk
+
+        return httpx.Response(200, content=_chunks(), headers={"content-type": "text/event-stream"})
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    monkeypatch.setattr(settings, "openrouter_api_key", "key")
+    monkeypatch.setattr(settings, "openrouter_url", "https://openrouter.test/chat")
+    monkeypatch.setattr(settings, "openrouter_stream", True)
+    monkeypatch.setattr(settings, "openrouter_stream_max_attempts", 2)
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_reading_once_keys_are_complete(streaming):
+    content = json.dumps({**ANSWER, "reasoning": "x" * 400})
+    body = _sse(content)
+    streams = _Streams(body)
+    adapter = LLMNormalisationAdapter(open_http(streams.handler))
+
+    assert await adapter.normalise({"raw": True}) == ANSWER
+    assert streams.sent[0] < len(body) // 2
+    stats = adapter.stats()
+    assert stats["early_stops"] == 1
+    assert stats["first_token_seconds"]["count"] == 1
+    assert stats["completion_seconds"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_drifting_stream_is_aborted_and_retried(streaming):
+    drifting = _sse("I'm sorry, I can only answer in prose. " * 20)
+    streams = _Streams(drifting, _sse(json.dumps(ANSWER)))
+    adapter = LLMNormalisationAdapter(open_http(streams.handler))
+
+    assert await adapter.normalise({"raw": True}) == ANSWER
+    assert streams.sent[0] <= 3
+    assert adapter.stats()["aborts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_drift_fails_after_max_attempts(streaming):
+    streams = _Streams(_sse('{"target_domain": oops'), _sse("not json"), _sse(json.dumps(ANSWER)))
+    adapter = LLMNormalisationAdapter(open_http(streams.handler))
+
+    with pytest.raises(JsonStreamError):
+        await adapter.normalise({"raw": True})
+    assert len(streams.sent) == 2
+    assert adapter.stats()["aborts"] == 2
@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
+from app.core import model_router
+from app.core.config import settings
+from app.core.model_router import ModelRouter
+from tests.conftest import open_http
+
+
+VALID = {"target_domain": "https://example.com", "my_product_usp": "USP", "ideal_customer_profile": "ICP"}
+
+
+def _router(**kwargs) -> ModelRouter:
+    kwargs.setdefault("window_seconds", 300)
+    kwargs.setdefault("min_samples", 2)
+    kwargs.setdefault("max_error_rate", 0.5)
+    return ModelRouter(["big", "small", "tiny"], **kwargs)
+
+
+def test_unmeasured_models_are_tried_before_the_fastest_known_one():
+    router = _router()
+    assert router.order() == ["big", "small", "tiny"]
+
+    for _ in range(2):
+        router.record_success("big", 2.0)
+    assert router.order() == ["small", "tiny", "big"]
+    for _ in range(2):
+        router.record_success("small", 0.5)
+        router.record_success("tiny", 1.0)
+
+    assert router.order() == ["small", "tiny", "big"]
+    summary = router.stats()["models"]["small"]
+    assert summary["p50_seconds"] == 0.5
+    assert summary["p95_seconds"] == 0.5
+    assert summary["error_rate"] == 0.0
+
+
+def test_unhealthy_model_goes_last_until_its_failures_age_out(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(model_router.time, "monotonic", lambda: now[0])
+    router = _router(window_seconds=60)
+    for model in ("big", "small", "tiny"):
+        router.record_success(model, {"big": 2.0, "small": 0.5, "tiny": 1.0}[model])
+        router.record_success(model, {"big": 2.0, "small": 0.5, "tiny": 1.0}[model])
+    router.record_failure("small", "timeout")
+    router.record_failure("small", "invalid")
+    router.record_failure("small", "error")
+
+    assert router.order() == ["tiny", "big", "small"]
+    stats = router.stats()["models"]["small"]
+    assert stats["healthy"] is False
+    assert (stats["timeouts"], stats["invalid"], stats["errors"]) == (1, 1, 3)
+
+    now[0] += 61
+    assert router.order() == ["big", "small", "tiny"]
+
+
+def _adapter(monkeypatch, handler, models: str) -> LLMNormalisationAdapter:
+    monkeypatch.setattr(settings, "openrouter_api_key", "key")
+    monkeypatch.setattr(settings, "openrouter_url", "https://openrouter.test/chat")
+    monkeypatch.setattr(settings, "openrouter_models", models)
+    monkeypatch.setattr(settings, "model_router_timeout_seconds", 0.2)
+    return LLMNormalisationAdapter(open_http(handler))
+
+
+def _answer(content: dict) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": json.dumps(content)}}]})
+
+
+@pytest.mark.asyncio
+async def test_falls_back_on_timeout_and_on_schema_invalid_output(monkeypatch):
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        seen.append(model)
+        if model == "slow":
+            await asyncio.Event().wait()
+        if model == "sloppy":
+            return _answer({**VALID, "target_domain": "not a url"})
+        return _answer(VALID)
+
+    adapter = _adapter(monkeypatch, handler, "slow, sloppy, good")
+    assert adapter.model == "slow|sloppy|good"
+
+    assert await adapter.normalise({"raw": True}) == VALID
+    assert seen == ["slow", "sloppy", "good"]
+
+    router = adapter.stats()["router"]
+    assert router["fallbacks"] == 1
+    assert router["last_decision"]["served_by"] == "good"
+    assert [a["outcome"] for a in router["last_decision"]["attempts"]] == ["timeout", "invalid", "ok"]
+    assert router["models"]["good"]["routed"] == 1
+    # Both failed models are now unhealthy, so the next call goes straight to the good one.
+    assert router["order"][0] == "good"
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_when_every_model_fails(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _answer({"target_domain": "https://example.com"})
+
+    adapter = _adapter(monkeypatch, handler, "a,b")
+    with pytest.raises(ValueError):
+        await adapter.normalise({"raw": True})
+    assert adapter.stats()["router"]["last_decision"]["served_by"] is None
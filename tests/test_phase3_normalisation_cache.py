@@ -0,0 +1,160 @@
+import uuid
+
+import pytest
+
+from app.adapters.cached_normalisation_adapter import CachedNormalisationAdapter
+from app.adapters.tiered_normalisation_adapter import TieredNormalisationAdapter
+from app.core.config import settings
+from app.main import create_app
+from app.repository.qdrant_normalisation_cache import QdrantNormalisationCache
+
+
+RAW = {
+    "target_domain": "https://example.com",
+    "my_product_usp": "USP",
+    "ideal_customer_profile": "ICP",
+}
+
+
+class _CountingNormaliser:
+    def __init__(self, model="model-a"):
+        self.model = model
+        self.calls = 0
+
+    async def normalise(self, raw_input: dict) -> dict:
+        self.calls += 1
+        return {"normalised": dict(raw_input), "model": self.model}
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def _make_store(**kwargs) -> QdrantNormalisationCache:
+    kwargs.setdefault("ttl_seconds", 3600)
+    kwargs.setdefault("max_entries", 100)
+    return QdrantNormalisationCache(collection_name=f"normalisation_test_{uuid.uuid4().hex}", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_repeat_input_is_served_from_memory():
+    inner = _CountingNormaliser()
+    normaliser = CachedNormalisationAdapter(inner, max_entries=10, ttl_seconds=60)
+
+    first = await normaliser.normalise(RAW)
+    first["normalised"]["target_domain"] = "mutated by caller"
+    second = await normaliser.normalise(dict(reversed(list(RAW.items()))))
+
+    assert inner.calls == 1
+    assert second["normalised"] == RAW
+    assert normaliser.stats()["hits"] == 1
+    assert normaliser.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_includes_model_and_skips_passthrough():
+    inner = _CountingNormaliser()
+    normaliser = CachedNormalisationAdapter(inner, max_entries=10, ttl_seconds=60)
+    await normaliser.normalise(RAW)
+
+    inner.model = "model-b"
+    assert (await normaliser.normalise(RAW))["model"] == "model-b"
+    inner.model = None
+    await normaliser.normalise(RAW)
+    await normaliser.normalise(RAW)
+
+    assert inner.calls == 4
+    assert normaliser.stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_and_entries_expire():
+    inner = _CountingNormaliser()
+    normaliser = CachedNormalisationAdapter(inner, max_entries=1, ttl_seconds=60)
+    await normaliser.normalise(RAW)
+    await normaliser.normalise({**RAW, "my_product_usp": "other"})
+    await normaliser.normalise(RAW)
+    assert inner.calls == 3
+    assert normaliser.stats()["evictions"] == 2
+
+    expiring = CachedNormalisationAdapter(inner, max_entries=10, ttl_seconds=0)
+    await expiring.normalise(RAW)
+    await expiring.normalise(RAW)
+    assert inner.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_survives_a_fresh_process():
+    store = _make_store()
+    first = CachedNormalisationAdapter(_CountingNormaliser(), max_entries=10, ttl_seconds=60, store=store)
+    await first.normalise(RAW)
+
+    inner = _CountingNormaliser()
+    restarted = CachedNormalisationAdapter(inner, max_entries=10, ttl_seconds=60, store=store)
+    assert (await restarted.normalise(RAW))["normalised"] == RAW
+    await restarted.normalise(RAW)
+
+    assert inner.calls == 0
+    assert restarted.stats()["store_hits"] == 1
+    assert restarted.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_enforces_ttl_and_size():
+    expired = _make_store(ttl_seconds=0)
+    await expired.put("a" * 64, {"x": 1})
+    assert await expired.get("a" * 64) is None
+
+    bounded = _make_store(max_entries=2)
+    for key in ("a", "b", "c"):
+        await bounded.put(key * 64, {"key": key})
+    # Writes never prune inline; the scheduled prune enforces the bound.
+    assert await bounded.get("a" * 64) == {"key": "a"}
+    await bounded.prune()
+
+    assert await bounded.get("a" * 64) is None
+    assert await bounded.get("b" * 64) == {"key": "b"}
+    assert await bounded.get("c" * 64) == {"key": "c"}
+
+
+@pytest.mark.asyncio
+async def test_tiered_normaliser_cleans_well_formed_input_without_llm():
+    inner = _CountingNormaliser()
+    normaliser = TieredNormalisationAdapter(inner)
+
+    cleaned = await normaliser.normalise({
+        "target_domain": "  Example.COM/ ",
+        "my_product_usp": "  Fast   onboarding\n for teams ",
+        "ideal_customer_profile": "B2B " + "x" * 600,
+        "utm_source": "newsletter",
+    })
+
+    assert cleaned["target_domain"] == "https://example.com"
+    assert cleaned["my_product_usp"] == "Fast onboarding for teams"
+    assert len(cleaned["ideal_customer_profile"]) == 500
+    assert "utm_source" not in cleaned
+    assert inner.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_tiered_normaliser_falls_back_to_llm_and_reports_hit_rate():
+    inner = _CountingNormaliser()
+    normaliser = TieredNormalisationAdapter(CachedNormalisationAdapter(inner, max_entries=10, ttl_seconds=60))
+
+    await normaliser.normalise(RAW)
+    await normaliser.normalise({"website": "example.com", "pitch": "USP"})
+    await normaliser.normalise({**RAW, "my_product_usp": "   "})
+    await normaliser.normalise({**RAW, "target_domain": "not a url"})
+
+    stats = normaliser.stats()
+    assert inner.calls == 3
+    assert stats["rule_hits"] == 1
+    assert stats["llm_calls"] == 3
+    assert stats["rule_hit_rate"] == 0.25
+    assert stats["llm_cache"]["misses"] == 3
+
+
+def test_persistent_store_is_opt_in(monkeypatch):
+    assert create_app().state.normalisation_store is None
+
+    monkeypatch.setattr(settings, "normalisation_cache_store", "qdrant")
+    assert isinstance(create_app().state.normalisation_store, QdrantNormalisationCache)
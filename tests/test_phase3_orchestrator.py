@@ -1,16 +1,25 @@
+import asyncio
+import json
+import time
+
+import httpx
 import pytest
 
 from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
 from app.adapters.orchestrator_adapter import OrchestratorAdapter
 from app.core.config import settings
+from app.core.http import HttpClientManager
+from app.core.resilience import ResilienceRegistry
+from app.domain.exceptions import CircuitOpenError
 from app.domain.models import JobStatus
 from app.repository.job_repo import InMemoryJobRepository
 from app.services.agent_runner import execute_agent_task
+from tests.conftest import open_http
 
 
 @pytest.mark.asyncio
 async def test_llm_normaliser_fallback_without_api_key(monkeypatch):
-    adapter = LLMNormalisationAdapter()
+    adapter = LLMNormalisationAdapter(HttpClientManager())
     monkeypatch.setattr(settings, "openrouter_api_key", "")
     raw = {
         "target_domain": "https://example.com",
@@ -23,12 +32,75 @@ async def test_llm_normaliser_fallback_without_api_key(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_orchestrator_mock_url_returns_result(monkeypatch):
-    adapter = OrchestratorAdapter()
+    adapter = OrchestratorAdapter(HttpClientManager())
     monkeypatch.setattr(settings, "orchestrator_url", "mock://orchestrator")
     result = await adapter.execute("job-123", {"k": "v"})
     assert "job-123" in result
 
 
+@pytest.mark.asyncio
+async def test_adapters_reuse_one_pooled_client_per_upstream(monkeypatch):
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if request.url.host == "openrouter.test":
+            content = json.dumps({"target_domain": "https://d.test", "my_product_usp": "u", "ideal_customer_profile": "i"})
+            return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+        return httpx.Response(200, json={"result": "done"})
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "key")
+    monkeypatch.setattr(settings, "openrouter_url", "https://openrouter.test/chat")
+    monkeypatch.setattr(settings, "orchestrator_url", "https://orchestrator.test/run")
+    http = open_http(_handler)
+    normaliser = LLMNormalisationAdapter(http)
+    orchestrator = OrchestratorAdapter(http)
+
+    for _ in range(3):
+        assert (await normaliser.normalise({"x": 1}))["target_domain"] == "https://d.test"
+        assert await orchestrator.execute("job-1", {}) == "done"
+
+    assert calls == ["openrouter.test", "orchestrator.test"] * 3
+    assert http.client("openrouter") is http.client("openrouter")
+    assert http.client("openrouter") is not http.client("orchestrator")
+
+    openrouter = http.client("openrouter")
+    await http.aclose()
+    assert openrouter.is_closed
+    with pytest.raises(RuntimeError):
+        http.client("openrouter")
+    http.open()
+    assert http.client("openrouter") is not openrouter
+    await http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_warm_goes_through_the_circuit_breaker(monkeypatch):
+    methods: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if len(methods) == 1:
+            return httpx.Response(405)
+        raise httpx.ConnectError("orchestrator unreachable", request=request)
+
+    monkeypatch.setattr(settings, "orchestrator_url", "https://orchestrator.test/run")
+    monkeypatch.setattr(settings, "circuit_failure_threshold", 1)
+    monkeypatch.setattr(settings, "retry_max_attempts", 1)
+    resilience = ResilienceRegistry()
+    async with HttpClientManager(transport=httpx.MockTransport(_handler)) as http:
+        orchestrator = OrchestratorAdapter(http, resilience)
+
+        await orchestrator.warm()  # 405 on the POST endpoint still means the connection is up
+        with pytest.raises(httpx.ConnectError):
+            await orchestrator.warm()
+        with pytest.raises(CircuitOpenError):
+            await orchestrator.warm()
+
+    assert methods == ["HEAD", "HEAD"]
+    assert resilience.snapshot()["orchestrator"]["rejected"] == 1
+
+
 class _NormaliserOk:
     async def normalise(self, raw_input: dict) -> dict:
         return {"normalised": raw_input}
@@ -47,7 +119,7 @@ class _OrchestratorFails:
 @pytest.mark.asyncio
 async def test_agent_runner_completes_job():
     repo = InMemoryJobRepository()
-    job = repo.create(
+    job = await repo.create(
         input_hash="a" * 64,
         blockchain_identifier="mock_bc_test",
         pay_by_time=9_999_999_999,
@@ -55,7 +127,7 @@ async def test_agent_runner_completes_job():
         submit_result_time=9_999_999_999 + 3600,
         unlock_time=9_999_999_999 + 86_400,
     )
-    repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
 
     await execute_agent_task(
         job.job_id,
@@ -64,7 +136,7 @@ async def test_agent_runner_completes_job():
         _OrchestratorOk(),
         {"x": "y"},
     )
-    completed = repo.get(job.job_id)
+    completed = await repo.get(job.job_id)
     assert completed.status == JobStatus.COMPLETED
     assert completed.result is not None
 
@@ -72,7 +144,7 @@ async def test_agent_runner_completes_job():
 @pytest.mark.asyncio
 async def test_agent_runner_marks_failed_on_exception():
     repo = InMemoryJobRepository()
-    job = repo.create(
+    job = await repo.create(
         input_hash="b" * 64,
         blockchain_identifier="mock_bc_test",
         pay_by_time=9_999_999_999,
@@ -80,7 +152,7 @@ async def test_agent_runner_marks_failed_on_exception():
         submit_result_time=9_999_999_999 + 3600,
         unlock_time=9_999_999_999 + 86_400,
     )
-    repo.update_status(job.job_id, JobStatus.RUNNING)
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
 
     await execute_agent_task(
         job.job_id,
@@ -89,6 +161,76 @@ async def test_agent_runner_marks_failed_on_exception():
         _OrchestratorFails(),
         {"x": "y"},
     )
-    failed = repo.get(job.job_id)
+    failed = await repo.get(job.job_id)
     assert failed.status == JobStatus.FAILED
     assert "orchestrator down" in (failed.error or "")
+
+
+class _NormaliserHangs:
+    def __init__(self):
+        self.calls = 0
+
+    async def normalise(self, raw_input: dict) -> dict:
+        self.calls += 1
+        await asyncio.Event().wait()
+        return raw_input
+
+
+async def _running_job(repo: InMemoryJobRepository, submit_result_time: int):
+    job = await repo.create(
+        input_hash="c" * 64,
+        blockchain_identifier="mock_bc_test",
+        pay_by_time=submit_result_time - 3600,
+        seller_vkey="mock_vkey_test",
+        submit_result_time=submit_result_time,
+        unlock_time=submit_result_time + 86_400,
+    )
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    return job
+
+
+@pytest.mark.asyncio
+async def test_agent_runner_has_no_start_delay_by_default(mock_agent_sleep):
+    repo = InMemoryJobRepository()
+    job = await _running_job(repo, 9_999_999_999)
+    await execute_agent_task(job.job_id, repo, _NormaliserOk(), _OrchestratorOk(), {"x": "y"})
+    mock_agent_sleep.assert_not_awaited()
+    assert (await repo.get(job.job_id)).status == JobStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_agent_runner_rejects_job_past_deadline_without_calling_llm():
+    repo = InMemoryJobRepository()
+    job = await _running_job(repo, int(time.time()) - 1)
+    normaliser = _NormaliserHangs()
+
+    await execute_agent_task(job.job_id, repo, normaliser, _OrchestratorOk(), {"x": "y"})
+
+    failed = await repo.get(job.job_id)
+    assert failed.status == JobStatus.FAILED
+    assert "normalise" in failed.error
+    assert normaliser.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_agent_runner_enforces_stage_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "normalise_timeout_seconds", 0.01)
+    repo = InMemoryJobRepository()
+    job = await _running_job(repo, 9_999_999_999)
+
+    await execute_agent_task(job.job_id, repo, _NormaliserHangs(), _OrchestratorOk(), {"x": "y"})
+
+    failed = await repo.get(job.job_id)
+    assert failed.status == JobStatus.FAILED
+    assert "timed out" in failed.error
+
+
+@pytest.mark.asyncio
+async def test_agent_runner_skips_jobs_no_longer_running():
+    repo = InMemoryJobRepository()
+    job = await _running_job(repo, 9_999_999_999)
+    await repo.update_status(job.job_id, JobStatus.FAILED, error="swept")
+
+    await execute_agent_task(job.job_id, repo, _NormaliserHangs(), _OrchestratorOk(), {"x": "y"})
+
+    assert (await repo.get(job.job_id)).error == "swept"
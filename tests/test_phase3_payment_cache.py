@@ -0,0 +1,172 @@
+import asyncio
+from asyncio import sleep as real_sleep
+import time
+from unittest.mock import AsyncMock, patch
+
+from masumi import Payment
+import pytest
+
+from app.adapters.cached_payment_adapter import CachedPaymentAdapter
+from app.adapters.masumi_payment import MasumiPaymentAdapter, MasumiPaymentClient
+from app.core.metrics import LatencyHistogram
+
+
+class _FakePayment:
+    def __init__(self, paid=False, delay=0.0, error=None):
+        self.paid = paid
+        self.calls = 0
+        self._delay = delay
+        self._error = error
+
+    async def create_payment_request(self, input_hash: str) -> dict:
+        return {"blockchainIdentifier": f"bc_{input_hash}", "payByTime": time.time() + 3600}
+
+    async def verify_payment_status(self, blockchain_identifier: str) -> bool:
+        self.calls += 1
+        if self._delay:
+            await real_sleep(self._delay)
+        if self._error:
+            raise self._error
+        return self.paid
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def _cached(inner, ttl=60.0, max_entries=100, track_pending=False) -> CachedPaymentAdapter:
+    return CachedPaymentAdapter(inner, max_entries=max_entries, unpaid_ttl_seconds=ttl, track_pending=track_pending)
+
+
+@pytest.mark.asyncio
+async def test_confirmed_payments_are_cached_and_unpaid_expire():
+    inner = _FakePayment(paid=False)
+    payment = _cached(inner, ttl=0.02)
+
+    assert await payment.verify_payment_status("bc_1") is False
+    assert await payment.verify_payment_status("bc_1") is False
+    assert inner.calls == 1
+
+    inner.paid = True
+    await real_sleep(0.03)
+    for _ in range(3):
+        assert await payment.verify_payment_status("bc_1") is True
+    assert inner.calls == 2
+    assert payment.stats()["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verifications_share_one_lookup():
+    inner = _FakePayment(paid=True, delay=0.05)
+    payment = _cached(inner)
+
+    outcomes = await asyncio.gather(*(payment.verify_payment_status("bc_2") for _ in range(5)))
+
+    assert outcomes == [True] * 5
+    assert inner.calls == 1
+    assert payment.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_reaches_every_waiter_and_is_not_cached():
+    inner = _FakePayment(delay=0.02, error=RuntimeError("payment service down"))
+    payment = _cached(inner)
+
+    outcomes = await asyncio.gather(
+        *(payment.verify_payment_status("bc_3") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert inner.calls == 1
+    with pytest.raises(RuntimeError):
+        await payment.verify_payment_status("bc_3")
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_prepoll_warms_cache_for_outstanding_requests():
+    inner = _FakePayment(paid=True)
+    payment = _cached(inner, track_pending=True)
+    data = await payment.create_payment_request("abc")
+    assert payment.stats()["awaiting_payment"] == 1
+
+    await payment.prepoll()
+    assert inner.calls == 1
+    assert payment.stats()["awaiting_payment"] == 0
+
+    assert await payment.verify_payment_status(data["blockchainIdentifier"]) is True
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_outstanding_and_unpaid_entries_stay_bounded():
+    inner = _FakePayment(paid=False)
+    untracked = _cached(inner)
+    await untracked.create_payment_request("abc")
+    assert untracked.stats()["awaiting_payment"] == 0
+
+    payment = _cached(inner, ttl=0.02, max_entries=3, track_pending=True)
+    for i in range(5):
+        await payment.create_payment_request(f"job{i}")
+        await payment.verify_payment_status(f"bc_{i}")
+    assert payment.stats()["awaiting_payment"] == 3
+    assert len(payment._unpaid) == 3
+
+    await real_sleep(0.03)
+    await payment.verify_payment_status("bc_new")
+    assert list(payment._unpaid) == ["bc_new"]
+
+    expired = _FakePayment()
+    expired.create_payment_request = AsyncMock(return_value={"blockchainIdentifier": "bc_old", "payByTime": 1})
+    payment = _cached(expired, track_pending=True)
+    await payment.create_payment_request("old")
+    assert payment.stats()["awaiting_payment"] == 0
+
+
+@pytest.mark.asyncio
+async def test_masumi_adapter_resolves_status_method_once_and_reads_onchain_state():
+    adapter = MasumiPaymentAdapter()
+    assert adapter._client._status_method == "check_payment_status_by_identifier"
+
+    responses = [
+        {"status": "success", "data": {"onChainState": "FundsLocked"}},
+        {"status": "success", "data": {"onChainState": None}},
+    ]
+    with patch(
+        "masumi.Payment.check_payment_status_by_identifier",
+        new_callable=AsyncMock,
+        side_effect=responses,
+    ) as lookup:
+        assert await adapter.verify_payment_status("bc_real") is True
+        assert await adapter.verify_payment_status("bc_real") is False
+
+    assert lookup.await_count == 2
+    assert adapter.stats()["latency_seconds"]["check_payment_status"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_draws_unique_purchaser_ids_from_a_refilled_pool(mock_payment_sdk):
+    client = MasumiPaymentClient(identifier_pool_size=4)
+    seen = set()
+    with patch("app.adapters.masumi_payment.Payment", wraps=Payment) as constructed:
+        for _ in range(10):
+            await client.create_payment_request({"input_hash": "h"})
+            seen.add(constructed.call_args.kwargs["identifier_from_purchaser"])
+            await real_sleep(0)
+
+    assert len(seen) == 10
+    assert all(len(identifier) == 26 for identifier in seen)
+    assert client.stats()["identifier_pool"] >= 2
+    assert client.stats()["latency_seconds"]["create_payment_request"]["count"] == 10
+    assert mock_payment_sdk.await_count == 10
+
+
+def test_latency_histogram_is_cumulative():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+    assert snapshot["buckets"] == {"0.1": 1, "1": 3, "+Inf": 4}
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.main import create_app
+from app.services.orchestrator_prewarm import OrchestratorPrewarmer
+
+
+class _Orchestrator:
+    def __init__(self, fail: bool = False):
+        self.warmed = 0
+        self.gate = asyncio.Event()
+        self._fail = fail
+
+    async def warm(self) -> None:
+        self.warmed += 1
+        await self.gate.wait()
+        if self._fail:
+            raise RuntimeError("orchestrator down")
+
+    async def execute(self, job_id: str, normalised_input: dict) -> str:
+        return "done"
+
+
+@pytest.mark.asyncio
+async def test_only_one_prewarm_runs_at_a_time():
+    orchestrator = _Orchestrator()
+    prewarmer = OrchestratorPrewarmer(orchestrator)
+
+    for _ in range(3):
+        prewarmer.start()
+    orchestrator.gate.set()
+    await asyncio.wait_for(prewarmer._warming, timeout=1)
+    prewarmer.start()
+    await asyncio.wait_for(prewarmer._warming, timeout=1)
+
+    assert orchestrator.warmed == 2
+    assert prewarmer.stats() == {"started": 2, "skipped": 2, "failed": 0, "in_flight": False}
+
+
+@pytest.mark.asyncio
+async def test_failed_prewarm_is_counted_not_raised():
+    orchestrator = _Orchestrator(fail=True)
+    orchestrator.gate.set()
+    prewarmer = OrchestratorPrewarmer(orchestrator)
+
+    prewarmer.start()
+    await asyncio.wait_for(prewarmer._warming, timeout=1)
+
+    assert prewarmer.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_start_job_prewarms_when_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "orchestrator_prewarm_enabled", True)
+    app = create_app()
+    headers = {"X-API-Key": settings.api_key}
+    body = {
+        "target_domain": "https://example.com",
+        "my_product_usp": "Fast onboarding",
+        "ideal_customer_profile": "SMB teams",
+    }
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        r = await c.post("/v1/start_job", json=body, headers=headers)
+        assert r.status_code == 201
+        stats = (await c.get("/v1/stats", headers=headers)).json()["prewarm"]
+    assert stats["started"] == 1
+    await app.state.prewarmer.shutdown()
@@ -0,0 +1,82 @@
+import json
+
+import httpx
+import pytest
+
+from app.adapters.llm_normalisation_adapter import LLMNormalisationAdapter
+from app.core.config import settings
+from app.utils.normalisation_prompt import SYSTEM_PROMPT, build_normalisation_prompt, compact_input, count_tokens
+from tests.conftest import open_http
+
+
+VALID = {"target_domain": "https://example.com", "my_product_usp": "USP", "ideal_customer_profile": "ICP"}
+
+
+def test_count_tokens_scales_with_text():
+    assert count_tokens("") == 0
+    assert count_tokens("hello, world") == 5
+    assert count_tokens("x" * 4000) > count_tokens("x" * 400) * 9
+
+
+def test_compaction_truncates_fields_and_drops_extras_over_budget():
+    raw = {
+        "notes": "n" * 5000,
+        "website": "example.com",
+        "my_product_usp": "u" * 2000,
+        "history": [{"event": "e" * 100}] * 50,
+        "x" * 200: "key too long",
+    }
+    compacted, truncated, dropped = compact_input(raw, max_tokens=300)
+
+    assert list(compacted) == ["my_product_usp", "notes", "website"]
+    assert len(compacted["my_product_usp"]) == len(compacted["notes"]) == 500
+    assert truncated == 2
+    assert dropped == 2
+
+
+def test_schema_keys_survive_any_budget():
+    compacted, _, dropped = compact_input({**VALID, "extra": "e"}, max_tokens=1)
+    assert compacted == VALID
+    assert dropped == 1
+
+
+def test_prompt_prefix_is_static_and_marked_cacheable():
+    first = build_normalisation_prompt(VALID, max_tokens=1024, cache_prefix=True)
+    second = build_normalisation_prompt({"website": "other.example"}, max_tokens=1024, cache_prefix=True)
+    assert first.messages[0] == second.messages[0]
+    assert first.messages[0]["content"][0] == {
+        "type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"},
+    }
+    assert json.loads(first.messages[1]["content"]) == VALID
+
+    plain = build_normalisation_prompt(VALID, max_tokens=1024, cache_prefix=False)
+    assert plain.messages[0] == {"role": "system", "content": SYSTEM_PROMPT}
+
+
+@pytest.mark.asyncio
+async def test_adapter_sends_compacted_prompt_and_reports_tokens(monkeypatch):
+    sent: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "choices": [{"message": {"content": json.dumps(VALID)}}],
+            "usage": {"prompt_tokens": 120, "prompt_tokens_details": {"cached_tokens": 80}},
+        })
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "key")
+    monkeypatch.setattr(settings, "openrouter_url", "https://openrouter.test/chat")
+    monkeypatch.setattr(settings, "openrouter_models", "")
+    adapter = LLMNormalisationAdapter(open_http(handler))
+
+    await adapter.normalise({**VALID, "dump": "d " * 20_000})
+
+    user_content = sent[0]["messages"][1]["content"]
+    assert len(user_content) < 2000
+    prompt = adapter.stats()["prompt"]
+    assert prompt["requests"] == 1
+    assert prompt["prompt_tokens_total"] == prompt["prompt_tokens_max"] < 1024 + count_tokens(SYSTEM_PROMPT)
+    assert prompt["saved_tokens_total"] > 10_000
+    assert prompt["truncated_fields"] == 1
+    assert prompt["upstream_prompt_tokens_total"] == 120
+    assert prompt["upstream_cached_tokens_total"] == 80
@@ -0,0 +1,127 @@
+import asyncio
+from asyncio import sleep as real_sleep
+
+import httpx
+import pytest
+
+from app.core.resilience import CircuitBreaker, ResilienceRegistry, Upstream
+from app.domain.exceptions import CircuitOpenError
+
+
+def _upstream(**kwargs) -> Upstream:
+    breaker = CircuitBreaker(
+        "test",
+        failure_threshold=kwargs.pop("failure_threshold", 2),
+        reset_seconds=kwargs.pop("reset_seconds", 60),
+    )
+    options = {
+        "max_attempts": 3,
+        "backoff_base_seconds": 0.0,
+        "backoff_max_seconds": 0.0,
+        "hedge_percentile": 0,
+        "hedge_min_samples": 1,
+    }
+    options.update(kwargs)
+    return Upstream("test", breaker, **options)
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://upstream.test")
+    return httpx.HTTPStatusError("boom", request=request, response=httpx.Response(status_code, request=request))
+
+
+class _Flaky:
+    def __init__(self, *outcomes):
+        self.calls = 0
+        self._outcomes = list(outcomes)
+
+    async def __call__(self):
+        self.calls += 1
+        outcome = self._outcomes.pop(0) if self._outcomes else "ok"
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.mark.asyncio
+async def test_idempotent_calls_retry_upstream_failures():
+    upstream = _upstream(failure_threshold=10)
+    call = _Flaky(_status_error(503), httpx.ReadTimeout("slow"), "ok")
+
+    assert await upstream.call(call, idempotent=True) == "ok"
+    assert call.calls == 3
+    assert upstream.snapshot()["retries"] == 2
+    assert upstream.snapshot()["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_calls_only_retry_unsent_requests():
+    upstream = _upstream(failure_threshold=10)
+    unsent = _Flaky(httpx.ConnectError("refused"), "ok")
+    assert await upstream.call(unsent) == "ok"
+    assert unsent.calls == 2
+
+    sent = _Flaky(_status_error(502))
+    with pytest.raises(httpx.HTTPStatusError):
+        await upstream.call(sent)
+    assert sent.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried_or_counted():
+    upstream = _upstream(failure_threshold=1)
+    call = _Flaky(_status_error(400))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await upstream.call(call, idempotent=True)
+
+    assert call.calls == 1
+    assert upstream.snapshot()["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_then_probes_once():
+    upstream = _upstream(failure_threshold=2, reset_seconds=0.05, max_attempts=1)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await upstream.call(_Flaky(httpx.ConnectError("down")))
+    assert upstream.is_open
+
+    skipped = _Flaky()
+    with pytest.raises(CircuitOpenError):
+        await upstream.call(skipped)
+    assert skipped.calls == 0
+    assert upstream.snapshot()["rejected"] == 1
+
+    await real_sleep(0.06)
+    assert upstream.snapshot()["state"] == "half_open"
+    assert await upstream.call(_Flaky("recovered")) == "recovered"
+    assert upstream.snapshot()["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_idempotent_call_is_hedged():
+    upstream = _upstream(hedge_percentile=50, hedge_min_samples=3)
+    for _ in range(3):
+        await upstream.call(_Flaky("warm"), idempotent=True)
+
+    release_first = asyncio.Event()
+    calls = 0
+
+    async def _call():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release_first.wait()
+            return "primary"
+        return "hedge"
+
+    assert await upstream.call(_call, idempotent=True) == "hedge"
+    assert calls == 2
+    assert upstream.snapshot()["hedges"] == 1
+
+
+def test_registry_shares_one_policy_per_upstream():
+    registry = ResilienceRegistry()
+    assert registry.upstream("openrouter") is registry.upstream("openrouter")
+    assert set(registry.snapshot()) == {"openrouter"}
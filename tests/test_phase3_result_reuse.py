@@ -0,0 +1,124 @@
+import asyncio
+from asyncio import sleep as real_sleep
+
+import pytest
+
+from app.domain.models import JobStatus
+from app.repository.job_repo import InMemoryJobRepository
+from app.services.agent_runner import execute_agent_task
+from app.services.result_reuse import ResultReuse
+
+
+class _Normaliser:
+    async def normalise(self, raw_input: dict) -> dict:
+        return raw_input
+
+
+class _GatedOrchestrator:
+    """Blocks every call until ``release`` is set; optionally fails the first one."""
+
+    def __init__(self, fail_first: bool = False):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self._fail_first = fail_first
+
+    async def execute(self, job_id: str, normalised_input: dict) -> str:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        if self._fail_first and call == 1:
+            raise RuntimeError("orchestrator down")
+        return f"result-of:{job_id}"
+
+
+async def _running_job(repo: InMemoryJobRepository, input_hash: str = "r" * 64) -> str:
+    job = await repo.create(
+        input_hash=input_hash,
+        blockchain_identifier="mock_bc_reuse",
+        pay_by_time=9_999_999_999,
+        seller_vkey="mock_vkey_reuse",
+        submit_result_time=9_999_999_999 + 3600,
+        unlock_time=9_999_999_999 + 86_400,
+    )
+    await repo.update_status(job.job_id, JobStatus.RUNNING)
+    return job.job_id
+
+
+async def _run(repo, orchestrator, results, job_id):
+    await execute_agent_task(job_id, repo, _Normaliser(), orchestrator, {"x": 1}, results=results)
+
+
+@pytest.mark.asyncio
+async def test_fresh_completed_result_is_reused():
+    repo = InMemoryJobRepository()
+    results = ResultReuse(window_seconds=3600)
+    orchestrator = _GatedOrchestrator()
+    orchestrator.release.set()
+
+    first = await _running_job(repo)
+    await _run(repo, orchestrator, results, first)
+    second = await _running_job(repo)
+    await _run(repo, orchestrator, results, second)
+    other = await _running_job(repo, input_hash="o" * 64)
+    await _run(repo, orchestrator, results, other)
+
+    assert orchestrator.calls == 2
+    assert (await repo.get(second)).status == JobStatus.COMPLETED
+    assert (await repo.get(second)).result == f"result-of:{first}"
+    assert (await repo.get(other)).result == f"result-of:{other}"
+    assert results.stats()["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_window_always_runs_pipeline():
+    repo = InMemoryJobRepository()
+    results = ResultReuse(window_seconds=0)
+    orchestrator = _GatedOrchestrator()
+    orchestrator.release.set()
+
+    for _ in range(2):
+        await _run(repo, orchestrator, results, await _running_job(repo))
+
+    assert orchestrator.calls == 2
+    assert results.stats()["reused"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_jobs_share_one_execution():
+    repo = InMemoryJobRepository()
+    results = ResultReuse(window_seconds=3600)
+    orchestrator = _GatedOrchestrator()
+    job_ids = [await _running_job(repo) for _ in range(3)]
+
+    tasks = [asyncio.create_task(_run(repo, orchestrator, results, job_id)) for job_id in job_ids]
+    while results.stats()["inflight"] == 0:
+        await real_sleep(0)
+    orchestrator.release.set()
+    await asyncio.gather(*tasks)
+
+    assert orchestrator.calls == 1
+    for job_id in job_ids:
+        job = await repo.get(job_id)
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == f"result-of:{job_ids[0]}"
+    assert results.stats()["coalesced"] == 2
+    assert results.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_followers_run_themselves_when_leader_fails():
+    repo = InMemoryJobRepository()
+    results = ResultReuse(window_seconds=3600)
+    orchestrator = _GatedOrchestrator(fail_first=True)
+    leader, follower = [await _running_job(repo) for _ in range(2)]
+
+    tasks = [asyncio.create_task(_run(repo, orchestrator, results, job_id)) for job_id in (leader, follower)]
+    while results.stats()["inflight"] == 0:
+        await real_sleep(0)
+    orchestrator.release.set()
+    await asyncio.gather(*tasks)
+
+    assert (await repo.get(leader)).status == JobStatus.FAILED
+    assert (await repo.get(follower)).status == JobStatus.COMPLETED
+    assert (await repo.get(follower)).result == f"result-of:{follower}"
+    assert orchestrator.calls == 2
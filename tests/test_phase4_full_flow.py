@@ -1,9 +1,17 @@
+import asyncio
+import json
+from asyncio import sleep as real_sleep
+from datetime import datetime, timedelta, timezone
+
 import pytest
 import httpx
 
 from app.main import create_app
 from app.core.config import settings
+from app.domain.models import Job, JobStatus
 from app.services.agent_runner import execute_agent_task
+from app.services.job_events import JobEventBus
+from tests.conftest import drain_executor
 
 
 @pytest.fixture
@@ -57,8 +65,7 @@ async def test_get_status_unknown_job(client):
 
 
 # TC-4.3: POST /provide_input with valid signature → job is RUNNING immediately,
-#          then the background task runs (synchronously in ASGI test transport)
-#          and moves it to COMPLETED.
+#          then the executor runs the agent task and moves it to COMPLETED.
 @pytest.mark.asyncio
 async def test_provide_input_valid_signature(client, app):
     async with client as c:
@@ -73,9 +80,9 @@ async def test_provide_input_valid_signature(client, app):
     assert r.status_code == 200
     assert r.json()["status"] == "running"
 
-    # httpx ASGI transport runs BackgroundTasks synchronously after the response.
-    # By the time the `async with` block exits, the background job is COMPLETED.
-    completed_job = app.state.repo.get(job_id)
+    # The agent task runs on the executor's worker pool; drain it before checking.
+    await drain_executor(app.state.executor)
+    completed_job = await app.state.repo.get(job_id)
     assert completed_job.status == "completed"
     assert completed_job.result is not None
 
@@ -130,7 +137,7 @@ async def test_422_response_shape(client):
 
 
 # TC-4.8: Full lifecycle — awaiting_payment → running (HTTP response)
-#          → completed (background task runs synchronously in test transport)
+#          → completed (agent task runs on the executor)
 @pytest.mark.asyncio
 async def test_full_job_lifecycle(client, app):
     async with client as c:
@@ -146,9 +153,9 @@ async def test_full_job_lifecycle(client, app):
         # Immediate HTTP response is RUNNING
         assert r.json()["status"] == "running"
 
-    # After the async-with block exits, background task has already completed
-    # (httpx ASGI transport is synchronous for BackgroundTasks).
-    assert app.state.repo.get(job_id).status == "completed"
+    # Drain the executor's worker pool, then the job must be COMPLETED.
+    await drain_executor(app.state.executor)
+    assert (await app.state.repo.get(job_id)).status == "completed"
 
 
 # TC-8.1: /start_job respects 5/minute rate limit — 6th request gets 429
@@ -176,3 +183,268 @@ async def test_provide_input_requires_payment_confirmation(client, app, monkeypa
             "data": {},
         }, headers=_headers())
     assert r.status_code == 402
+
+
+@pytest.mark.asyncio
+async def test_get_status_etag_not_modified(client):
+    async with client as c:
+        job = await _create_job(c)
+        r1 = await c.get(f"/v1/status/{job['job_id']}", headers=_headers())
+        etag = r1.headers["ETag"]
+        r2 = await c.get(
+            f"/v1/status/{job['job_id']}",
+            headers={**_headers(), "If-None-Match": etag},
+        )
+    assert r1.status_code == 200
+    assert r2.status_code == 304
+    assert r2.headers["ETag"] == etag
+    assert r2.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_status_long_poll_times_out_with_304(client):
+    async with client as c:
+        job = await _create_job(c)
+        etag = (await c.get(f"/v1/status/{job['job_id']}", headers=_headers())).headers["ETag"]
+        r = await c.get(
+            f"/v1/status/{job['job_id']}?wait=0.05",
+            headers={**_headers(), "If-None-Match": etag},
+        )
+    assert r.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_get_status_long_poll_wakes_on_transition(client, app, mock_agent_sleep):
+    # conftest patches asyncio.sleep globally; yielding to the poll needs a real one.
+    mock_agent_sleep.side_effect = real_sleep
+    async with client as c:
+        job = await _create_job(c)
+        etag = (await c.get(f"/v1/status/{job['job_id']}", headers=_headers())).headers["ETag"]
+        poll = asyncio.create_task(c.get(
+            f"/v1/status/{job['job_id']}?wait=5",
+            headers={**_headers(), "If-None-Match": etag},
+        ))
+        while not app.state.events.stats()["subscriptions"]:
+            await asyncio.sleep(0)
+        await app.state.repo.update_status(job["job_id"], JobStatus.RUNNING)
+        r = await asyncio.wait_for(poll, timeout=5)
+
+    assert r.status_code == 200
+    assert r.json()["status"] == "running"
+    assert r.headers["ETag"] != etag
+
+
+def _sse_events(body: str) -> list[tuple[str, str]]:
+    payloads = [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+    return [(p["job_id"], p["status"]) for p in payloads]
+
+
+@pytest.mark.asyncio
+async def test_job_events_stream_closes_after_terminal_state(client, app):
+    async with client as c:
+        job = await _create_job(c)
+        await app.state.repo.update_status(job["job_id"], JobStatus.RUNNING)
+        await app.state.repo.update_status(job["job_id"], JobStatus.COMPLETED, result="ok")
+        r = await c.get(f"/v1/jobs/{job['job_id']}/events", headers=_headers())
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    assert _sse_events(r.text) == [(job["job_id"], "completed")]
+
+
+@pytest.mark.asyncio
+async def test_multi_job_events_stream_pushes_transitions(client, app, mock_agent_sleep):
+    mock_agent_sleep.side_effect = real_sleep
+    async with client as c:
+        first = await _create_job(c)
+        second = await _create_job(c)
+        stream = asyncio.create_task(c.get(
+            f"/v1/jobs/events?job_id={first['job_id']}&job_id={second['job_id']}",
+            headers=_headers(),
+        ))
+        while not app.state.events.stats()["subscriptions"]:
+            await asyncio.sleep(0)
+        for job in (first, second):
+            await app.state.repo.update_status(job["job_id"], JobStatus.RUNNING)
+            await app.state.repo.update_status(job["job_id"], JobStatus.FAILED, error="x")
+        r = await asyncio.wait_for(stream, timeout=5)
+
+    per_job: dict[str, list[str]] = {}
+    for job_id, status in _sse_events(r.text):
+        per_job.setdefault(job_id, []).append(status)
+    # Snapshots a slow reader has not taken yet are coalesced to the latest one.
+    assert per_job[first["job_id"]][0] == "awaiting_payment"
+    assert per_job[first["job_id"]][-1] == "failed"
+    assert per_job[second["job_id"]][-1] == "failed"
+    assert app.state.events.stats()["subscriptions"] == 0
+
+
+def test_event_bus_keeps_latest_snapshot_per_job():
+    bus = JobEventBus()
+    now = datetime.now(timezone.utc)
+
+    def snapshot(job_id: str, status: JobStatus, seconds: int) -> Job:
+        return Job(
+            job_id=job_id,
+            status=status,
+            input_hash="h" * 64,
+            blockchain_identifier="bc",
+            pay_by_time=1,
+            seller_vkey="vkey",
+            submit_result_time=2,
+            unlock_time=3,
+            created_at=now,
+            updated_at=now + timedelta(seconds=seconds),
+        )
+
+    async def drain(subscription) -> list[tuple[str, JobStatus]]:
+        received = []
+        for _ in range(2):
+            job = await asyncio.wait_for(subscription.get(), timeout=1)
+            received.append((job.job_id, job.status))
+        return received
+
+    with bus.subscribe("quiet", "busy") as subscription:
+        bus.publish(snapshot("quiet", JobStatus.FAILED, 1))
+        for i in range(100):
+            bus.publish(snapshot("busy", JobStatus.RUNNING, i))
+        bus.publish(snapshot("busy", JobStatus.COMPLETED, 100))
+        received = asyncio.run(drain(subscription))
+
+    assert received == [("quiet", JobStatus.FAILED), ("busy", JobStatus.COMPLETED)]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_poller_publishes_jobs_changed_elsewhere(client, app, mock_agent_sleep):
+    mock_agent_sleep.side_effect = real_sleep
+    cached = app.state.repo._inner
+    reads = []
+    get_many = cached.get_many
+
+    async def counting_get_many(job_ids):
+        reads.append(list(job_ids))
+        return await get_many(job_ids)
+
+    cached.get_many = counting_get_many
+    async with client as c:
+        first = await _create_job(c)
+        second = await _create_job(c)
+        streams = [
+            asyncio.create_task(c.get(f"/v1/jobs/{first['job_id']}/events", headers=_headers())),
+            asyncio.create_task(c.get(
+                f"/v1/jobs/events?job_id={first['job_id']}&job_id={second['job_id']}",
+                headers=_headers(),
+            )),
+        ]
+        while app.state.events.stats()["subscriptions"] < 3:
+            await asyncio.sleep(0)
+        # Another worker process: these transitions never reach this process's bus.
+        for job in (first, second):
+            await cached._inner.update_status(job["job_id"], JobStatus.RUNNING)
+            await cached._inner.update_status(job["job_id"], JobStatus.COMPLETED, result="ok")
+            cached.invalidate(job["job_id"])
+        poller = asyncio.create_task(app.state.events.run_poller(app.state.repo, 0.01))
+        single, multi = await asyncio.wait_for(asyncio.gather(*streams), timeout=5)
+        poller.cancel()
+
+    assert _sse_events(single.text)[-1] == (first["job_id"], "completed")
+    assert {job_id: status for job_id, status in _sse_events(multi.text)} == {
+        first["job_id"]: "completed",
+        second["job_id"]: "completed",
+    }
+    # One shared read per poll over every watched job, none from the streams themselves.
+    assert reads[0] == sorted([first["job_id"], second["job_id"]])
+    assert len(reads) == app.state.events.stats()["polls"]
+
+
+@pytest.mark.asyncio
+async def test_job_events_stream_sees_jobs_failed_by_sweeper(client, app, mock_agent_sleep):
+    mock_agent_sleep.side_effect = real_sleep
+    qdrant = app.state.repo._inner._inner
+    async with client as c:
+        job = await _create_job(c)
+        await app.state.repo.update_status(job["job_id"], JobStatus.RUNNING)
+        stream = asyncio.create_task(c.get(f"/v1/jobs/{job['job_id']}/events", headers=_headers()))
+        while not app.state.events.stats()["subscriptions"]:
+            await asyncio.sleep(0)
+        stale = (datetime.now(timezone.utc) - timedelta(minutes=61)).isoformat()
+        await qdrant._client.set_payload(
+            collection_name=qdrant._collection_name,
+            payload={"updated_at": stale},
+            points=[job["job_id"]],
+        )
+        assert await app.state.repo.recover_stale_running_jobs(timeout_minutes=30) == 1
+        r = await asyncio.wait_for(stream, timeout=5)
+
+    assert _sse_events(r.text)[-1] == (job["job_id"], "failed")
+
+
+@pytest.mark.asyncio
+async def test_job_events_unknown_job_returns_404(client):
+    async with client as c:
+        r = await c.get("/v1/jobs/ghost-job-id/events", headers=_headers())
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_provide_input_returns_503_when_executor_saturated(client, app):
+    app.state.executor._max_queue = 0
+    async with client as c:
+        job = await _create_job(c)
+        r = await c.post("/v1/provide_input", json={
+            "job_id": job["job_id"],
+            "signature": f"valid_sig_{job['job_id']}",
+            "data": {},
+        }, headers=_headers())
+        status = await c.get(f"/v1/status/{job['job_id']}", headers=_headers())
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == str(settings.executor_retry_after_seconds)
+    assert status.json()["status"] == "awaiting_payment"
+
+
+@pytest.mark.asyncio
+async def test_status_batch_reports_missing_ids_inline(client, app):
+    async with client as c:
+        first = await _create_job(c)
+        second = await _create_job(c)
+        r = await c.post(
+            "/v1/status:batch",
+            json={"job_ids": [first["job_id"], "nonexistent-000", second["job_id"], first["job_id"]]},
+            headers=_headers(),
+        )
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["found"] == 2
+    assert body["missing"] == 1
+    assert [item["job_id"] for item in body["results"]] == [first["job_id"], "nonexistent-000", second["job_id"]]
+    assert body["results"][0]["job"]["blockchainIdentifier"] == first["blockchainIdentifier"]
+    assert body["results"][1]["job"] is None
+    assert "not found" in body["results"][1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_status_batch_rejects_oversized_request(client):
+    async with client as c:
+        r = await c.post("/v1/status:batch", json={"job_ids": [f"id-{i}" for i in range(501)]}, headers=_headers())
+    assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_paginates_with_cursor_and_filters(client, app):
+    # The jobs collection is shared across tests, so scope the listing to this test's window.
+    since = datetime.now(timezone.utc).isoformat()
+    async with client as c:
+        created = [(await _create_job(c))["job_id"] for _ in range(3)]
+        params = {"limit": 2, "status": "awaiting_payment", "created_after": since}
+        first = await c.get("/v1/jobs", params=params, headers=_headers())
+        second = await c.get("/v1/jobs", params={**params, "cursor": first.json()["next_cursor"]}, headers=_headers())
+        running = await c.get("/v1/jobs", params={"status": "running", "created_after": since}, headers=_headers())
+        bad_cursor = await c.get("/v1/jobs", params={"cursor": "not-a-cursor"}, headers=_headers())
+
+    assert first.status_code == 200
+    assert len(first.json()["jobs"]) == 2
+    assert second.json()["next_cursor"] is None
+    listed = [job["job_id"] for job in first.json()["jobs"] + second.json()["jobs"]]
+    assert listed == sorted(created)
+    assert running.json() == {"jobs": [], "next_cursor": None}
+    assert bad_cursor.status_code == 400
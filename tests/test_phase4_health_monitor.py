@@ -0,0 +1,69 @@
+import asyncio
+from asyncio import sleep as real_sleep
+import time
+
+import pytest
+
+from app.services.health_monitor import HealthMonitor
+
+
+class _Probe:
+    def __init__(self, result=True, delay=0.0):
+        self.calls = 0
+        self._result = result
+        self._delay = delay
+
+    async def __call__(self) -> bool:
+        self.calls += 1
+        if self._delay:
+            await real_sleep(self._delay)
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_and_failures_are_contained():
+    probes = {
+        "slow_a": _Probe(delay=0.1),
+        "slow_b": _Probe(delay=0.1),
+        "hung": _Probe(delay=5),
+        "broken": _Probe(result=RuntimeError("boom")),
+    }
+    monitor = HealthMonitor(probes, timeout_seconds=0.2, max_age_seconds=60)
+
+    started = time.monotonic()
+    checks, checked_at = await monitor.results()
+
+    assert time.monotonic() - started < 1
+    assert checks == {"slow_a": True, "slow_b": True, "hung": False, "broken": False}
+    assert checked_at is not None
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_until_stale_or_fresh_requested():
+    probe = _Probe()
+    monitor = HealthMonitor({"dep": probe}, timeout_seconds=1, max_age_seconds=60)
+
+    for _ in range(5):
+        await monitor.results()
+    assert probe.calls == 1
+
+    await monitor.results(fresh=True)
+    assert probe.calls == 2
+
+    expiring = HealthMonitor({"dep": probe}, timeout_seconds=1, max_age_seconds=0)
+    await expiring.results()
+    await real_sleep(0.01)
+    await expiring.results()
+    assert probe.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_probe_round():
+    probe = _Probe(delay=0.05)
+    monitor = HealthMonitor({"dep": probe}, timeout_seconds=1, max_age_seconds=60)
+
+    await asyncio.gather(*(monitor.results(fresh=True) for _ in range(10)))
+
+    assert probe.calls == 1
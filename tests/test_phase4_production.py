@@ -76,3 +76,71 @@ async def test_availability_degraded_details(client, app, monkeypatch):
     body = r.json()
     assert body["status"] == "degraded"
     assert body["details"]["openrouter"] is False
+
+
+@pytest.mark.asyncio
+async def test_stats_reports_job_cache_counters(client):
+    async with client as c:
+        r = await c.post("/v1/start_job", json=_start_payload(), headers=_headers())
+        await c.get(f"/v1/status/{r.json()['job_id']}", headers=_headers())
+        stats = await c.get("/v1/stats", headers=_headers())
+
+    assert stats.status_code == 200
+    cache = stats.json()["job_cache"]
+    assert cache["hits"] == 1
+    assert cache["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_availability_reports_open_circuits(client, app):
+    upstream = app.state.resilience.upstream("orchestrator")
+    for _ in range(5):
+        upstream._breaker.record_failure()
+
+    async with client as c:
+        r = await c.get("/v1/availability")
+
+    body = r.json()
+    assert body["status"] == "degraded"
+    assert body["circuits"]["orchestrator"]["state"] == "open"
+    assert body["circuits"]["openrouter"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_availability_serves_cached_probes_unless_fresh(client, app, monkeypatch):
+    calls = 0
+
+    async def _counting() -> bool:
+        nonlocal calls
+        calls += 1
+        return True
+
+    monkeypatch.setattr(app.state.payment, "health_check", _counting)
+    async with client as c:
+        first = await c.get("/v1/availability")
+        await c.get("/v1/availability")
+        assert calls == 1
+        await c.get("/v1/availability?fresh=1", headers=_headers())
+        assert calls == 2
+
+    assert first.json()["status"] == "available"
+    assert "checked_at" in first.json()
+
+
+@pytest.mark.asyncio
+async def test_availability_ignores_fresh_for_anonymous_callers(client, app, monkeypatch):
+    calls = 0
+
+    async def _counting() -> bool:
+        nonlocal calls
+        calls += 1
+        return True
+
+    monkeypatch.setattr(app.state.payment, "health_check", _counting)
+    async with client as c:
+        await c.get("/v1/availability")
+        await c.get("/v1/availability?fresh=1")
+        await c.get("/v1/availability?fresh=1", headers={"X-API-Key": "wrong"})
+        assert calls == 1
+        await c.get("/v1/availability?fresh=1", headers=_headers())
+        assert calls == 2